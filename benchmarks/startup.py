@@ -0,0 +1,155 @@
+"""
+Headless startup benchmark.
+
+Starts Yarn N times with the offscreen Qt platform, lets it quit right after
+the first paint (YARN_EXIT_AFTER_STARTUP) and collects the startup timeline
+of every run (services/startup.py) plus the wall time of the whole process.
+
+- cold: fresh bytecode cache (PYTHONPYCACHEPREFIX) and no bootstrap snapshot
+- warm: shared bytecode cache and snapshot, primed by one discarded run
+
+Every mode runs in its own temporary copy of the project (with the current
+config and settings database), so the benchmark never deletes or rewrites
+the caches, snapshot or settings of the working tree.
+
+Usage:
+    python benchmarks/startup.py --runs 10 --mode both [--json results.json]
+
+The license must already be accepted (config "termsAccepted"), otherwise
+the terms dialog would block the run.
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Relative to the project root (the copy the runs start from)
+MAIN = os.path.join("src", "main.py")
+SNAPSHOT = os.path.join("cache", "bootstrap.json")
+COPY_IGNORE = shutil.ignore_patterns(".git", "cache", "metrics", "__pycache__", "*.log", "benchmarks")
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def copy_project(workdir, mode):
+    """Copy of the project root the runs of mode start from"""
+    root = os.path.join(workdir, f"project_{mode}")
+    shutil.copytree(ROOT, root, ignore=COPY_IGNORE)
+    return root
+
+
+def run_once(root, workdir, index, pycache_prefix, timeout):
+    report_path = os.path.join(workdir, f"report_{index}.json")
+    env = dict(os.environ)
+    env.update({
+        "QT_QPA_PLATFORM": "offscreen",
+        "YARN_EXIT_AFTER_STARTUP": "1",
+        "YARN_STARTUP_REPORT": report_path,
+        "PYTHONPYCACHEPREFIX": pycache_prefix,
+    })
+    env.pop("YARN_TRACE", None)
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, os.path.join(root, MAIN)], cwd=root, env=env, timeout=timeout,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    process_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0 or not os.path.exists(report_path):
+        raise RuntimeError(f"run {index} failed (exit code {result.returncode}):\n{result.stderr[-2000:]}")
+
+    with open(report_path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    report["process_ms"] = process_ms
+    return report
+
+
+def run_series(mode, runs, workdir, timeout):
+    reports = []
+    root = copy_project(workdir, mode)
+    snapshot = os.path.join(root, SNAPSHOT)
+    shared_prefix = os.path.join(workdir, "pycache_warm")
+    if mode == "warm":
+        # Prime bytecode cache and bootstrap snapshot
+        run_once(root, workdir, f"{mode}_prime", shared_prefix, timeout)
+
+    for index in range(runs):
+        if mode == "cold":
+            prefix = os.path.join(workdir, f"pycache_cold_{index}")
+            if os.path.exists(snapshot):
+                os.remove(snapshot)
+        else:
+            prefix = shared_prefix
+        reports.append(run_once(root, workdir, f"{mode}_{index}", prefix, timeout))
+        print(f"  {mode} run {index + 1}/{runs}: {reports[-1]['process_ms']:.0f} ms", file=sys.stderr)
+    return reports
+
+
+def summarize(reports):
+    """{metric: {p50, p90, p99, min, max}} for process time, totals and every phase."""
+    series = {
+        "process wall": [r["process_ms"] for r in reports],
+        "startup wall": [r["total_wall_ms"] for r in reports],
+        "startup cpu": [r["total_cpu_ms"] for r in reports],
+    }
+    for report in reports:
+        for phase in report["phases"]:
+            series.setdefault(f"{phase['name']} wall", []).append(phase["wall_ms"])
+            series.setdefault(f"{phase['name']} cpu", []).append(phase["cpu_ms"])
+
+    return {
+        name: {
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p99": percentile(values, 99),
+            "min": min(values),
+            "max": max(values),
+        }
+        for name, values in series.items()
+    }
+
+
+def print_summary(mode, summary, runs):
+    print(f"\n{mode} start, {runs} runs (ms)")
+    print(f"{'metric':<40} {'p50':>9} {'p90':>9} {'p99':>9} {'min':>9} {'max':>9}")
+    for name, stats in summary.items():
+        print(f"{name:<40} " + " ".join(f"{stats[key]:9.1f}" for key in ("p50", "p90", "p99", "min", "max")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yarn headless cold/warm startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="runs per mode")
+    parser.add_argument("--mode", choices=("cold", "warm", "both"), default="both")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds per run")
+    parser.add_argument("--json", help="write raw reports and summaries to this file")
+    args = parser.parse_args()
+
+    modes = ("cold", "warm") if args.mode == "both" else (args.mode,)
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="yarn_startup_")
+    try:
+        for mode in modes:
+            reports = run_series(mode, args.runs, workdir, args.timeout)
+            summary = summarize(reports)
+            print_summary(mode, summary, args.runs)
+            results[mode] = {"summary": summary, "reports": reports}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ from PySide6.QtCore import Signal
 
 from widgets.window_resize import ResizeHandler, toggle_maximize
 import utils.helpers as helpers
+import utils.theme_engine as theme_engine
+import utils.localization as localization
+import utils.session as session
 from widgets.header import header
 from widgets.tabs import tabs
 from widgets.extra_panels.extra_panels_manager import ExtraPanel
@@ -25,7 +28,7 @@ import widgets.text_editor as te
 import manifests.platform_manifests as manifests
 from utils.aside_manager import show_aside
 import utils.aside_manager as am
-import services.logger as log
+import services.startup as startup
 
 
 class MainWindow(QMainWindow):
@@ -37,8 +40,8 @@ class MainWindow(QMainWindow):
         resize_handler (ResizeHandler): Manages frameless window resizing
         base_path (str): Root directory of the project
         current_lang (str): Currently selected language code
-        lang_data (dict): Loaded language strings
-        theme_default (dict): Current color theme configuration
+        lang_data (Catalog): Compiled language strings (updated in place on a live language switch)
+        theme_default (dict): Current color theme (updated in place on a live theme switch)
     """
     
     metrics_updated = Signal(dict)
@@ -52,13 +55,15 @@ class MainWindow(QMainWindow):
         2. Theme and language configuration
         3. UI widget assembly
         4. Signal connections
+        5. Session restore (active tab only)
         """
         super().__init__()
         self.resize_handler = ResizeHandler(self)
         self.base_path = helpers.get_project_root()
         
         # Platform-specific initialization
-        manifests.set_platform_manifest(self.base_path)
+        with startup.phase("set_platform_manifest"):
+            manifests.set_platform_manifest(self.base_path)
         
         # Window icon and styling
         icon_path = os.path.join(
@@ -69,40 +74,46 @@ class MainWindow(QMainWindow):
         
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
         
-        # Language configuration
-        self.current_lang = helpers.get_json_property(
-            os.path.join(helpers.get_project_root(), 'config', 'config.json'), 
-            "lang"
-        )
-        log.info(msg=f'Selected language: "{self.current_lang}"')
-        self.lang_data = helpers.get_json_property(
-            os.path.join(self.base_path, "resources", "language", 
-                        f'{self.current_lang}.json')
+        # Main configuration (read once, served from the config cache)
+        self.config_path = os.path.join(
+            helpers.get_project_root(), 'config', 'config.json'
         )
+        self.config_data = helpers.get_json_property(self.config_path) or {}
+        
+        # Language configuration (compiled catalog, switched live on "lang" change)
+        self.current_lang = self.config_data.get("lang")
+        with startup.phase("localization"):
+            self.localization = localization.get_localization()
+            self.lang_data = self.localization.load(self.current_lang)
+            self.localization.watch_config()
         
         # Window geometry and theme
         self.setup_main_app()
-        self.config_path = os.path.join(
-            helpers.get_project_root(), 'config', 'config.json'
-        )
         self.themes_path = os.path.join(
             helpers.get_project_root(), 'resources', 'themes'
         )
-        self.theme_default = helpers.load_theme()
+        # One application stylesheet for every widget (compiled once, disk cached)
+        with startup.phase("theme_engine"):
+            self.theme_engine = theme_engine.get_engine()
+            self.theme_default = self.theme_engine.load()
+            self.theme_engine.apply()
+            self.theme_engine.watch_config()
         
         # Build UI components
-        self.create_widgets()
+        with startup.phase("create_widgets"):
+            self.create_widgets()
         
         # Restore panel states from config
-        if helpers.get_json_property(
-            os.path.join(helpers.get_project_root(), "config", 
-                        "btn_settings_config.json"), 
-            'aside_is_open'
-        ):
+        if am.get_state().aside_is_open:
             show_aside()
         
         # Establish signal connections
         self.setup_signals()
+        
+        # Only the active tab's document is loaded; other tabs stay placeholders
+        with startup.phase("restore_session"):
+            self.session = session.Session(self.tabs.model, self.text_editor, self.config_path, self)
+            self.session.restore()
     
     def setup_signals(self):
         """
@@ -110,9 +121,11 @@ class MainWindow(QMainWindow):
         
         Routes:
             metrics_updated → ExtraPanel.metrics_updated
+            tabs.file_requested → textEditor.load_file
         """
         if hasattr(self, 'extra_panel'):
             self.metrics_updated.connect(self.extra_panel.metrics_updated)
+        self.tabs.file_requested.connect(self.text_editor.load_file)
     
     def update_metrics(self, metrics):
         """
@@ -7,8 +7,11 @@ Handles:
 - License agreement verification
 - Main window creation
 - System metrics collection service management
+- Periodic function timings summary
+- Startup phase timeline
 """
 
+import services.startup as startup
 import sys
 import os
 from utils.terms_manager import TermsManager
@@ -17,7 +20,15 @@ from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 import services.logger as log
 import utils.helpers as helpers
-from services.metrics_collector import MetricsCollector
+from services.metrics_collector import MetricsCollector, EventLoopLagMonitor
+from services.metrics_exporter import create_exporter
+import services.timings as timings
+import services.tracing as tracing
+from utils.config_store import store
+from utils.dir_cache import cache as dir_cache
+import utils.bootstrap as bootstrap
+
+startup.mark("modules imported")
 
 
 class Yarn:
@@ -45,12 +56,24 @@ class Yarn:
             helpers.get_project_root(), 
             "resources", "icons", "ico", "Yarn-256.ico"
         )
-        self.app = QApplication(sys.argv)
+        with startup.phase("QApplication"):
+            self.app = QApplication(sys.argv)
         
         if os.path.exists(self.icon_path):
             self.app.setWindowIcon(QIcon(self.icon_path))
+
+        # Directory listings: invalidated by the watcher, warmed off the UI thread
+        dir_cache.enable_watcher()
+        dir_cache.prefetch(
+            os.path.join(helpers.get_project_root(), "resources", "themes")
+        )
             
-        self.terms_manager = TermsManager()
+        # Themes, languages and fonts in one read
+        with startup.phase("bootstrap snapshot"):
+            bootstrap.load(helpers.get_project_root())
+
+        with startup.phase("TermsManager"):
+            self.terms_manager = TermsManager()
         # Schedule terms check to run after event loop starts
         QTimer.singleShot(0, self.check_terms)
     
@@ -65,7 +88,9 @@ class Yarn:
         If terms are accepted:
         - Proceeds to launch main window
         """
-        if not self.terms_manager.search_termsAccepted():
+        with startup.phase("terms check"):
+            accepted = self.terms_manager.search_termsAccepted()
+        if not accepted:
             self.app.quit()
             return
         
@@ -80,14 +105,30 @@ class Yarn:
         2. Start metrics collection service
         3. Connect cleanup signals
         """
-        from app.main_window import MainWindow
+        with startup.phase("import MainWindow"):
+            from app.main_window import MainWindow
         
-        self.main_window = MainWindow()
-        self.main_window.show()
+        with startup.phase("MainWindow"):
+            self.main_window = MainWindow()
+        with startup.phase("MainWindow.show"):
+            self.main_window.show()
+        startup.watch_first_paint(self.main_window, self.on_startup_finished)
         
         self.start_metrics_collection()
+        self.start_timings_summary()
         # Ensure metrics are stopped when application quits
         self.app.aboutToQuit.connect(self.stop_metrics_collection)
+        self.app.aboutToQuit.connect(self.main_window.text_editor.stop_loading)
+        self.app.aboutToQuit.connect(timings.dump_to_log)
+        self.app.aboutToQuit.connect(self.export_trace)
+        self.app.aboutToQuit.connect(store.flush)
+        self.app.aboutToQuit.connect(store.log_stats)
+    
+    def on_startup_finished(self):
+        """Write the startup timeline after the first paint of the main window."""
+        startup.finish(helpers.get_project_root())
+        if startup.exit_after_startup():
+            self.app.quit()
     
     def run(self):
         """
@@ -116,10 +157,47 @@ class Yarn:
         The service runs in a separate thread and emits
         metrics_updated signals with system resource usage data.
         """
+        self.event_loop_monitor = EventLoopLagMonitor(interval=100)
+        self.event_loop_monitor.start()
+        
         self.metrics_collector = MetricsCollector(update_interval=1000)
         self.metrics_collector.metrics_updated.connect(self.on_metrics_updated)
         self.metrics_collector.start()
         log.info(msg="Metrics collection started")
+        
+        # Optional file export (Prometheus textfile / CSV), see config.json
+        self.metrics_exporter = create_exporter(
+            helpers.get_json_property(
+                os.path.join(helpers.get_project_root(), "config", "config.json"),
+                "metrics_export"
+            ),
+            helpers.get_project_root()
+        )
+        if self.metrics_exporter:
+            self.metrics_exporter.start()
+            log.info(msg="Metrics export started")
+    
+    def start_timings_summary(self, interval=60000):
+        """
+        Periodically write aggregated function timings to the log.
+        
+        Replaces per-call PERF lines of the @log decorator with one
+        summary table every "interval" milliseconds.
+        """
+        self.timings_timer = QTimer()
+        self.timings_timer.timeout.connect(timings.dump_to_log)
+        self.timings_timer.start(interval)
+    
+    def export_trace(self):
+        """Write recorded spans as Chrome trace JSON (only when YARN_TRACE is set)."""
+        if not tracing.is_enabled():
+            return
+        try:
+            path = tracing.export_chrome_trace()
+            if path:
+                log.info(msg=f'Trace written to "{path}"')
+        except OSError as e:
+            log.error(msg=f"Failed to write trace: {e}")
     
     def on_metrics_updated(self, metrics):
         """
@@ -128,9 +206,15 @@ class Yarn:
         Args:
             metrics (dict): Dictionary containing CPU, memory, and system metrics
             
-        Forwards metrics to main window if it's ready to receive them.
+        Adds the UI event loop lag, queues the sample for export and
+        forwards metrics to main window if it's ready to receive them.
         Otherwise, metrics are dropped (window may be initializing or closing).
         """
+        if getattr(self, 'event_loop_monitor', None):
+            metrics['event_loop_lag_ms'] = self.event_loop_monitor.take_max_lag()
+        if getattr(self, 'metrics_exporter', None):
+            self.metrics_exporter.submit(metrics)
+        
         if self.main_window and hasattr(self.main_window, 'update_metrics'):
             self.main_window.update_metrics(metrics)
         # Metrics are intentionally not logged here to avoid console spam
@@ -150,6 +234,16 @@ class Yarn:
             self.metrics_collector.wait()
             self.metrics_collector = None
             log.info(msg="Metrics collection stopped")
+        
+        if getattr(self, 'event_loop_monitor', None):
+            self.event_loop_monitor.stop()
+        
+        if getattr(self, 'metrics_exporter', None):
+            # Flushes queued samples before the thread exits
+            self.metrics_exporter.stop()
+            self.metrics_exporter.wait()
+            self.metrics_exporter = None
+            log.info(msg="Metrics export stopped")
 
 
 if __name__ == "__main__":
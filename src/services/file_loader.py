@@ -0,0 +1,128 @@
+"""
+Background file loading for the editor.
+
+FileLoader reads a file on its own thread in chunks and streams the decoded
+text to the UI thread:
+- the encoding is detected from a leading sample (BOM, then strict UTF-8,
+  then FALLBACK_ENCODINGS); files with NUL bytes and no UTF-16/32 BOM are
+  rejected as binary
+- the first chunk is small, so the first screen is shown at once
+- at most MAX_PENDING_CHUNKS chunks wait in the event queue: the receiver
+  calls chunk_consumed() after inserting one, so a slow UI never piles up
+  the whole file in memory
+- requestInterruption() cancels the load between two chunks
+
+Line endings are normalized to "\\n" (universal newlines).
+"""
+
+import codecs
+import io
+import os
+import threading
+import time
+from PySide6.QtCore import QThread, Signal
+import services.logger as log
+
+SAMPLE_SIZE = 64 * 1024
+FIRST_CHUNK_CHARS = 64 * 1024
+CHUNK_CHARS = 1024 * 1024
+MAX_PENDING_CHUNKS = 4
+FALLBACK_ENCODINGS = ("cp1251", "latin-1")
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class BinaryFileError(ValueError):
+    pass
+
+
+def detect_encoding(sample):
+    """Encoding of a file from its first bytes; BinaryFileError for binary data"""
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if b"\x00" in sample:
+        raise BinaryFileError("binary file")
+    for encoding in ("utf-8",) + FALLBACK_ENCODINGS:
+        try:
+            # Not final: the sample may end inside a multibyte character
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return FALLBACK_ENCODINGS[-1]
+
+
+class FileLoader(QThread):
+    """
+    Reads one file in chunks off the UI thread.
+
+    Emits (load_id tells the chunks of a restarted load apart):
+        load_started(int, str, int): load id, encoding, file size in bytes
+        chunk_loaded(int, str): load id, decoded text
+        progress(int, int, int): load id, bytes read, file size
+        load_finished(int): load id; the whole file was delivered
+        load_failed(int, str): load id, error message
+    """
+    load_started = Signal(int, str, int)
+    chunk_loaded = Signal(int, str)
+    progress = Signal(int, int, int)
+    load_finished = Signal(int)
+    load_failed = Signal(int, str)
+
+    def __init__(self, path, load_id, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.load_id = load_id
+        self._credits = threading.Semaphore(MAX_PENDING_CHUNKS)
+
+    def chunk_consumed(self):
+        """Called by the receiver once a chunk has been inserted"""
+        self._credits.release()
+
+    def _wait_for_credit(self):
+        while not self._credits.acquire(timeout=0.1):
+            if self.isInterruptionRequested():
+                return False
+        return not self.isInterruptionRequested()
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            size = os.path.getsize(self.path)
+            raw = open(self.path, "rb")
+            try:
+                encoding = detect_encoding(raw.read(SAMPLE_SIZE))
+                raw.seek(0)
+            except BaseException:
+                raw.close()
+                raise
+            self.load_started.emit(self.load_id, encoding, size)
+
+            # Closes raw as well
+            with io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline=None) as text:
+                chunk_chars = FIRST_CHUNK_CHARS
+                while True:
+                    if not self._wait_for_credit():
+                        log.debug(msg=f'Loading of "{self.path}" cancelled')
+                        return
+                    chunk = text.read(chunk_chars)
+                    if not chunk:
+                        break
+                    self.chunk_loaded.emit(self.load_id, chunk)
+                    self.progress.emit(self.load_id, min(raw.tell(), size), size)
+                    chunk_chars = CHUNK_CHARS
+        except (OSError, ValueError) as e:
+            log.error(msg=f'Cannot read "{self.path}": {e}')
+            self.load_failed.emit(self.load_id, str(e))
+            return
+
+        self.load_finished.emit(self.load_id)
+        log.debug(msg=f'Loaded "{self.path}" ({size} bytes, {encoding}) in '
+                      f'{(time.perf_counter() - start) * 1000:.1f} ms')
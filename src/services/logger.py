@@ -4,6 +4,7 @@ import functools
 import os
 import sys
 import inspect
+import services.timings as timings
 
 def get_project_root():
     """Returns the project root folder"""
@@ -49,15 +50,20 @@ def get_logs():
 
 def log(msg=None, mode="debug", call_level=3):  # debug, info, error
     def decorator(func):
+        timing_name = f"{func.__module__}.{func.__qualname__}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if mode == "debug":
-                # DEBUG: time_measurement
-                start = time.time()
-                result = func(*args, **kwargs)
-                duration = (time.time() - start) * 1000
-                message = msg or f"PERF: {func.__name__} took {duration:.2f}ms"
-                debug(message)
+                # DEBUG: time_measurement, aggregated in services.timings
+                start = time.perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    timings.record(timing_name, time.perf_counter_ns() - start)
+                # Only the caller's message is logged; durations go to the timings summary
+                if msg:
+                    debug(msg)
                 return result
                 
             elif mode == "info":
@@ -0,0 +1,144 @@
+"""
+On-demand memory inspection.
+
+Wraps tracemalloc for use in a running session:
+- tracing is started only when requested (no overhead otherwise)
+- snapshots and diffs are computed on a worker thread
+- live Qt widgets are counted by class to catch leaked buttons/tabs
+"""
+
+import linecache
+import tracemalloc
+from collections import Counter
+from PySide6.QtCore import QThread, Signal
+from PySide6.QtWidgets import QApplication
+import services.logger as log
+
+# Frames stored per allocation when grouping by traceback
+TRACEBACK_FRAMES = 10
+
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    linecache.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def start_tracing(nframes=TRACEBACK_FRAMES):
+    """Start tracemalloc (no-op if already running)."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(nframes)
+        log.info(msg=f"tracemalloc started ({nframes} frames)")
+
+
+def stop_tracing():
+    """Stop tracemalloc and free its traces."""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+        log.info(msg="tracemalloc stopped")
+
+
+def is_tracing():
+    return tracemalloc.is_tracing()
+
+
+def take_snapshot():
+    """Returns filtered tracemalloc snapshot (tracing must be running)."""
+    snapshot = tracemalloc.take_snapshot()
+    return snapshot.filter_traces(
+        [tracemalloc.Filter(False, name) for name in _IGNORED_FILES]
+    )
+
+
+def top_allocators(snapshot, key_type="lineno", limit=20):
+    """Returns list of (location, size_bytes, count) for the biggest allocators."""
+    stats = snapshot.statistics(key_type)[:limit]
+    return [(_format_trace(stat.traceback, key_type), stat.size, stat.count) for stat in stats]
+
+
+def diff_snapshots(old, new, key_type="lineno", limit=20):
+    """Returns list of (location, size_diff, size, count_diff) sorted by growth."""
+    stats = new.compare_to(old, key_type)[:limit]
+    return [
+        (_format_trace(stat.traceback, key_type), stat.size_diff, stat.size, stat.count_diff)
+        for stat in stats
+    ]
+
+
+def _format_trace(traceback, key_type):
+    if key_type == "traceback":
+        return "\n    ".join(
+            f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback)
+        )
+    frame = traceback[0]
+    if key_type == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def count_widgets(limit=None):
+    """
+    Counts live QWidget instances by class name.
+
+    Must be called from the UI thread.
+    """
+    app = QApplication.instance()
+    if app is None:
+        return []
+    counts = Counter(type(widget).__name__ for widget in app.allWidgets())
+    return counts.most_common(limit)
+
+
+def format_size(size):
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
+
+
+class SnapshotWorker(QThread):
+    """
+    Takes a snapshot and builds a text report off the UI thread.
+
+    Emits:
+        report_ready(str, object): report text and the new snapshot
+    """
+    report_ready = Signal(str, object)
+
+    def __init__(self, previous=None, key_type="lineno", limit=20):
+        super().__init__()
+        self.previous = previous
+        self.key_type = key_type
+        self.limit = limit
+
+    def run(self):
+        try:
+            snapshot = take_snapshot()
+            lines = []
+            if self.previous is not None:
+                lines.append(f"Diff vs previous snapshot (by {self.key_type}):")
+                for location, size_diff, size, count_diff in diff_snapshots(
+                        self.previous, snapshot, self.key_type, self.limit):
+                    lines.append(
+                        f"{format_size(size_diff):>12} {count_diff:+8} blocks "
+                        f"(total {format_size(size)})  {location}"
+                    )
+                lines.append("")
+
+            traced, peak = tracemalloc.get_traced_memory()
+            lines.append(
+                f"Top allocators (by {self.key_type}), traced {format_size(traced)}, "
+                f"peak {format_size(peak)}:"
+            )
+            for location, size, count in top_allocators(snapshot, self.key_type, self.limit):
+                lines.append(f"{format_size(size):>12} {count:8} blocks  {location}")
+
+            self.report_ready.emit("\n".join(lines), snapshot)
+        except Exception as e:
+            log.error(msg=f"Memory snapshot failed: {e}")
+            self.report_ready.emit(f"Snapshot failed: {e}", None)
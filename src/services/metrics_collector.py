@@ -1,27 +1,62 @@
 import psutil
 import os
+import time
+import threading
 from collections import deque
-from PySide6.QtCore import QThread, Signal, QTimer
+from PySide6.QtCore import QThread, Signal, QTimer, QObject
+
+# Имена потоков по native id, которые не видны через threading (QThread и т.п.)
+_thread_names = {}
+
+
+def name_current_thread(name):
+    """Регистрирует имя текущего потока для разбивки CPU по потокам."""
+    _thread_names[_native_thread_id()] = name
+
+
+def _native_thread_id():
+    if hasattr(threading, "get_native_id"):
+        return threading.get_native_id()
+    return threading.get_ident()
+
+
+def get_thread_names():
+    """Возвращает {native_id: имя} для Python-потоков и зарегистрированных потоков."""
+    names = {}
+    for thread in threading.enumerate():
+        native_id = getattr(thread, "native_id", None)
+        if native_id is not None:
+            names[native_id] = thread.name
+    names.update(_thread_names)
+    # Главный поток процесса имеет native id == pid (Linux)
+    names.setdefault(os.getpid(), "MainThread")
+    return names
+
 
 class MetricsCollector(QThread):
     """Потоковый сборщик метрик системы для текущего процесса."""
     metrics_updated = Signal(dict)  # Сигнал с новыми данными
     
-    def __init__(self, update_interval=1000):
+    def __init__(self, update_interval=1000, history_length=60):
         super().__init__()
         self.update_interval = update_interval
         self.process = psutil.Process(os.getpid())
         self._stop_flag = False
         
         # История для графиков
-        self.cpu_history = deque(maxlen=60)
-        self.memory_history = deque(maxlen=60)
+        self.cpu_history = deque(maxlen=history_length)
+        self.memory_history = deque(maxlen=history_length)
+        
+        # Предыдущие CPU-времена потоков для расчёта дельт
+        self._thread_times = {}
+        self._thread_sample_time = time.monotonic()
         
         # Первый вызов для калибровки CPU
         self.process.cpu_percent(interval=None)
         
     def run(self):
         """Основной цикл сбора метрик."""
+        name_current_thread("MetricsCollector")
         timer = QTimer()
         timer.timeout.connect(self._collect)
         timer.start(self.update_interval)
@@ -47,6 +82,8 @@ class MetricsCollector(QThread):
             else:
                 handles = self.process.num_fds()
             
+            threads_cpu = self._collect_threads_cpu()
+            
             metrics = {
                 'cpu': cpu,
                 'cpu_history': list(self.cpu_history),
@@ -54,7 +91,8 @@ class MetricsCollector(QThread):
                 'memory_history': list(self.memory_history),
                 'memory_mb': mem_bytes / 1024 / 1024,
                 'threads': threads,
-                'handles': handles
+                'handles': handles,
+                'threads_cpu': threads_cpu
             }
             
             self.metrics_updated.emit(metrics)
@@ -63,7 +101,75 @@ class MetricsCollector(QThread):
             # Процесс завершился или нет прав
             self.stop()
             
+    def _collect_threads_cpu(self):
+        """
+        CPU по потокам за последний интервал.
+        
+        Returns:
+            list[dict]: {'id', 'name', 'cpu' (% одного ядра), 'cpu_time' (с)},
+            отсортированный по убыванию cpu
+        """
+        now = time.monotonic()
+        elapsed = max(now - self._thread_sample_time, 1e-6)
+        self._thread_sample_time = now
+        
+        names = get_thread_names()
+        current_times = {}
+        threads_cpu = []
+        for thread in self.process.threads():
+            total = thread.user_time + thread.system_time
+            current_times[thread.id] = total
+            previous = self._thread_times.get(thread.id, total)
+            threads_cpu.append({
+                'id': thread.id,
+                'name': names.get(thread.id, f"thread-{thread.id}"),
+                'cpu': max(0.0, (total - previous) / elapsed * 100),
+                'cpu_time': total
+            })
+        # Завершившиеся потоки выпадают из словаря
+        self._thread_times = current_times
+        
+        threads_cpu.sort(key=lambda t: t['cpu'], reverse=True)
+        return threads_cpu
+    
     def stop(self):
         """Остановка сбора."""
         self._stop_flag = True
-        self.quit()
\ No newline at end of file
+        self.quit()
+
+
+class EventLoopLagMonitor(QObject):
+    """
+    Задержка event loop UI-потока.
+    
+    Таймер с интервалом interval мс запускается в UI-потоке; всё, на сколько
+    он срабатывает позже, - время, в течение которого цикл событий был занят.
+    """
+    
+    def __init__(self, interval=100, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._expected = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+    
+    def start(self):
+        self._expected = time.perf_counter() + self.interval / 1000
+        self._timer.start(self.interval)
+    
+    def stop(self):
+        self._timer.stop()
+    
+    def _tick(self):
+        now = time.perf_counter()
+        self.last_lag_ms = max(0.0, (now - self._expected) * 1000)
+        self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+        self._expected = now + self.interval / 1000
+    
+    def take_max_lag(self):
+        """Возвращает максимальную задержку (мс) с прошлого вызова и сбрасывает её."""
+        lag = self.max_lag_ms
+        self.max_lag_ms = 0.0
+        return lag
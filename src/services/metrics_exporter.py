@@ -0,0 +1,258 @@
+"""
+File-based metrics export for fleet-wide analysis.
+
+Samples emitted by MetricsCollector are queued from the UI thread and
+written in batches by a worker thread to pluggable sinks:
+- PrometheusTextfileSink: node-exporter textfile collector (atomically replaced)
+- CsvSink: rolling CSV with samples plus a per-function timings CSV
+
+Configured by the optional "metrics_export" section of config/config.json:
+
+    "metrics_export": {
+        "enabled": true,
+        "flush_interval": 15000,
+        "prometheus_textfile": "metrics/yarn.prom",
+        "csv": "metrics/yarn_metrics.csv",
+        "csv_max_bytes": 10485760,
+        "csv_backups": 3
+    }
+
+Relative paths are resolved against the project root.
+"""
+
+import csv
+import io
+import os
+import queue
+import socket
+import time
+from PySide6.QtCore import QThread
+import services.logger as log
+import services.timings as timings
+
+SAMPLE_FIELDS = ["timestamp", "cpu", "memory_bytes", "threads", "handles", "event_loop_lag_ms"]
+TIMING_FIELDS = ["timestamp", "function", "count", "total_ms", "min_ms", "max_ms",
+                 "p50_ms", "p95_ms", "p99_ms"]
+
+# Queue marker that wakes the worker up on stop()
+_STOP = object()
+
+
+def _write_atomic(path, text):
+    """Write text to a temp file next to path and rename it over path."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusTextfileSink:
+    """
+    Writes the latest sample and function timings in Prometheus text format.
+
+    The file is replaced atomically so node-exporter never reads a partial file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.host = socket.gethostname()
+
+    def write(self, samples, timing_summary):
+        if not samples:
+            return
+        sample = samples[-1]
+        host = _escape_label(self.host)
+        lines = []
+
+        def gauge(name, help_text, value):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f'{name}{{host="{host}"}} {value}')
+
+        gauge("yarn_cpu_percent", "Process CPU usage in percent.", sample.get("cpu", 0))
+        gauge("yarn_memory_rss_bytes", "Process resident memory in bytes.", sample.get("memory_bytes", 0))
+        gauge("yarn_threads", "Number of process threads.", sample.get("threads", 0))
+        gauge("yarn_handles", "Open handles or file descriptors.", sample.get("handles", 0))
+        gauge("yarn_event_loop_lag_seconds", "Max UI event loop lag over the last interval.",
+              max(s.get("event_loop_lag_ms", 0) for s in samples) / 1000)
+
+        if timing_summary:
+            lines.append("# HELP yarn_function_calls_total Calls of functions decorated with @log.")
+            lines.append("# TYPE yarn_function_calls_total counter")
+            for s in timing_summary:
+                lines.append(
+                    f'yarn_function_calls_total{{host="{host}",function="{_escape_label(s["name"])}"}} {s["count"]}'
+                )
+            lines.append("# HELP yarn_function_seconds_total Total time spent in functions decorated with @log.")
+            lines.append("# TYPE yarn_function_seconds_total counter")
+            for s in timing_summary:
+                lines.append(
+                    f'yarn_function_seconds_total{{host="{host}",function="{_escape_label(s["name"])}"}} '
+                    f'{s["total_ms"] / 1000}'
+                )
+            lines.append("# HELP yarn_function_seconds Recent call duration quantiles.")
+            lines.append("# TYPE yarn_function_seconds summary")
+            for s in timing_summary:
+                function = _escape_label(s["name"])
+                for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                    lines.append(
+                        f'yarn_function_seconds{{host="{host}",function="{function}",quantile="{quantile}"}} '
+                        f'{s[key] / 1000}'
+                    )
+
+        _write_atomic(self.path, "\n".join(lines) + "\n")
+
+
+class CsvSink:
+    """
+    Appends samples to a rolling CSV file.
+
+    When the file exceeds max_bytes it is rotated to path.1 ... path.N.
+    Function timings are written as a snapshot to <name>_timings.csv.
+    """
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backups=3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        root, ext = os.path.splitext(path)
+        self.timings_path = f"{root}_timings{ext or '.csv'}"
+
+    def _rotate(self):
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def write(self, samples, timing_summary):
+        if samples:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                self._rotate()
+            is_new = not os.path.exists(self.path)
+            with open(self.path, "a", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=SAMPLE_FIELDS, extrasaction="ignore")
+                if is_new:
+                    writer.writeheader()
+                writer.writerows(samples)
+
+        if timing_summary:
+            now = time.time()
+            rows = [dict(s, function=s["name"], timestamp=now) for s in timing_summary]
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=TIMING_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+            _write_atomic(self.timings_path, buffer.getvalue())
+
+
+class MetricsExporter(QThread):
+    """
+    Background writer for metrics samples.
+
+    submit() is cheap and safe to call from the UI thread; samples are
+    batched and handed to the sinks every flush_interval milliseconds.
+    """
+
+    def __init__(self, sinks, flush_interval=15000):
+        super().__init__()
+        self.sinks = sinks
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._stop_flag = False
+
+    def submit(self, metrics):
+        """Queue one metrics sample (dict from MetricsCollector)."""
+        self._queue.put({
+            "timestamp": time.time(),
+            "cpu": metrics.get("cpu", 0),
+            "memory_bytes": metrics.get("memory_bytes", 0),
+            "threads": metrics.get("threads", 0),
+            "handles": metrics.get("handles", 0),
+            "event_loop_lag_ms": metrics.get("event_loop_lag_ms", 0),
+        })
+
+    def run(self):
+        """Collect samples until the flush deadline, then write the batch."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval / 1000
+        while not self._stop_flag:
+            timeout = deadline - time.monotonic()
+            if timeout > 0:
+                try:
+                    item = self._queue.get(timeout=timeout)
+                    if item is not _STOP:
+                        batch.append(item)
+                    continue
+                except queue.Empty:
+                    pass
+            self._flush(batch)
+            batch = []
+            deadline = time.monotonic() + self.flush_interval / 1000
+
+        # Final flush of everything still queued
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        self._flush(batch)
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        try:
+            timing_summary = timings.get_summary()
+        except Exception as e:
+            log.error(msg=f"Metrics export: timing summary failed: {e}")
+            timing_summary = []
+        for sink in self.sinks:
+            # A bad sample (None, a string, ...) must not kill the exporter thread
+            try:
+                sink.write(batch, timing_summary)
+            except Exception as e:
+                log.error(msg=f"Metrics export to {type(sink).__name__} failed: {type(e).__name__}: {e}")
+
+    def stop(self):
+        """Stop the worker; remaining samples are flushed before run() returns."""
+        self._stop_flag = True
+        # Wake up the worker blocked on the queue
+        self._queue.put(_STOP)
+
+
+def create_exporter(config, base_path):
+    """
+    Build MetricsExporter from the "metrics_export" config section.
+
+    Returns None when export is disabled or no sink is configured.
+    """
+    if not config or not config.get("enabled"):
+        return None
+
+    def resolve(path):
+        return path if os.path.isabs(path) else os.path.join(base_path, path)
+
+    sinks = []
+    if config.get("prometheus_textfile"):
+        sinks.append(PrometheusTextfileSink(resolve(config["prometheus_textfile"])))
+    if config.get("csv"):
+        sinks.append(CsvSink(
+            resolve(config["csv"]),
+            max_bytes=config.get("csv_max_bytes", 10 * 1024 * 1024),
+            backups=config.get("csv_backups", 3)
+        ))
+    if not sinks:
+        log.warning(msg="Metrics export enabled but no sinks configured")
+        return None
+    return MetricsExporter(sinks, flush_interval=config.get("flush_interval", 15000))
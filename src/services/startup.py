@@ -0,0 +1,139 @@
+"""
+Startup phase timeline.
+
+Every startup phase is recorded with wall time (perf_counter) and CPU time
+(process_time, all threads of the process) relative to the moment this
+module was imported - main.py imports it first. Phases nest; each one is
+also recorded as a tracing span (services.tracing).
+
+After the first paint of the main window the timeline is written to the
+log and to a JSON report:
+- YARN_STARTUP_REPORT=<path>  -> report path (default <project_root>/startup_report.json)
+- YARN_EXIT_AFTER_STARTUP=1   -> quit right after the report (used by benchmarks/startup.py)
+"""
+
+import json
+import os
+import time
+import services.tracing as tracing
+
+_origin_wall = time.perf_counter()
+_origin_cpu = time.process_time()
+_phases = []
+_depth = 0
+_finished = False
+
+
+class _Phase:
+    """Context manager recording one phase."""
+
+    __slots__ = ("name", "record", "span")
+
+    def __init__(self, name):
+        self.name = name
+        self.record = None
+        self.span = tracing.span(name, category="startup")
+
+    def __enter__(self):
+        global _depth
+        self.record = {
+            "name": self.name,
+            "depth": _depth,
+            "start_ms": (time.perf_counter() - _origin_wall) * 1000,
+            "_cpu": time.process_time(),
+        }
+        _phases.append(self.record)
+        _depth += 1
+        self.span.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _depth
+        self.span.__exit__(exc_type, exc, tb)
+        _depth -= 1
+        end_ms = (time.perf_counter() - _origin_wall) * 1000
+        self.record["wall_ms"] = end_ms - self.record["start_ms"]
+        self.record["cpu_ms"] = (time.process_time() - self.record.pop("_cpu")) * 1000
+        return False
+
+
+def phase(name):
+    """
+    Context manager recording a startup phase:
+
+        with startup.phase("TermsManager"):
+            ...
+    """
+    return _Phase(name)
+
+
+def mark(name):
+    """Records a zero-length phase (e.g. "first paint")."""
+    _phases.append({
+        "name": name,
+        "depth": _depth,
+        "start_ms": (time.perf_counter() - _origin_wall) * 1000,
+        "wall_ms": 0.0,
+        "cpu_ms": 0.0,
+    })
+    tracing.instant(name, category="startup")
+
+
+def get_report():
+    """Timeline dict: phases plus total wall/CPU time up to now."""
+    return {
+        "pid": os.getpid(),
+        "total_wall_ms": (time.perf_counter() - _origin_wall) * 1000,
+        "total_cpu_ms": (time.process_time() - _origin_cpu) * 1000,
+        "phases": [dict(p) for p in _phases if "wall_ms" in p],
+    }
+
+
+def format_report(report):
+    lines = [f"Startup: {report['total_wall_ms']:.1f} ms wall, {report['total_cpu_ms']:.1f} ms CPU"]
+    for p in report["phases"]:
+        indent = "  " * p["depth"]
+        lines.append(f"{p['start_ms']:9.1f} ms  {indent}{p['name']:<{40 - len(indent)}} "
+                     f"wall {p['wall_ms']:8.1f} ms  cpu {p['cpu_ms']:8.1f} ms")
+    return "\n".join(lines)
+
+
+def finish(base_path):
+    """Writes the report once (log + JSON file); returns it."""
+    global _finished
+    if _finished:
+        return None
+    _finished = True
+
+    import services.logger as log
+    report = get_report()
+    log.info(msg="\n" + format_report(report))
+
+    path = os.environ.get("YARN_STARTUP_REPORT") or os.path.join(base_path, "startup_report.json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    except OSError as e:
+        log.error(msg=f'Failed to write startup report "{path}": {e}')
+    return report
+
+
+def exit_after_startup():
+    return os.environ.get("YARN_EXIT_AFTER_STARTUP", "") not in ("", "0")
+
+
+def watch_first_paint(widget, callback):
+    """Calls callback() after the first paint event of widget."""
+    from PySide6.QtCore import QObject, QEvent, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                mark("first paint")
+                # Let the paint finish before reporting
+                QTimer.singleShot(0, callback)
+            return False
+
+    widget._first_paint_filter = _FirstPaintFilter(widget)
+    widget.installEventFilter(widget._first_paint_filter)
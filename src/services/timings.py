@@ -0,0 +1,118 @@
+"""
+Aggregated function timings.
+
+Collects durations recorded by the @log(mode="debug") decorator into
+per-function histograms instead of writing one log line per call.
+
+Each entry keeps:
+- count, total, min, max (exact)
+- a bounded ring of recent samples used for p50/p95/p99
+"""
+
+import threading
+from collections import deque
+
+# Samples kept per function for percentile estimation
+SAMPLE_WINDOW = 1024
+
+
+class FunctionTiming:
+    """Timing histogram for a single function (durations in nanoseconds)."""
+
+    __slots__ = ("name", "count", "total_ns", "min_ns", "max_ns", "samples")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+    def add(self, duration_ns):
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.samples.append(duration_ns)
+
+    def summary(self):
+        """Returns dict with stats in milliseconds."""
+        ordered = sorted(self.samples)
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "min_ms": (self.min_ns or 0) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+            "p50_ms": _percentile(ordered, 50) / 1e6,
+            "p95_ms": _percentile(ordered, 95) / 1e6,
+            "p99_ms": _percentile(ordered, 99) / 1e6,
+        }
+
+
+def _percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+_timings = {}
+_lock = threading.Lock()
+
+
+def record(name, duration_ns):
+    """Add one duration (ns) to the histogram of "name"."""
+    with _lock:
+        entry = _timings.get(name)
+        if entry is None:
+            entry = _timings[name] = FunctionTiming(name)
+        entry.add(duration_ns)
+
+
+def get_summary():
+    """Returns list of per-function stats sorted by total time (descending)."""
+    with _lock:
+        entries = list(_timings.values())
+        summaries = [entry.summary() for entry in entries]
+    summaries.sort(key=lambda s: s["total_ms"], reverse=True)
+    return summaries
+
+
+def reset():
+    """Drop all collected timings."""
+    with _lock:
+        _timings.clear()
+
+
+def format_summary(summaries=None):
+    """Renders the summary as a plain-text table."""
+    if summaries is None:
+        summaries = get_summary()
+    lines = [
+        f"{'function':<40} {'count':>8} {'total':>10} {'min':>8} {'max':>8} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8}"
+    ]
+    for s in summaries:
+        lines.append(
+            f"{s['name'][:40]:<40} {s['count']:>8} {s['total_ms']:>10.2f} "
+            f"{s['min_ms']:>8.2f} {s['max_ms']:>8.2f} {s['p50_ms']:>8.2f} "
+            f"{s['p95_ms']:>8.2f} {s['p99_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def dump_to_log():
+    """Writes the current summary to the application log (times in ms)."""
+    # Imported here: logger imports this module for the @log decorator
+    import services.logger as log
+
+    summaries = get_summary()
+    if not summaries:
+        log.debug(msg="PERF summary: no timings recorded")
+        return
+    log.info(msg=f"PERF summary ({len(summaries)} functions, ms):\n{format_summary(summaries)}")
@@ -0,0 +1,190 @@
+"""
+Span tracing with Chrome trace-event export.
+
+Records nested, thread-aware spans for startup and UI actions and exports
+them as Chrome trace-event JSON (chrome://tracing, Perfetto, speedscope).
+
+Tracing is enabled with the YARN_TRACE environment variable:
+- YARN_TRACE=1          -> trace is written to <project_root>/trace.json
+- YARN_TRACE=<path>     -> trace is written to <path>
+
+When disabled, span() returns a shared no-op context manager and
+@traced calls the function directly, so instrumentation costs one flag check.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Upper bound of buffered spans, oldest are dropped first
+MAX_EVENTS = 200000
+
+_enabled = os.environ.get("YARN_TRACE", "") not in ("", "0")
+_events = deque(maxlen=MAX_EVENTS)
+_thread_names = {}
+_origin_ns = time.perf_counter_ns()
+_pid = os.getpid()
+
+
+def _thread_id():
+    """Native thread id where available (matches psutil/OS tools)."""
+    if hasattr(threading, "get_native_id"):
+        return threading.get_native_id()
+    return threading.get_ident()
+
+
+class _NullSpan:
+    """Context manager used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Complete ("X") trace event measured between __enter__ and __exit__."""
+
+    __slots__ = ("name", "category", "args", "start_ns")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        tid = _thread_id()
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (self.start_ns - _origin_ns) / 1000,
+            "dur": (end_ns - self.start_ns) / 1000,
+            "pid": _pid,
+            "tid": tid,
+        }
+        if self.args:
+            event["args"] = self.args
+        if exc_type is not None:
+            event.setdefault("args", {})["error"] = repr(exc)
+        # deque.append is atomic, no lock needed
+        _events.append(event)
+        return False
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def span(name, category="app", **args):
+    """
+    Context manager recording a span:
+
+        with tracing.span("reload_tabs", count=10):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(name=None, category="app"):
+    """Decorator recording every call of the function as a span."""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instant(name, category="app", **args):
+    """Records a zero-duration marker (e.g. "first paint")."""
+    if not _enabled:
+        return
+    _events.append({
+        "name": name,
+        "cat": category,
+        "ph": "i",
+        "s": "t",
+        "ts": (time.perf_counter_ns() - _origin_ns) / 1000,
+        "pid": _pid,
+        "tid": _thread_id(),
+        "args": args,
+    })
+
+
+def clear():
+    """Drop all buffered spans."""
+    _events.clear()
+
+
+def get_trace_path():
+    """Output path taken from YARN_TRACE (default <project_root>/trace.json)."""
+    value = os.environ.get("YARN_TRACE", "")
+    if value and value not in ("0", "1"):
+        return value
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(root, "trace.json")
+
+
+def export_chrome_trace(path=None):
+    """
+    Writes buffered spans as Chrome trace-event JSON.
+
+    Returns the written path or None if nothing was recorded.
+    """
+    if not _events:
+        return None
+    path = path or get_trace_path()
+
+    metadata = [
+        {"name": "process_name", "ph": "M", "pid": _pid, "args": {"name": "Yarn"}}
+    ]
+    for tid, thread_name in list(_thread_names.items()):
+        metadata.append({
+            "name": "thread_name", "ph": "M", "pid": _pid, "tid": tid,
+            "args": {"name": thread_name},
+        })
+
+    trace = {
+        "traceEvents": metadata + list(_events),
+        "displayTimeUnit": "ms",
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
+    os.replace(tmp_path, path)
+    return path
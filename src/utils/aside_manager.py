@@ -1,37 +1,77 @@
-import json
 import os
+import time
 import utils.helpers as helpers
 import services.logger as log
+from utils.config_store import store
 
-"""Button click handler for aside - manages button states and contains basic logic"""
+"""Button click handler for aside - manages button states and contains basic logic
+
+Nothing is read at import time: the button state lives in AsideState, which is
+loaded from the config store on first use and changed in memory afterwards
+(persistence is write-behind, see utils.config_store)."""
 base_path = helpers.get_project_root()
 btn_config_path = os.path.join(base_path, "config", "btn_settings_config.json")
-data_btn_config = helpers.get_json_property(btn_config_path)
 extra_panels_config_path = os.path.join(base_path, "config", "extra_panel.json")
-data_extra_panels = helpers.get_json_property(extra_panels_config_path)
 
 
 def save_config(path, data):
     """Save configuration to JSON file"""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    store.write(path, data)
+
+
+class AsideState:
+    """In-memory state of the aside buttons (btn_settings_config)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self.load()
+        return self._data
+
+    def load(self):
+        """Reads the button config; activates workspaces if no button is active"""
+        self._data = helpers.get_json_property(self.path) or {"aside_is_open": False}
+        if not any(value for name, value in self._data.items() if name != "aside_is_open"):
+            self._data["btn_workspaces"] = True
+            self.save()
+        log.debug(msg=f'Aside state loaded: {self._data}')
+
+    def save(self):
+        save_config(self.path, self._data)
 
-x = []
-for name in data_btn_config:
-    if name == "aside_is_open": continue
-    x.append(data_btn_config[name])
+    @property
+    def aside_is_open(self):
+        return bool(self.data.get("aside_is_open"))
 
-if all(y == False for y in x):
-    data_btn_config["btn_workspaces"] = True
-    save_config(btn_config_path, data_btn_config)
-del x
+    @aside_is_open.setter
+    def aside_is_open(self, value):
+        self.data["aside_is_open"] = value
+        self.save()
 
+    def active_button(self):
+        return next((name for name, value in self.data.items()
+                     if value is True and name != "aside_is_open"), None)
+
+
+_state = None
 _main_widget = None
 _panels = {}
+_panel_factories = {}
+_panel_last_used = {}
 _current_panel = None
 extra_panel_reload_signal = None
 
+def get_state():
+    """Returns the aside state, created on first use"""
+    global _state
+    if _state is None:
+        _state = AsideState(btn_config_path)
+    return _state
+
 def init_widget(widget_instance):
     """Initialize the main widget reference"""
     global _main_widget
@@ -42,10 +82,61 @@ def register_panel(panel_name, panel_instance):
     global _panels
     _panels[panel_name] = panel_instance
 
+def register_panel_factory(panel_name, factory):
+    """Register factory() creating the panel; it is called on the first show"""
+    _panel_factories[panel_name] = factory
+
+def get_panel(panel_name):
+    """Returns the panel, creating it from its factory if needed (None if unknown)"""
+    if panel_name in _panels:
+        return _panels[panel_name]
+    factory = _panel_factories.get(panel_name)
+    if factory is None:
+        return None
+    panel = factory()
+    panel.hide()
+    _main_widget.widget2_layout.addWidget(panel)
+    _panels[panel_name] = panel
+    log.debug(msg=f'Aside panel "{panel_name}" created')
+    return panel
+
+def dispose_idle_panels(max_idle):
+    """Deletes hidden panels unused for max_idle seconds; factories recreate them on demand"""
+    now = time.monotonic()
+    for panel_name in list(_panels):
+        panel = _panels[panel_name]
+        if panel_name not in _panel_factories or panel is _current_panel:
+            continue
+        if now - _panel_last_used.get(panel_name, now) < max_idle:
+            continue
+        del _panels[panel_name]
+        _panel_last_used.pop(panel_name, None)
+        _main_widget.widget2_layout.removeWidget(panel)
+        _release_panel(panel)
+        panel.deleteLater()
+        log.debug(msg=f'Aside panel "{panel_name}" disposed after {max_idle}s unused')
+
+def _release_panel(panel):
+    """Drops the localization bindings and theme listener of a panel; panel.dispose() releases the rest"""
+    import utils.localization as localization
+    import utils.theme_engine as theme_engine
+    localization.get_localization().release(panel)
+    theme_engine.get_engine().remove_listener(panel.apply_theme)
+    if hasattr(panel, "dispose"):
+        panel.dispose()
+
+def _hide_current_panel():
+    global _current_panel
+    if _current_panel:
+        _current_panel.hide()
+        for name, panel in _panels.items():
+            if panel is _current_panel:
+                _panel_last_used[name] = time.monotonic()
+        _current_panel = None
+
 
 def control_sidebar_behavior(name):
     """Handle sidebar button click behavior"""
-    helpers.get_json_property(btn_config_path, name)
     set_active_button(name)
     manage_panels_visibility(name)
 
@@ -53,24 +144,22 @@ def control_sidebar_behavior(name):
 def manage_panels_visibility(active_key):
     """Manage visibility of content panels based on active button"""
     global _panels, _current_panel
-    
+
     # Hide current panel
-    if _current_panel:
-        _current_panel.hide()
-    
-    # Show new panel based on active button
+    _hide_current_panel()
+
+    # Show new panel based on active button (created on first show)
     panel_name = _get_panel_name_by_button(active_key)
-    if panel_name and panel_name in _panels:
-        _panels[panel_name].show()
-        _current_panel = _panels[panel_name]
-    else:
-        _current_panel = None
+    panel = get_panel(panel_name) if panel_name else None
+    if panel is not None:
+        panel.show()
+        _current_panel = panel
 
 def _get_panel_name_by_button(button_name):
     """Map button names to panel names"""
     panel_mapping = {
         'btn_workspaces': 'workspaces',
-        'btn_tools': 'tools', 
+        'btn_tools': 'tools',
         'btn_plugins': 'plugins',
         'btn_settings': 'settings',
     } # 'btn_ExtraPanels': 'ExtraPanels'
@@ -78,15 +167,13 @@ def _get_panel_name_by_button(button_name):
 
 def aside_state():
     """Toggle aside panel visibility"""
-    global _main_widget
-    data = helpers.get_json_property(btn_config_path)
-    if data['aside_is_open']:
+    state = get_state()
+    if state.aside_is_open:
         hide_aside()
     else:
         show_aside()
-    
-    data['aside_is_open'] = not data['aside_is_open']
-    save_config(btn_config_path, data)
+
+    state.aside_is_open = not state.aside_is_open
 
 
 def show_aside():
@@ -95,7 +182,7 @@ def show_aside():
     _main_widget.widget2.show()
     _main_widget.setFixedWidth(300)
     _main_widget.btn_toggle.setText("<<")
-    
+
     # Show active panel when aside is opened
     active_btn = get_active_btn()
     if active_btn:
@@ -108,11 +195,9 @@ def hide_aside():
     _main_widget.widget2.hide()
     _main_widget.setFixedWidth(50)
     _main_widget.btn_toggle.setText(">>")
-    
+
     # Hide all panels when aside is closed
-    if _current_panel:
-        _current_panel.hide()
-        _current_panel = None
+    _hide_current_panel()
 
 
 def btn_workspaces_clicked():
@@ -136,8 +221,8 @@ def btn_settings_clicked():
 
 def btn_ExtraPanels_clicked():
     """Handle ExtraPanels button click"""
+    # ExtraPanel follows the change through the config bus
     handle_extra_panel_click("isOpen")
-    reload_extra_panels()
 
 def handle_extra_panel_click(button):
     """Click handler for buttons that trigger extra panels"""
@@ -145,12 +230,12 @@ def handle_extra_panel_click(button):
     #     if name == "isOpen": continue
     #     elif button == name:
     #         if data_extra_panels[name] is True:
-    data_extra_panels["isOpen"] = not data_extra_panels["isOpen"]
+    is_open = not helpers.get_json_property(extra_panels_config_path, "isOpen")
     #     else:
     #         data_extra_panels["isOpen"] = True
     #         data_extra_panels[name] = True
     # else: data_extra_panels[name] is False
-    save_config(extra_panels_config_path, data_extra_panels)
+    store.set_key(extra_panels_config_path, "isOpen", is_open)
 
 def set_extra_panel_signal(signal):
     global extra_panel_reload_signal
@@ -162,12 +247,10 @@ def reload_extra_panels():
     else:
         log.debug("Extra panel signal not set yet")
 
-def set_active_button(key): 
+def set_active_button(key):
     """Keeps only one button active (set to true) among others"""
 
-    with open(btn_config_path, "r", encoding="utf-8") as f:
-        f_readfile = f.read()
-        data = json.loads(f_readfile)
+    data = get_state().data
 
     for keyName in data:
         if keyName == 'aside_is_open': continue
@@ -184,10 +267,8 @@ def set_active_button(key):
                 data[keyName] = True
                 show_aside()
         else: data[keyName] = False
-    save_config(btn_config_path, data)
+    get_state().save()
 
 def get_active_btn():
     """Get currently active button name"""
-    data = helpers.get_json_property(btn_config_path)
-    filtered = filter(lambda x: data[x] == True and x != 'aside_is_open', data)
-    return next(filtered, None)
\ No newline at end of file
+    return get_state().active_button()
@@ -0,0 +1,139 @@
+"""
+Startup bootstrap snapshot.
+
+Themes, languages and font styles are many small JSON files read on every
+start. They are merged into one snapshot file (cache/bootstrap.json, next to
+the compiled cache/qss and cache/i18n; config/ belongs to the settings
+database) that is loaded with a single read and handed to
+utils.config_store, so the first get_json_property() of each of them is a
+cache hit.
+
+The snapshot records (mtime_ns, size, sha1) of every source file:
+- unchanged mtime and size: the snapshot entry is used as is
+- changed mtime/size but same sha1 (checkout, copy): only the signature is refreshed
+- changed content, new or removed files: the snapshot is rebuilt
+
+Configuration documents are not part of the snapshot: they already come
+from the settings database in one query (utils.settings_db).
+"""
+
+import hashlib
+import json
+import os
+import services.logger as log
+from utils.config_store import store
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PATH = os.path.join("cache", "bootstrap.json")
+SOURCE_DIRS = (
+    os.path.join("resources", "themes"),
+    os.path.join("resources", "language"),
+    os.path.join("resources", "fonts"),
+)
+
+
+def _snapshot_path(base_path):
+    return os.path.join(base_path, SNAPSHOT_PATH)
+
+
+def _sha1(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _source_files(base_path):
+    """Sorted relative paths of the snapshot sources."""
+    files = []
+    for relative_dir in SOURCE_DIRS:
+        try:
+            with os.scandir(os.path.join(base_path, relative_dir)) as it:
+                files.extend(os.path.join(relative_dir, entry.name) for entry in it
+                             if entry.name.endswith(".json") and entry.is_file())
+        except OSError:
+            continue
+    return sorted(files)
+
+
+def _build(base_path, files):
+    sources = {}
+    for relative in files:
+        path = os.path.join(base_path, relative)
+        try:
+            stat = os.stat(path)
+            with open(path, 'rb') as f:
+                raw = f.read()
+            data = json.loads(raw.decode('utf-8'))
+        except (OSError, ValueError) as e:
+            log.warning(msg=f'Bootstrap snapshot skipped "{relative}": {e}')
+            continue
+        sources[relative] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha1": hashlib.sha1(raw).hexdigest(),
+            "data": data,
+        }
+    return {"version": SNAPSHOT_VERSION, "sources": sources}
+
+
+def _save(path, snapshot):
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning(msg=f'Failed to save bootstrap snapshot "{path}": {e}')
+
+
+def _validate(base_path, snapshot, files):
+    """
+    True if the snapshot matches the sources.
+
+    Entries whose mtime changed but content did not get their signature
+    refreshed in place (sets snapshot["_touched"]).
+    """
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return False
+    sources = snapshot.get("sources", {})
+    # New or removed files
+    if sorted(sources) != files:
+        return False
+
+    for relative, entry in sources.items():
+        path = os.path.join(base_path, relative)
+        try:
+            stat = os.stat(path)
+            if (stat.st_mtime_ns, stat.st_size) == (entry["mtime_ns"], entry["size"]):
+                continue
+            if _sha1(path) != entry["sha1"]:
+                return False
+        except OSError:
+            return False
+        entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+        snapshot["_touched"] = True
+    return True
+
+
+def load(base_path):
+    """Loads (or rebuilds) the snapshot and seeds the config store. Returns the number of files."""
+    path = _snapshot_path(base_path)
+    files = _source_files(base_path)
+
+    snapshot = None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if snapshot is None or not _validate(base_path, snapshot, files):
+        snapshot = _build(base_path, files)
+        _save(path, snapshot)
+        log.debug(msg=f'Bootstrap snapshot rebuilt: {len(snapshot["sources"])} files')
+    elif snapshot.pop("_touched", False):
+        _save(path, snapshot)
+
+    for relative, entry in snapshot["sources"].items():
+        store.seed(os.path.join(base_path, relative), (entry["mtime_ns"], entry["size"]), entry["data"])
+    return len(snapshot["sources"])
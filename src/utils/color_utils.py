@@ -1,11 +1,166 @@
+"""
+Color parsing and derivation for themes.
+
+Colors are parsed once into Color tuples (memoized); every derivation is
+memoized too, so compiling a theme repeats no work across theme switches.
+Accepted formats: "#rrggbb", "#rgb", "rrggbb"/"rgb" without the hash (as in
+"accent_color": "202020") and "rgb(r, g, b)".
+
+Contrast follows WCAG 2.x: relative luminance from linearized sRGB channels
+(lookup table of the 256 channel values), ratio = (L1 + 0.05) / (L2 + 0.05).
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+WCAG_AA = 4.5
+WCAG_AA_LARGE = 3.0
+
+# Theme keys holding colors; palette() derives variants for each of them
+COLOR_KEYS = (
+    "bg_color", "bg_card", "accent_color", "accent_primary", "btn_bg_color",
+    "accent_gray", "accent_light", "text_main", "text_muted",
+)
+
+_HEX = re.compile(r'^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$')
+_RGB = re.compile(r'^rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)$')
+
+# sRGB channel value -> linear light, for relative luminance
+_LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (v / 255 for v in range(256))
+)
+
+
+class Color(namedtuple("Color", "r g b")):
+    """Parsed 8-bit RGB color"""
+    __slots__ = ()
+
+    @property
+    def hex(self):
+        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+
+    @property
+    def luminance(self):
+        """WCAG relative luminance (0 - black, 1 - white)"""
+        return 0.2126 * _LINEAR[self.r] + 0.7152 * _LINEAR[self.g] + 0.0722 * _LINEAR[self.b]
+
+    @property
+    def is_dark(self):
+        """True if white text has more contrast on this color than black text"""
+        return (1.05 / (self.luminance + 0.05)) > ((self.luminance + 0.05) / 0.05)
+
+
+def parse(value):
+    """Returns the Color of a color string; ValueError if it is not one"""
+    if not isinstance(value, str):
+        raise ValueError(f"invalid color: {value!r}")
+    return _parse(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse(value):
+    text = value.strip()
+    match = _HEX.match(text)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(c * 2 for c in digits)
+        return Color(int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+    match = _RGB.match(text)
+    if match and all(int(c) <= 255 for c in match.groups()):
+        return Color(*(int(c) for c in match.groups()))
+    raise ValueError(f"invalid color: {value!r}")
+
+
+def is_color(value):
+    try:
+        parse(value)
+        return True
+    except ValueError:
+        return False
+
+
+def normalize(value):
+    """"#rrggbb" form of a color; other values are returned unchanged"""
+    try:
+        return parse(value).hex
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=1024)
 def darken_color(hex_color, factor=0.8):
-    hex_color = hex_color.lstrip('#')
-    rgb = [int(hex_color[i:i+2], 16) for i in (0, 2, 4)]
-    darkened = [max(0, int(c * factor)) for c in rgb]
-    return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+    """Multiplies every channel by factor"""
+    color = parse(hex_color)
+    return Color(*(max(0, int(c * factor)) for c in color)).hex
+
 
+@lru_cache(maxsize=1024)
 def lighten_color(hex_color, factor=0.8):
-    hex_color = hex_color.lstrip('#')
-    rgb = [int(hex_color[i:i+2], 16) for i in (0, 2, 4)]
-    lightened = [min(255, int(c + (255 - c) * factor)) for c in rgb]
-    return f"#{lightened[0]:02x}{lightened[1]:02x}{lightened[2]:02x}"
\ No newline at end of file
+    """Moves every channel towards white by factor"""
+    color = parse(hex_color)
+    return Color(*(min(255, int(c + (255 - c) * factor)) for c in color)).hex
+
+
+@lru_cache(maxsize=1024)
+def mix_colors(first, second, weight=0.5):
+    """first blended with second (weight 0 - first, 1 - second)"""
+    a, b = parse(first), parse(second)
+    return Color(*(round(x + (y - x) * weight) for x, y in zip(a, b))).hex
+
+
+@lru_cache(maxsize=4096)
+def contrast_ratio(foreground, background):
+    """WCAG contrast ratio of two colors, from 1.0 to 21.0"""
+    l1, l2 = parse(foreground).luminance, parse(background).luminance
+    if l1 < l2:
+        l1, l2 = l2, l1
+    return (l1 + 0.05) / (l2 + 0.05)
+
+
+def contrast_ratios(pairs):
+    """Contrast ratios of many (foreground, background) pairs in one pass"""
+    return [contrast_ratio(foreground, background) for foreground, background in pairs]
+
+
+def low_contrast_pairs(theme, minimum=WCAG_AA):
+    """[(text key, background key, ratio)] of theme text colors below minimum"""
+    pairs = [
+        (fg, bg) for fg in ("text_main", "text_muted")
+        for bg in ("bg_color", "bg_card", "btn_bg_color")
+        if is_color(theme.get(fg)) and is_color(theme.get(bg))
+    ]
+    ratios = contrast_ratios((theme[fg], theme[bg]) for fg, bg in pairs)
+    return [(fg, bg, ratio) for (fg, bg), ratio in zip(pairs, ratios) if ratio < minimum]
+
+
+def palette(theme):
+    """
+    Normalized colors of a theme plus their variants, derived in one batch:
+    <key>_hover, <key>_pressed, <key>_disabled and <key>_100 ... <key>_900
+    (from lightest to darkest). Dark themes are detected from bg_card
+    luminance, not from the "isDark" flag.
+    """
+    colors = tuple((key, normalize(theme[key])) for key in COLOR_KEYS if is_color(theme.get(key)))
+    return dict(_palette(colors))
+
+
+@lru_cache(maxsize=32)
+def _palette(colors):
+    colors = dict(colors)
+    background = colors.get("bg_card") or colors.get("bg_color") or "#000000"
+    dark = parse(background).is_dark
+    shift = lighten_color if dark else darken_color
+
+    result = dict(colors)
+    for key, value in colors.items():
+        result[f"{key}_hover"] = shift(value, 0.1 if dark else 0.9)
+        result[f"{key}_pressed"] = shift(value, 0.2 if dark else 0.8)
+        result[f"{key}_disabled"] = mix_colors(value, background, 0.5)
+        for step in range(1, 10):
+            # 500 is the color itself
+            weight = (5 - step) / 5
+            result[f"{key}_{step}00"] = lighten_color(value, weight) if weight > 0 else darken_color(value, 1 + weight)
+    return tuple(result.items())
@@ -0,0 +1,104 @@
+"""
+Config change notification bus.
+
+Widgets subscribe to a config document (and optionally one top-level key)
+instead of re-reading files or rebuilding themselves after every action:
+
+    bus().subscribe(path, self.on_tabs_changed)               # any key
+    bus().subscribe(path, self.on_open_changed, key="isOpen")  # one key
+
+Changes reported by utils.config_store are collected and delivered in one
+batch on the Qt thread (queued signal): several changes of the same key
+within one event loop iteration are coalesced, only the latest value is
+delivered. Callbacks receive (key, value); value is config_store.REMOVED
+for removed keys.
+"""
+
+import copy
+import os
+import threading
+import traceback
+from PySide6.QtCore import QObject, Signal, Qt
+import services.logger as log
+from utils.config_store import store, REMOVED
+
+
+class ConfigBus(QObject):
+    """Publish/subscribe of config changes keyed on document path."""
+
+    _changes_queued = Signal()
+
+    def __init__(self):
+        super().__init__()
+        # path -> [(key or None, callback)]
+        self._subscribers = {}
+        # path -> {key: value} collected until the next dispatch
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._changes_queued.connect(self._dispatch, Qt.QueuedConnection)
+        store.add_listener(self.publish)
+
+    def subscribe(self, path, callback, key=None):
+        """Calls callback(key, value) for changes of the document (or of one key)."""
+        self._subscribers.setdefault(os.path.abspath(path), []).append((key, callback))
+
+    def unsubscribe(self, path, callback):
+        path = os.path.abspath(path)
+        subscribers = [s for s in self._subscribers.get(path, []) if s[1] != callback]
+        if subscribers:
+            self._subscribers[path] = subscribers
+        else:
+            self._subscribers.pop(path, None)
+
+    def publish(self, path, changes):
+        """Queues changes ({key: value}) of a document; safe from any thread."""
+        path = os.path.abspath(path)
+        if path not in self._subscribers:
+            return
+        with self._lock:
+            schedule = not self._pending
+            # REMOVED is compared by identity: it must not be copied
+            self._pending.setdefault(path, {}).update(
+                {key: value if value is REMOVED else copy.deepcopy(value) for key, value in changes.items()})
+        if schedule:
+            self._changes_queued.emit()
+
+    def _dispatch(self):
+        """Delivers the collected batch on the Qt thread."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for path, changes in pending.items():
+            for key_filter, callback in list(self._subscribers.get(path, [])):
+                for key, value in changes.items():
+                    if key_filter is not None and key_filter != key:
+                        continue
+                    try:
+                        callback(key, value)
+                    except RuntimeError as e:
+                        # Receiver widget already deleted by Qt
+                        if "already deleted" not in str(e):
+                            self._report(path, key, callback)
+                            continue
+                        log.debug(msg=f'config bus: dropped subscriber of "{path}": {e}')
+                        self.unsubscribe(path, callback)
+                        break
+                    except Exception:
+                        # One failing subscriber must not lose the rest of the batch
+                        self._report(path, key, callback)
+
+    @staticmethod
+    def _report(path, key, callback):
+        log.error(msg=f'config bus: subscriber {getattr(callback, "__qualname__", callback)} failed '
+                      f'on "{key}" of "{path}":\n{traceback.format_exc()}')
+
+
+_bus = None
+
+
+def bus():
+    """Returns the application bus (created on first use, after QApplication)."""
+    global _bus
+    if _bus is None:
+        _bus = ConfigBus()
+    return _bus
@@ -0,0 +1,380 @@
+"""
+Process-wide cache of configuration documents.
+
+Documents are addressed by their JSON path (config/config.json, ...):
+- paths inside config/ are namespaces of the SQLite settings database
+  (utils.settings_db). The database is opened once, all namespaces are
+  loaded in one query and served from memory afterwards.
+- other paths (themes, languages, ...) are JSON files, parsed once and
+  re-parsed only when the file's mtime or size changes.
+
+Readers receive deep copies, so mutating a returned dict never changes the
+cached document; changes go through write() / set_key() / remove_key().
+Listeners (see add_listener, utils.config_bus) are told which top-level
+keys changed.
+
+Writes are write-behind: the in-memory document is updated immediately,
+the change is persisted by a background thread after a short debounce
+(several changes are coalesced). Database namespaces changed together are
+saved in one transaction, JSON files are replaced atomically (temp file +
+rename). A failed write stays pending and is retried with exponential
+backoff; after MAX_RETRIES the document is kept in memory only (never
+replaced by the older file on disk) until a later write succeeds.
+flush() persists everything pending synchronously and is called on
+application quit and at exit.
+"""
+
+import atexit
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+import services.logger as log
+from utils.dir_cache import cache as dir_cache
+from utils.settings_db import SettingsDatabase
+
+# Delay between the last change of a document and its write (seconds)
+DEBOUNCE = 0.5
+
+# Retries of a failed write (delay doubles from DEBOUNCE up to MAX_RETRY_DELAY)
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 30.0
+
+# Cache signature of documents owned by the settings database
+_DB = ("db", None)
+
+# Value passed to listeners for a removed key
+REMOVED = object()
+
+
+class ConfigStore:
+    """Cache of configuration documents keyed by absolute JSON path."""
+
+    def __init__(self, debounce=DEBOUNCE, use_database=True):
+        # path -> (mtime_ns, size, data); signature is None while a write is pending
+        self._cache = {}
+        # path -> (deadline, version) of not yet persisted documents
+        self._pending = {}
+        # path -> failed writes in a row; paths given up on, authoritative in memory
+        self._failures = {}
+        self._unsaved = set()
+        self._version = 0
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        # Serializes persistence of the writer thread and flush()
+        self._io_lock = threading.Lock()
+        self._writer = None
+        self._listeners = []
+        self._db = None
+        self._db_opened = not use_database
+        self.debounce = debounce
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    @staticmethod
+    def _signature(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _database(self):
+        """Opens the settings database on first use and loads every namespace."""
+        if self._db_opened:
+            return self._db
+        self._db_opened = True
+        config_root = os.path.join(log.get_project_root(), "config")
+        try:
+            db = SettingsDatabase(config_root)
+            documents = db.load_all()
+        except sqlite3.Error as e:
+            log.error(msg=f"Settings database unavailable, using JSON files: {e}")
+            return None
+        for namespace, data in documents.items():
+            key = os.path.join(config_root, *namespace.split("/")) + ".json"
+            self._cache[key] = (_DB[0], _DB[1], data)
+        self.misses += 1
+        log.debug(msg=f'settings database loaded: {len(documents)} namespaces from "{db.path}"')
+        self._db = db
+        return db
+
+    def _is_db_key(self, key):
+        db = self._database()
+        return db is not None and db.namespace_for(key) is not None
+
+    def _load(self, path):
+        """Returns cached document, (re)parsing JSON files if they changed."""
+        key = self._key(path)
+        with self._lock:
+            cached = self._cache.get(key)
+            # Pending (or unsaved) changes are newer than anything persisted
+            if cached is not None and (key in self._pending or key in self._unsaved):
+                self.hits += 1
+                return cached[2]
+
+            if self._is_db_key(key):
+                cached = self._cache.get(key)
+                if cached is None:
+                    raise FileNotFoundError(f'No settings namespace for "{key}"')
+                self.hits += 1
+                return cached[2]
+
+            signature = self._signature(key)
+            if cached is not None and cached[:2] == signature:
+                self.hits += 1
+                return cached[2]
+
+            with open(key, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._cache[key] = (signature[0], signature[1], data)
+            self.misses += 1
+            log.debug(msg=f'config cache miss: parsed "{key}" (hits={self.hits}, misses={self.misses})')
+            return data
+
+    def get(self, path, key=""):
+        """
+        Returns a copy of the whole document or of one top-level key.
+
+        Raises FileNotFoundError / json.JSONDecodeError like json.load.
+        """
+        data = self._load(path)
+        if key == "":
+            return copy.deepcopy(data)
+        if not isinstance(data, dict):
+            return None
+        return copy.deepcopy(data.get(key))
+
+    def exists(self, path):
+        """True if the document exists (in the database or on disk)."""
+        key = self._key(path)
+        with self._lock:
+            if self._is_db_key(key):
+                return key in self._cache
+            if key in self._cache:
+                return True
+        return os.path.exists(key)
+
+    def documents(self, folder):
+        """
+        {name: path} of the documents directly in folder: the database
+        namespaces under it (e.g. workspaces/*), or its *.json files when the
+        folder is not owned by the database.
+        """
+        folder = self._key(folder)
+        with self._lock:
+            db = self._database()
+            if db is not None and db.namespace_for(os.path.join(folder, "_.json")) is not None:
+                return {
+                    os.path.basename(key)[:-len(".json")]: key
+                    for key in sorted(self._cache)
+                    if os.path.dirname(key) == folder and db.namespace_for(key) is not None
+                }
+        return {os.path.splitext(name)[0]: path for name, path in dir_cache.glob(folder, "*.json")}
+
+    def write(self, path, data):
+        """Replaces the document in memory and schedules its persistence."""
+        key = self._key(path)
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._database()
+            cached = self._cache.get(key)
+            old = cached[2] if cached is not None else {}
+            self._store(key, data)
+        self._notify(key, _diff(old, data))
+
+    def set_key(self, path, key, value):
+        """Sets one top-level key of the document (loaded if needed)."""
+        with self._lock:
+            data = self._load(path)
+            if key in data and data[key] == value:
+                return
+            data[key] = copy.deepcopy(value)
+            self._store(self._key(path), data)
+        self._notify(self._key(path), {key: value})
+
+    def remove_key(self, path, key):
+        """Removes one top-level key. Returns False if the key did not exist."""
+        with self._lock:
+            data = self._load(path)
+            if key not in data:
+                return False
+            del data[key]
+            self._store(self._key(path), data)
+        self._notify(self._key(path), {key: REMOVED})
+        return True
+
+    def seed(self, path, signature, data):
+        """
+        Puts an already parsed JSON file into the cache (see utils.bootstrap).
+
+        signature is the (mtime_ns, size) the data was read at; the file is
+        re-parsed on the next read if it changed since.
+        """
+        key = self._key(path)
+        with self._lock:
+            if key not in self._pending and key not in self._unsaved:
+                self._cache[key] = (signature[0], signature[1], data)
+
+    def add_listener(self, listener):
+        """listener(path, {key: new value or REMOVED}) is called after every change."""
+        self._listeners.append(listener)
+
+    def _notify(self, key, changes):
+        if not changes:
+            return
+        for listener in list(self._listeners):
+            listener(key, changes)
+
+    def _store(self, key, data):
+        with self._lock:
+            # Open the database first so it cannot overwrite this change when loading
+            self._database()
+            if key in self._pending:
+                self.coalesced += 1
+            self._version += 1
+            self._cache[key] = (None, None, data)
+            self._pending[key] = (time.monotonic() + self.debounce, self._version)
+            self._ensure_writer()
+            self._wakeup.notify()
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="ConfigWriter", daemon=True
+            )
+            self._writer.start()
+
+    def _writer_loop(self):
+        """Persists documents whose debounce deadline has passed."""
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._wakeup.wait()
+                now = time.monotonic()
+                due = [key for key, (deadline, _) in self._pending.items() if deadline <= now]
+                if not due:
+                    earliest = min(deadline for deadline, _ in self._pending.values())
+                    self._wakeup.wait(earliest - now)
+                    continue
+                jobs = self._snapshot_jobs(due)
+            self._persist(jobs)
+
+    def _snapshot_jobs(self, keys):
+        """(key, version, data copy) for pending keys; called with the lock held."""
+        return [(key, self._pending[key][1], copy.deepcopy(self._cache[key][2])) for key in keys]
+
+    def _persist(self, jobs):
+        """Saves database namespaces in one transaction and JSON files atomically."""
+        with self._io_lock:
+            with self._lock:
+                # Skip jobs already persisted by flush() or superseded by a newer version
+                jobs = [job for job in jobs if self._pending.get(job[0], (0, None))[1] == job[1]]
+            if not jobs:
+                return
+
+            db = self._db
+            db_jobs = [job for job in jobs if db is not None and db.namespace_for(job[0])]
+            file_jobs = [job for job in jobs if job not in db_jobs]
+            done = {}
+
+            if db_jobs:
+                try:
+                    db.save_documents({db.namespace_for(key): data for key, _, data in db_jobs})
+                    for key, version, _ in db_jobs:
+                        done[key] = (version, _DB)
+                except sqlite3.Error as e:
+                    log.error(msg=f"Failed to save settings: {e}")
+                    for key, version, _ in db_jobs:
+                        done[key] = (version, None)
+
+            for key, version, data in file_jobs:
+                try:
+                    self._write_json_file(key, data)
+                    done[key] = (version, self._signature(key))
+                except OSError as e:
+                    log.error(msg=f'Failed to write config "{key}": {e}')
+                    done[key] = (version, None)
+
+            with self._lock:
+                for key, (version, signature) in done.items():
+                    # A newer change arrived meanwhile: keep it pending
+                    if self._pending.get(key, (0, None))[1] != version:
+                        continue
+                    if signature is not None:
+                        del self._pending[key]
+                        self._failures.pop(key, None)
+                        self._unsaved.discard(key)
+                        self.writes += 1
+                        self._cache[key] = (signature[0], signature[1], self._cache[key][2])
+                        continue
+                    self._retry_later(key, version)
+
+    def _retry_later(self, key, version):
+        """Reschedules a failed write; called with the lock held."""
+        failures = self._failures.get(key, 0) + 1
+        if failures <= MAX_RETRIES:
+            self._failures[key] = failures
+            delay = min(MAX_RETRY_DELAY, self.debounce * 2 ** failures)
+            self._pending[key] = (time.monotonic() + delay, version)
+            log.warning(msg=f'Retrying to save "{key}" in {delay:.1f} s ({failures}/{MAX_RETRIES})')
+            return
+        # Given up: the in-memory document stays authoritative, _load never re-parses the file
+        del self._pending[key]
+        self._failures.pop(key, None)
+        self._unsaved.add(key)
+        log.error(msg=f'Giving up saving "{key}" after {MAX_RETRIES} retries, the change is kept in memory')
+
+    @staticmethod
+    def _write_json_file(key, data):
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        tmp_path = f"{key}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, key)
+
+    def flush(self):
+        """Synchronously persists all pending documents (shutdown path)."""
+        with self._lock:
+            jobs = self._snapshot_jobs(list(self._pending))
+        self._persist(jobs)
+        if jobs:
+            log.debug(msg=f"config store flushed {len(jobs)} document(s)")
+
+    def invalidate(self, path=None):
+        """Drops cached JSON files (database documents and pending writes are kept)."""
+        with self._lock:
+            keys = list(self._cache) if path is None else [self._key(path)]
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is None or key in self._pending or key in self._unsaved or cached[:2] == _DB:
+                    continue
+                del self._cache[key]
+
+    def log_stats(self):
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0
+        log.info(msg=f"config cache: {self.hits} hits, {self.misses} misses ({ratio:.1f}% hit rate), "
+                     f"{len(self._cache)} documents cached, {self.writes} writes, "
+                     f"{self.coalesced} changes coalesced")
+
+
+def _diff(old, new):
+    """Top-level keys that differ between two documents."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {}
+    changes = {key: value for key, value in new.items()
+               if key not in old or old[key] != value}
+    changes.update({key: REMOVED for key in old if key not in new})
+    return changes
+
+
+store = ConfigStore()
+atexit.register(store.flush)
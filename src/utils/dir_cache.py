@@ -0,0 +1,143 @@
+"""
+Cached directory listings.
+
+Directories are read with os.scandir (file type comes from the directory
+entry, no extra stat per file) and cached by directory mtime: a listing is
+reused while the mtime of the directory - and, for recursive listings, of
+every subdirectory - is unchanged.
+
+With enable_watcher() a QFileSystemWatcher also drops the listing of a
+directory when it reports a change. The mtime check still runs for watched
+directories: the notification arrives on a later event loop pass.
+prefetch() warms the cache in a background thread so large workspace and
+theme directories are never scanned on the UI thread.
+"""
+
+import fnmatch
+import os
+import threading
+import services.logger as log
+
+
+class DirectoryCache:
+    """Files of directories keyed by absolute path, validated by mtime."""
+
+    def __init__(self):
+        # directory -> (mtime_ns, [(name, path)], [subdirectories])
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._watched = set()
+        self.hits = 0
+        self.scans = 0
+
+    def _scan_dir(self, folder):
+        """One directory level: (mtime_ns, files, subdirectories)."""
+        mtime = os.stat(folder).st_mtime_ns
+        files, dirs = [], []
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        files.append((entry.name, entry.path))
+                    elif entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                except OSError:
+                    continue
+        files.sort()
+        dirs.sort()
+        return mtime, files, dirs
+
+    def _level(self, folder):
+        """Cached (files, subdirectories) of one directory."""
+        with self._lock:
+            cached = self._entries.get(folder)
+        if cached is not None:
+            # Also for watched folders: the watcher notifies asynchronously,
+            # a file created in this event loop pass is only seen by the mtime
+            try:
+                if os.stat(folder).st_mtime_ns == cached[0]:
+                    self.hits += 1
+                    # Listings prefetched off the UI thread start being watched here
+                    self._watch(folder)
+                    return cached[1], cached[2]
+            except OSError:
+                self.invalidate(folder)
+                return [], []
+
+        try:
+            mtime, files, dirs = self._scan_dir(folder)
+        except OSError as e:
+            log.debug(msg=f'Directory scan failed "{folder}": {e}')
+            return [], []
+        with self._lock:
+            self._entries[folder] = (mtime, files, dirs)
+            self.scans += 1
+        self._watch(folder)
+        return files, dirs
+
+    def files(self, folder, recursive=False):
+        """[(name, path)] of files in folder (and its subdirectories if recursive)."""
+        folder = os.path.abspath(folder)
+        if not os.path.isdir(folder):
+            return []
+        result = []
+        pending = [folder]
+        while pending:
+            files, dirs = self._level(pending.pop())
+            result.extend(files)
+            if recursive:
+                pending.extend(reversed(dirs))
+        return result
+
+    def glob(self, folder, pattern, recursive=False):
+        """files() filtered by a shell pattern on the file name ("*.json")."""
+        return [(name, path) for name, path in self.files(folder, recursive)
+                if fnmatch.fnmatchcase(name, pattern)]
+
+    def invalidate(self, folder=None):
+        with self._lock:
+            if folder is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(folder), None)
+
+    def enable_watcher(self):
+        """Invalidate on QFileSystemWatcher notifications (needs a QApplication)."""
+        from PySide6.QtCore import QFileSystemWatcher
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher()
+            self._watcher.directoryChanged.connect(self._on_directory_changed)
+            with self._lock:
+                folders = list(self._entries)
+            for folder in folders:
+                self._watch(folder)
+
+    def _on_directory_changed(self, folder):
+        self.invalidate(folder)
+        # A removed directory is dropped by the watcher: watch it again once it is rescanned
+        if folder not in self._watcher.directories():
+            with self._lock:
+                self._watched.discard(os.path.abspath(folder))
+
+    def _watch(self, folder):
+        # QFileSystemWatcher belongs to the UI thread; prefetch threads only fill the cache
+        if self._watcher is None or threading.current_thread() is not threading.main_thread():
+            return
+        with self._lock:
+            if folder in self._watched:
+                return
+            self._watched.add(folder)
+        self._watcher.addPath(folder)
+
+    def prefetch(self, *folders, recursive=False):
+        """Scans folders in a background thread."""
+        def run():
+            for folder in folders:
+                self.files(folder, recursive)
+        thread = threading.Thread(target=run, name="DirectoryPrefetch", daemon=True)
+        thread.start()
+        return thread
+
+
+cache = DirectoryCache()
@@ -0,0 +1,193 @@
+"""
+LRU cache of the documents opened in the editor.
+
+A cached document keeps everything needed to show it again instantly: the
+text buffer with its undo stack (the editor's QTextDocument), the cursor
+and the scroll position. Documents are kept in least-recently-used order
+within a memory budget ("document_cache_mb" in config.json, followed live
+through the config bus). Over the budget the least recently used documents
+are evicted to a lightweight descriptor - path, file stamp, encoding,
+cursor and scroll - and reloaded from disk on demand. Documents with
+unsaved changes and the pinned (shown) document are never evicted.
+
+Every entry remembers the (mtime_ns, size) of its file when it was read;
+is_stale() compares it with the file on disk.
+
+The module does not depend on Qt: the buffer object and its memory
+estimate (estimate_memory) are supplied by the editor.
+"""
+
+import os
+from collections import OrderedDict
+import services.logger as log
+
+DEFAULT_BUDGET_MB = 256
+CONFIG_KEY = "document_cache_mb"
+
+# QTextDocument keeps UTF-16 text plus per-block (line) layout data
+BYTES_PER_CHAR = 2
+BYTES_PER_BLOCK = 120
+
+
+def estimate_memory(characters, blocks):
+    """Approximate memory of a text buffer in bytes"""
+    return characters * BYTES_PER_CHAR + blocks * BYTES_PER_BLOCK
+
+
+def file_stamp(path):
+    """(mtime_ns, size) of a file, None if it cannot be read"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DocumentState:
+    """
+    One document of the cache.
+
+    Attributes:
+        buffer: text buffer (QTextDocument); None once evicted
+        stamp: (mtime_ns, size) of the file when it was read
+        encoding: encoding the file was decoded with
+        cursor, anchor: cursor position and selection anchor
+        scroll: (horizontal, vertical) scroll bar values
+        memory: estimated bytes of the buffer
+    """
+
+    __slots__ = ("path", "buffer", "stamp", "encoding", "cursor", "anchor", "scroll", "memory")
+
+    def __init__(self, path, buffer=None, stamp=None, encoding=None, memory=0):
+        self.path = path
+        self.buffer = buffer
+        self.stamp = stamp
+        self.encoding = encoding
+        self.cursor = 0
+        self.anchor = 0
+        self.scroll = (0, 0)
+        self.memory = memory
+
+    @property
+    def loaded(self):
+        return self.buffer is not None
+
+    def is_stale(self):
+        """True if the file changed on disk since it was read"""
+        return file_stamp(self.path) != self.stamp
+
+
+class DocumentCache:
+    """Loaded documents in LRU order plus descriptors of the evicted ones"""
+
+    def __init__(self, budget_mb=DEFAULT_BUDGET_MB, on_evict=None, is_modified=None):
+        self.budget = int(budget_mb * 1024 * 1024)
+        # on_evict(buffer) releases a buffer, is_modified(buffer) pins it
+        self.on_evict = on_evict
+        self.is_modified = is_modified or (lambda buffer: False)
+        self._loaded = OrderedDict()
+        self._evicted = {}
+        # Path of the document on screen
+        self.pinned = None
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, path):
+        return path in self._loaded
+
+    def __len__(self):
+        return len(self._loaded)
+
+    def get(self, path):
+        """Loaded state of path (now the most recently used) or None"""
+        state = self._loaded.get(path)
+        if state is None:
+            self.misses += 1
+            return None
+        self._loaded.move_to_end(path)
+        self.hits += 1
+        return state
+
+    def pin(self, path):
+        """Protects the document shown by the editor from eviction (None - nothing shown)"""
+        self.pinned = path
+
+    def descriptor(self, path):
+        """State of an evicted document (cursor, scroll, encoding) or None"""
+        return self._evicted.get(path)
+
+    def put(self, state):
+        """Adds or replaces a loaded document, then evicts over the budget"""
+        self.discard(state.path, release=state.buffer)
+        self._evicted.pop(state.path, None)
+        self._loaded[state.path] = state
+        self.memory += state.memory
+        self._evict(keep=state.path)
+
+    def offer(self, state):
+        """
+        Adds a prefetched document only if it fits in the budget without
+        evicting anything; it becomes the least recently used entry.
+        Returns False (and releases the buffer) otherwise.
+        """
+        if state.path in self._loaded or self.memory + state.memory > self.budget:
+            self._release(state.buffer)
+            return False
+        self._evicted.pop(state.path, None)
+        self._loaded[state.path] = state
+        self._loaded.move_to_end(state.path, last=False)
+        self.memory += state.memory
+        return True
+
+    def free_memory(self):
+        return max(0, self.budget - self.memory)
+
+    def update_memory(self, path, memory):
+        """New memory estimate of a loaded document (e.g. after editing)"""
+        state = self._loaded.get(path)
+        if state is not None:
+            self.memory += memory - state.memory
+            state.memory = memory
+            self._evict(keep=path)
+
+    def discard(self, path, release=None):
+        """Forgets path; its buffer is released unless it is release"""
+        state = self._loaded.pop(path, None)
+        self._evicted.pop(path, None)
+        if state is not None:
+            self.memory -= state.memory
+            if state.buffer is not release:
+                self._release(state.buffer)
+
+    def set_budget(self, budget_mb):
+        self.budget = int(budget_mb * 1024 * 1024)
+        log.debug(msg=f'Document cache budget: {budget_mb} MB')
+        self._evict()
+
+    def _release(self, buffer):
+        if buffer is not None and self.on_evict is not None:
+            self.on_evict(buffer)
+
+    def _evict(self, keep=None):
+        """Evicts least recently used documents until the budget is met"""
+        if self.memory <= self.budget:
+            return
+        for path in list(self._loaded):
+            if self.memory <= self.budget:
+                break
+            state = self._loaded[path]
+            if path == keep or path == self.pinned or self.is_modified(state.buffer):
+                continue
+            del self._loaded[path]
+            self.memory -= state.memory
+            self._release(state.buffer)
+            state.buffer = None
+            state.memory = 0
+            self._evicted[path] = state
+            self.evictions += 1
+            log.debug(msg=f'Document evicted from cache: "{path}"')
+        if self.memory > self.budget:
+            log.debug(msg=f'Document cache over budget: {self.memory // 1024} KiB '
+                          f'(shown or modified documents are kept)')
@@ -4,18 +4,15 @@ import json
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QFileDialog)
 from PySide6.QtCore import Qt
 import services.logger as log
+from utils.config_store import store
+from utils.dir_cache import cache as dir_cache
 
 """The script is primarily for manipulating JSON files. Its functions are widely used"""
 
 def load_theme():
-    config_path = os.path.join(get_project_root(), 'config', 'config.json')
-    themes_path =os.path.join(get_project_root(), 'resources', 'themes')
-    theme_name = get_json_property(config_path, "theme") or "default"
-    theme_file = os.path.join(themes_path, f"{theme_name}.json")
-    
-    log.debug(msg=f'Selected theme: {theme_name}')
-    # TODO: make debug on get_json_property()
-    return get_json_property(theme_file) or get_fallback_theme()
+    """Returns the selected theme with derived colors (see utils.theme_engine)"""
+    import utils.theme_engine as theme_engine
+    return theme_engine.get_engine().load()
 
 def get_fallback_theme():
     return {
@@ -58,14 +55,11 @@ def get_json_property(path, preference_name=""):
     """Returns values from JSON file:
 
     - If "preference_name" specified, returns only that key's value
-    - Otherwise returns a list"""
+    - Otherwise returns a list
+    
+    Files are parsed once and served from utils.config_store afterwards"""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            if preference_name == "":
-                log.debug(msg=f'returned all the values from "{path}"')
-                return json.load(f)
-            log.debug(msg=f'returned "{preference_name}" value from "{path}"')
-            return json.load(f).get(preference_name)
+        return store.get(path, preference_name)
     except FileNotFoundError:
         log.error(msg=f"JSON file not found: {path}")
     except json.JSONDecodeError as e:
@@ -76,11 +70,8 @@ def get_json_property(path, preference_name=""):
 def replace_json_content(path_from, path_to): 
     """Completely replaces contents of one JSON file with another JSON file"""
     try:
-        with open(path_from, 'r', encoding='utf-8') as source_file:
-            data_to_copy = json.load(source_file)
-        
-        with open(path_to, 'w', encoding='utf-8') as target_file:
-            json.dump(data_to_copy, target_file, indent=2, ensure_ascii=False)
+        data_to_copy = store.get(path_from)
+        store.write(path_to, data_to_copy)
         
         log.debug(msg=f'Space changed: JSON rewritten successfully.\tFrom "{path_from}\t"{data_to_copy}"\tTo "{[path_to]}"')
     
@@ -98,13 +89,8 @@ def add_json_property(path, property, value):
             log.error(msg=f'invalid_key_name "{property}"')
             return
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        data[property] = value
-
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # In-memory update, written to disk by the config store (write-behind)
+        store.set_key(path, property, value)
 
     except FileNotFoundError:
         log.error(msg='JSON file not found')
@@ -121,22 +107,10 @@ def remove_json_property(path, property):
             log.error(msg=f'invalid_key_name "{property}"')
             return
 
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if property in data:
-            del data[property]
+        if store.remove_key(path, property):
             log.debug(msg=f'Successfully removed "{property}" property from "{path}"')
         else:
             log.error(msg=f'"{property}" property not found')
-        
-        for j in list(data.keys()):
-            count = 0
-            if f'{property[property.find("/") + 1:]}' in j:
-                count += 1
-
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
 
     except FileNotFoundError:
         log.error(msg=f'JSON file not found "{property}"')
@@ -147,15 +121,16 @@ def remove_json_property(path, property):
 
 def save_config(path, data):
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        store.write(path, data)
     except FileNotFoundError:
         log.error(f'file not found "{path}"')
     except Exception as e:
         log.error(f'file not found. eroor: "{e}"')
     
-def get_files_from_directory(folder_path, endswith=None):
-    """Returns files from directory. If endswith provided, filters by file extension"""
+def get_files_from_directory(folder_path, endswith=None, recursive=False):
+    """Returns files from directory. If endswith provided, filters by file extension
+
+    Listings come from utils.dir_cache (os.scandir, cached by directory mtime)"""
     current_files = {}
     
     if not os.path.exists(folder_path):
@@ -164,18 +139,14 @@ def get_files_from_directory(folder_path, endswith=None):
     if endswith:
         if not endswith.startswith('.'):
             endswith = '.' + endswith
+        files = dir_cache.glob(folder_path, '*' + endswith, recursive=recursive)
+    else:
+        files = dir_cache.files(folder_path, recursive=recursive)
     
-    for filename in os.listdir(folder_path):
-        file_path = os.path.join(folder_path, filename)
-        
-        if os.path.isfile(file_path):
-            name_without_extension = os.path.splitext(filename)[0]
-            
-            if endswith:
-                if filename.endswith(endswith):
-                    current_files[name_without_extension] = file_path
-            else:
-                current_files[name_without_extension] = file_path
+    for filename, file_path in files:
+        name_without_extension = os.path.splitext(filename)[0]
+        current_files[name_without_extension] = file_path
+
     if endswith:
         log.debug(msg=f'Files from the "{folder_path}" directory with the extension "{endswith}" were successfully scanned')
     else:
@@ -0,0 +1,231 @@
+"""
+Localization service.
+
+A catalog is the strings of resources/language/<lang>.json merged over its
+fallback chain (FALLBACKS, then "eng"), so a key missing from rus.json
+resolves to the English string at compile time, not at lookup time. The
+compiled catalog is cached in cache/i18n/<lang>.json together with the
+(mtime_ns, size) of every source; the cache is used while the sources are
+unchanged. Only the current language is compiled - on first use.
+
+Widgets keep indexing the catalog as a dict (self.lang["Tools"]). A key
+missing from every source returns the key itself instead of raising.
+
+Live switching: a change of "lang" in config.json (config bus) compiles the
+new catalog and updates the one Catalog object in place, so widgets and
+panels created later read the new strings. Texts already shown are pushed
+to the setters registered with bind(); widgets whose texts depend on their
+state register a listener (e.g. retranslate()). No widget is rebuilt.
+"""
+
+import json
+import os
+import time
+import services.logger as log
+import services.tracing as tracing
+import utils.helpers as helpers
+
+CATALOG_VERSION = 1
+BASE_LANGUAGE = "eng"
+LANGUAGE_DIR = os.path.join("resources", "language")
+CACHE_DIR = os.path.join("cache", "i18n")
+
+# Language -> language used for its missing keys (BASE_LANGUAGE ends every chain)
+FALLBACKS = {
+    "rus": "eng",
+}
+
+
+class Catalog(dict):
+    """Compiled strings of one language; missing keys return the key"""
+
+    def __init__(self, language=None, strings=None):
+        super().__init__(strings or {})
+        self.language = language
+        self._reported = set()
+
+    def __missing__(self, key):
+        if key not in self._reported:
+            self._reported.add(key)
+            log.warning(msg=f'Missing translation "{key}" ({self.language})')
+        return key
+
+
+def fallback_chain(language):
+    """[language, fallback, ..., BASE_LANGUAGE] without repetitions"""
+    chain = []
+    while language and language not in chain:
+        chain.append(language)
+        language = FALLBACKS.get(language, BASE_LANGUAGE)
+    return chain
+
+
+class Localization:
+    """Compiles catalogs and pushes strings to bound widgets"""
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.catalog = None
+        self._bindings = []
+        self._listeners = []
+
+    def _source_path(self, language):
+        return os.path.join(self.base_path, LANGUAGE_DIR, f"{language}.json")
+
+    def _signature(self, chain):
+        """[[language, mtime_ns, size]] of the existing sources of the chain"""
+        signature = []
+        for language in chain:
+            try:
+                stat = os.stat(self._source_path(language))
+            except OSError:
+                continue
+            signature.append([language, stat.st_mtime_ns, stat.st_size])
+        return signature
+
+    def compile(self, language):
+        """Returns the strings of language merged over its fallbacks (disk cached)"""
+        chain = fallback_chain(language)
+        signature = self._signature(chain)
+        cache_path = os.path.join(self.base_path, CACHE_DIR, f"{language}.json")
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("version") == CATALOG_VERSION and cached.get("sources") == signature:
+                return cached["strings"]
+        except (OSError, ValueError):
+            pass
+
+        sources = [source for source, _, _ in signature]
+        if language not in sources:
+            log.warning(msg=f'Language "{language}" not found, falling back to {chain[1:] or BASE_LANGUAGE}')
+
+        strings = {}
+        for source in reversed(sources):
+            strings.update(helpers.get_json_property(self._source_path(source)) or {})
+
+        if language in sources:
+            missing = len(strings) - len(helpers.get_json_property(self._source_path(language)) or {})
+            if missing > 0:
+                log.debug(msg=f'Catalog "{language}": {missing} strings taken from fallbacks {chain[1:]}')
+
+        self._save(cache_path, {"version": CATALOG_VERSION, "sources": signature, "strings": strings})
+        return strings
+
+    def _save(self, path, data):
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(msg=f'Failed to cache catalog "{path}": {e}')
+
+    def load(self, language=None):
+        """Compiles the language (config "lang" by default); returns the shared Catalog"""
+        if language is None:
+            config_path = os.path.join(self.base_path, "config", "config.json")
+            language = helpers.get_json_property(config_path, "lang") or BASE_LANGUAGE
+
+        strings = self.compile(language)
+        if self.catalog is None:
+            self.catalog = Catalog(language, strings)
+        else:
+            # Same dict object: widgets holding the catalog see the new strings
+            self.catalog.clear()
+            self.catalog.update(strings)
+            self.catalog.language = language
+            self.catalog._reported.clear()
+        log.info(msg=f'Selected language: "{language}"')
+        return self.catalog
+
+    def get_catalog(self):
+        if self.catalog is None:
+            self.load()
+        return self.catalog
+
+    def bind(self, setter, key):
+        """Calls setter(text of key) now and after every language switch"""
+        setter(self.get_catalog()[key])
+        self._bindings.append((setter, key))
+
+    def add_listener(self, listener):
+        """listener() is called after a language switch"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners = [l for l in self._listeners if l != listener]
+
+    def release(self, widget):
+        """Drops the bindings and listeners of widget and its children (before deleting it)"""
+        owned = lambda callback: self._owned_by(callback, widget)
+        self._bindings = [(setter, key) for setter, key in self._bindings if not owned(setter)]
+        self._listeners = [listener for listener in self._listeners if not owned(listener)]
+
+    @staticmethod
+    def _owned_by(callback, widget):
+        owner = getattr(callback, "__self__", None)
+        if owner is None:
+            return False
+        try:
+            return owner is widget or (hasattr(owner, "isWidgetType") and owner.isWidgetType()
+                                       and widget.isAncestorOf(owner))
+        except RuntimeError:
+            # Already deleted by Qt: drop it as well
+            return True
+
+    def watch_config(self):
+        """Switches the language live when "lang" changes in config.json"""
+        from utils.config_bus import bus
+        bus().subscribe(
+            os.path.join(self.base_path, "config", "config.json"),
+            self.on_lang_config_changed,
+            key="lang"
+        )
+
+    def on_lang_config_changed(self, key, value):
+        from utils.config_store import REMOVED
+        self.switch(None if value is REMOVED else value)
+
+    @tracing.traced(category="ui")
+    def switch(self, language=None):
+        """Loads another language and pushes its strings to the bound widgets"""
+        start = time.perf_counter()
+        catalog = self.load(language)
+
+        alive = []
+        for setter, key in self._bindings:
+            if self._call(setter, catalog[key]):
+                alive.append((setter, key))
+        self._bindings = alive
+        self._listeners = [listener for listener in self._listeners if self._call(listener)]
+
+        log.info(msg=f'Language switched to "{catalog.language}" in {(time.perf_counter() - start) * 1000:.1f} ms '
+                     f'({len(alive)} bound texts)')
+
+    def _call(self, callback, *args):
+        """False if the receiver widget was already deleted by Qt"""
+        try:
+            callback(*args)
+        except RuntimeError as e:
+            if "already deleted" not in str(e):
+                raise
+            return False
+        return True
+
+
+_localization = None
+
+def get_localization():
+    """Returns the localization service, created on first use"""
+    global _localization
+    if _localization is None:
+        _localization = Localization(helpers.get_project_root())
+    return _localization
+
+
+def bind(setter, key):
+    """Shortcut for get_localization().bind()"""
+    get_localization().bind(setter, key)
@@ -0,0 +1,90 @@
+"""
+Session restore.
+
+The tabs of tabs_config are restored as metadata only: names and paths in
+the TabModel, painted by the tab bar, no file is opened or stat'ed. At
+startup only the document of the active tab ("active_tab" in config.json)
+is loaded, by the editor's background loader; every other tab is read on
+its first activation. Startup therefore does not grow with the number of
+tabs of a workspace.
+
+Once the active document is shown and the window has been idle for
+PREFETCH_DELAY_MS, the next "session_prefetch_tabs" tabs in tab order
+(default 2, 0 disables it) are prefetched into the document cache one at a
+time, as long as they fit in its free budget. Activating a tab stops the
+prefetch.
+"""
+
+import os
+from PySide6.QtCore import QObject, QTimer
+import services.logger as log
+import utils.helpers as helpers
+from utils.config_store import store
+
+ACTIVE_TAB_KEY = "active_tab"
+PREFETCH_KEY = "session_prefetch_tabs"
+DEFAULT_PREFETCH = 2
+PREFETCH_DELAY_MS = 500
+
+
+class Session(QObject):
+    """Restores the active tab of a TabModel into the editor and prefetches the next ones"""
+
+    def __init__(self, model, editor, config_path, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.editor = editor
+        self.config_path = config_path
+        self._restored_path = None
+        self._queue = []
+        model.active_changed.connect(self.on_active_changed)
+        editor.document_ready.connect(self.on_document_ready)
+        editor.prefetch_finished.connect(self.on_prefetch_finished)
+
+    def restore(self):
+        """Loads the document of the active tab; the other tabs stay placeholders"""
+        active = helpers.get_json_property(self.config_path, ACTIVE_TAB_KEY)
+        if not active or active not in self.model:
+            log.debug(msg=f'Session restored: {len(self.model)} tabs, no active tab')
+            return
+        path = self.model.path_of(active)
+        if not os.access(path, os.R_OK):
+            log.warning(msg=f'Active tab "{active}" is not readable: {path}')
+            return
+
+        self.model.set_active(active)
+        self._restored_path = path
+        self.editor.load_file(path)
+        log.info(msg=f'Session restored: "{active}" loading, {len(self.model) - 1} tabs deferred')
+
+    def on_active_changed(self, name):
+        # The user picked a tab: its load comes first, nothing more to prefetch
+        self._queue = []
+        if name:
+            store.set_key(self.config_path, ACTIVE_TAB_KEY, name)
+        else:
+            store.remove_key(self.config_path, ACTIVE_TAB_KEY)
+
+    def on_document_ready(self, path):
+        if path == self._restored_path:
+            self._restored_path = None
+            QTimer.singleShot(PREFETCH_DELAY_MS, self.start_prefetch)
+
+    def start_prefetch(self):
+        """Queues the tabs following the active one"""
+        count = helpers.get_json_property(self.config_path, PREFETCH_KEY)
+        count = DEFAULT_PREFETCH if count is None else count
+        if count <= 0 or self.model.active is None or self.editor.path != self.model.path_of(self.model.active):
+            return
+        names = self.model.names()
+        start = names.index(self.model.active) + 1
+        self._queue = [self.model.path_of(name) for name in names[start:start + count]]
+        self._prefetch_next()
+
+    def on_prefetch_finished(self, path, cached):
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        while self._queue:
+            if self.editor.prefetch(self._queue.pop(0)):
+                return
@@ -0,0 +1,168 @@
+"""
+SQLite settings database (config/settings.db).
+
+Replaces the scattered config/*.json files with one transactional store:
+- every former file is a namespace ("config", "tabs_config", "workspaces/work", ...)
+- every top-level key of a file is one row, the value is stored as JSON
+- WAL mode, changes of several namespaces are saved in one transaction
+
+On first open the existing JSON files are imported once; the files are
+left in place as a backup and are no longer read afterwards. The one
+exception is the shipped config/config.json: top-level keys added to it by
+a later version are merged into the "config" namespace on startup (only
+when the file changed, and never over a value already in the database).
+"""
+
+import glob
+import json
+import os
+import re
+import sqlite3
+import services.logger as log
+
+DB_NAME = "settings.db"
+DEFAULTS_FILE = "config.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    namespace TEXT NOT NULL,
+    key       TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS namespaces (
+    namespace TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _parse_json_with_comments(text):
+    """json.loads that tolerates // line comments (config/settings.json has them)."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(re.sub(r'//[^\n"]*$', '', text, flags=re.MULTILINE))
+
+
+class SettingsDatabase:
+    """Namespaced key/value settings stored in SQLite."""
+
+    def __init__(self, config_root):
+        self.config_root = config_root
+        self.path = os.path.join(config_root, DB_NAME)
+        os.makedirs(config_root, exist_ok=True)
+        # Used by the UI thread at startup and by the config writer thread afterwards,
+        # access is serialized by ConfigStore
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self._import_json_once()
+        self._merge_new_defaults()
+
+    def namespace_for(self, path):
+        """Maps config/<name>.json to namespace "<name>", None for other paths."""
+        relative = os.path.relpath(os.path.abspath(path), self.config_root)
+        if relative.startswith("..") or not relative.endswith(".json"):
+            return None
+        return relative[:-len(".json")].replace(os.sep, "/")
+
+    def load_all(self):
+        """Returns {namespace: document} for every stored namespace."""
+        documents = {name: {} for (name,) in self.connection.execute(
+            "SELECT namespace FROM namespaces")}
+        for namespace, key, value in self.connection.execute(
+                "SELECT namespace, key, value FROM settings"):
+            documents.setdefault(namespace, {})[key] = json.loads(value)
+        return documents
+
+    def save_documents(self, documents):
+        """Replaces the given namespaces in one transaction ({namespace: dict})."""
+        with self.connection:
+            self._write_documents(documents)
+
+    def _write_documents(self, documents):
+        for namespace, data in documents.items():
+            self.connection.execute(
+                "INSERT OR IGNORE INTO namespaces (namespace) VALUES (?)", (namespace,))
+            self.connection.execute(
+                "DELETE FROM settings WHERE namespace = ?", (namespace,))
+            self.connection.executemany(
+                "INSERT INTO settings (namespace, key, value) VALUES (?, ?, ?)",
+                [(namespace, key, json.dumps(value, ensure_ascii=False))
+                 for key, value in data.items()]
+            )
+
+    def _import_json_once(self):
+        """Imports config/*.json and config/workspaces/*.json on the first open."""
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'json_imported'").fetchone()
+        if row is not None:
+            return
+
+        documents = {}
+        paths = glob.glob(os.path.join(self.config_root, "*.json"))
+        paths += glob.glob(os.path.join(self.config_root, "workspaces", "*.json"))
+        for path in sorted(paths):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = _parse_json_with_comments(f.read())
+            except (OSError, json.JSONDecodeError) as e:
+                log.warning(msg=f'Settings import skipped "{path}": {e}')
+                continue
+            if isinstance(data, dict):
+                documents[self.namespace_for(path)] = data
+
+        # Import and the "done" marker commit together
+        with self.connection:
+            self._write_documents(documents)
+            self.connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_imported', '1')")
+        log.info(msg=f'Imported {len(documents)} config files into "{self.path}"')
+
+    def _merge_new_defaults(self):
+        """Adds keys that appeared in the shipped config.json since the last start."""
+        path = os.path.join(self.config_root, DEFAULTS_FILE)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+        meta = dict(self.connection.execute(
+            "SELECT key, value FROM meta WHERE key IN ('defaults_stamp', 'defaults_keys')"))
+        if meta.get('defaults_stamp') == stamp:
+            return
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = _parse_json_with_comments(f.read())
+        except (OSError, json.JSONDecodeError) as e:
+            log.warning(msg=f'Settings defaults skipped "{path}": {e}')
+            return
+        if not isinstance(data, dict):
+            return
+
+        # Keys merged before are not brought back after the user removed them
+        known = set(json.loads(meta.get('defaults_keys', '[]')))
+        namespace = self.namespace_for(path)
+        new = {key: value for key, value in data.items() if key not in known}
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO namespaces (namespace) VALUES (?)", (namespace,))
+            added = sum(self.connection.execute(
+                "INSERT OR IGNORE INTO settings (namespace, key, value) VALUES (?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False))).rowcount
+                for key, value in new.items())
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [('defaults_stamp', stamp), ('defaults_keys', json.dumps(sorted(known | set(data))))]
+            )
+        if added:
+            log.info(msg=f'Added {added} new default settings from "{path}"')
+
+    def close(self):
+        self.connection.close()
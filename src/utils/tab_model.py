@@ -0,0 +1,152 @@
+"""
+Ordered model of the open tabs (config/tabs_config.json: {name: file path}).
+
+The view does not rebuild itself from the config: it reacts to the model
+signals, which report single rows - inserted, removed, moved or changed.
+
+- add/remove/move change the model first, then persist through the config
+  store (in memory at once, written to disk by its background writer)
+- the active tab (the one shown in the editor) is kept in memory only;
+  utils.session persists and restores it
+- external changes of tabs_config (e.g. a workspace switch replacing the
+  whole document) arrive through the config bus; one sync() per event loop
+  iteration diffs the document against the model and emits only the
+  differences. The model's own writes produce an empty diff.
+"""
+
+from PySide6.QtCore import QObject, Signal, QTimer
+import services.logger as log
+import utils.helpers as helpers
+from utils.config_store import store
+from utils.config_bus import bus
+
+
+class TabModel(QObject):
+    """Tab names in display order and their file paths"""
+
+    tab_inserted = Signal(int, str)
+    tab_removed = Signal(int, str)
+    tab_moved = Signal(int, int)
+    tab_changed = Signal(int, str)
+    active_changed = Signal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._names = []
+        self._paths = {}
+        self.active = None
+        self._sync_scheduled = False
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._paths
+
+    def names(self):
+        return list(self._names)
+
+    def path_of(self, name):
+        return self._paths.get(name)
+
+    def index_of(self, name):
+        return self._names.index(name)
+
+    def set_active(self, name):
+        """Marks the tab shown in the editor (None - no tab)"""
+        if name != self.active and (name is None or name in self._paths):
+            self.active = name
+            self.active_changed.emit(name or "")
+
+    def to_dict(self):
+        return {name: self._paths[name] for name in self._names}
+
+    def load(self):
+        """Reads the tabs from the config and follows its later changes"""
+        self.sync(helpers.get_json_property(self.path) or {})
+        bus().subscribe(self.path, self.on_config_changed)
+
+    # Changes made by the application
+
+    def add(self, name, path):
+        """Appends a tab (or updates its path); returns its index"""
+        if name in self._paths:
+            self._set_path(name, path)
+        else:
+            self._insert(len(self._names), name, path)
+        store.set_key(self.path, name, path)
+        return self.index_of(name)
+
+    def remove(self, name):
+        if name not in self._paths:
+            return False
+        self._remove(name)
+        store.remove_key(self.path, name)
+        return True
+
+    def move(self, name, index):
+        """Moves a tab to index (clamped to the valid range)"""
+        index = max(0, min(index, len(self._names) - 1))
+        if self._move(name, index):
+            store.write(self.path, self.to_dict())
+
+    # Rows, each with exactly one signal
+
+    def _insert(self, index, name, path):
+        self._names.insert(index, name)
+        self._paths[name] = path
+        self.tab_inserted.emit(index, name)
+
+    def _remove(self, name):
+        index = self._names.index(name)
+        del self._names[index]
+        del self._paths[name]
+        self.tab_removed.emit(index, name)
+        if name == self.active:
+            self.set_active(None)
+
+    def _move(self, name, index):
+        current = self._names.index(name)
+        if current == index:
+            return False
+        del self._names[current]
+        self._names.insert(index, name)
+        self.tab_moved.emit(current, index)
+        return True
+
+    def _set_path(self, name, path):
+        if self._paths[name] != path:
+            self._paths[name] = path
+            self.tab_changed.emit(self._names.index(name), name)
+
+    # Changes from the config
+
+    def on_config_changed(self, key, value):
+        """Coalesces the changed keys of one bus batch into a single sync()"""
+        if not self._sync_scheduled:
+            self._sync_scheduled = True
+            QTimer.singleShot(0, self._sync_from_store)
+
+    def _sync_from_store(self):
+        self._sync_scheduled = False
+        self.sync(helpers.get_json_property(self.path) or {})
+
+    def sync(self, tabs):
+        """Applies the differences between the model and tabs ({name: path}, in order)"""
+        removed = [name for name in self._names if name not in tabs]
+        for name in removed:
+            self._remove(name)
+
+        inserted = moved = 0
+        for index, (name, path) in enumerate(tabs.items()):
+            if name not in self._paths:
+                self._insert(index, name, path)
+                inserted += 1
+                continue
+            self._set_path(name, path)
+            if self._names[index] != name and self._move(name, index):
+                moved += 1
+
+        if removed or inserted or moved:
+            log.debug(msg=f'Tabs synced: {inserted} inserted, {len(removed)} removed, {moved} moved')
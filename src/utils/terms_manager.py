@@ -1,6 +1,7 @@
 import json
 import os
 import utils.helpers as helpers
+from utils.config_store import store
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, QTextEdit, QHBoxLayout)
 from PySide6.QtCore import Qt
 
@@ -32,16 +33,11 @@ class TermsManager:
         return False
 
     def save_config(self):
-        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+        store.write(self.config_path, self.config_data)
     
     def _ensure_config_exists(self):
-        """Создаёт config.json с дефолтными значениями, если его нет."""
-        if not os.path.exists(self.config_path):
-            # Создаём папку config если нужно
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            
+        """Создаёт config с дефолтными значениями, если его нет (settings.db или config.json)."""
+        if not store.exists(self.config_path):
             default_config = {
                 "termsAccepted": False,
                 "theme": "dark_theme",
@@ -50,26 +46,17 @@ class TermsManager:
                 "lang": "eng"
             }
             
-            try:
-                with open(self.config_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=2, ensure_ascii=False)
-                print(f"Created default config at {self.config_path}")
-            except Exception as e:
-                print(f"Failed to create config: {e}")
-                # Можно создать минимальный конфиг в оперативке
-                self.config_data = default_config.copy()
+            store.write(self.config_path, default_config)
+            print(f"Created default config at {self.config_path}")
         else:
             # Проверяем что есть обязательное поле termsAccepted
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    existing_config = json.load(f)
+                existing_config = store.get(self.config_path)
                 
                 if "termsAccepted" not in existing_config:
-                    existing_config["termsAccepted"] = False
-                    with open(self.config_path, 'w', encoding='utf-8') as f:
-                        json.dump(existing_config, f, indent=2, ensure_ascii=False)
+                    store.set_key(self.config_path, "termsAccepted", False)
             except (json.JSONDecodeError, IOError):
-                # Если файл битый - пересоздаём
+                # Если файл битый - пересоздаём (только без settings.db)
                 self._recreate_config()
     
     def _recreate_config(self):
@@ -79,6 +66,7 @@ class TermsManager:
             os.rename(self.config_path, backup_path)
         except OSError:
             pass
+        store.invalidate(self.config_path)
             
         default_config = {
             "termsAccepted": False,
@@ -88,8 +76,7 @@ class TermsManager:
             "lang": "en"
         }
         
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=2, ensure_ascii=False)
+        store.write(self.config_path, default_config)
         
         print(f"Recreated config (backup at {backup_path})")
 
@@ -0,0 +1,231 @@
+"""
+Central theme engine.
+
+The theme JSON is loaded once, completed with derived values (hover colors,
+missing keys, "202020" -> "#202020", see utils.color_utils) and rendered into a single application
+stylesheet from resources/themes/templates/app.qss. The compiled QSS is cached
+in cache/qss/<hash>.qss, keyed by the tokens and the template, so a restart
+with an unchanged theme skips rendering.
+
+The stylesheet is set once on the QApplication. Widgets do not call
+setStyleSheet for theming: they set an objectName and dynamic properties
+(e.g. "class") which the template selects on. The token dict is still handed
+to widgets that paint by hand (QPainter, pyqtgraph).
+
+Live switching: a change of "theme" in config.json (config bus) reloads the
+tokens in place - every widget keeps a reference to the same dict, including
+panels created later - then sets the new stylesheet and palette in one pass.
+Qt repolishes the styled widgets itself; only the listeners (widgets that
+paint by hand) are called to re-read their colors. No widget is recreated.
+"""
+
+import hashlib
+import json
+import os
+import time
+from string import Template
+import services.logger as log
+import services.tracing as tracing
+import utils.helpers as helpers
+import utils.color_utils as color_utils
+
+ENGINE_VERSION = 1
+TEMPLATE_PATH = os.path.join("resources", "themes", "templates", "app.qss")
+CACHE_DIR = os.path.join("cache", "qss")
+
+# Fixed colors shared by every theme
+CONSTANT_TOKENS = {
+    "danger": "#993232",
+    "console_bg": "#000",
+    "scrollbar_bg": "#1a1a1a",
+    "scrollbar_border": "#2a2a2a",
+}
+
+
+def derive_tokens(theme):
+    """
+    Theme dict completed with normalized colors, missing keys and the
+    variants of utils.color_utils.palette() (<key>_hover, <key>_pressed, ...)
+    """
+    tokens = dict(CONSTANT_TOKENS)
+    tokens.update({key: color_utils.normalize(value) for key, value in theme.items()})
+
+    variants = color_utils.palette(tokens)
+    for key, source in (("accent_gray", "bg_card_hover"), ("btn_hover_bg_color", "btn_bg_color_hover")):
+        if key not in tokens and source in variants:
+            tokens[key] = variants[source]
+    # Again with the filled-in keys (memoized per color set)
+    variants = color_utils.palette(tokens)
+    variants.update(tokens)
+
+    for fg, bg, ratio in color_utils.low_contrast_pairs(variants):
+        log.warning(msg=f'Theme contrast {fg} on {bg} is {ratio:.2f}:1 (WCAG AA needs {color_utils.WCAG_AA}:1)')
+    return variants
+
+
+class ThemeEngine:
+    """Loads the selected theme and compiles the application stylesheet"""
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.theme_name = None
+        self.tokens = None
+        self.stylesheet = None
+        self._listeners = []
+
+    def load(self, theme_name=None):
+        """Loads the theme (config "theme" by default); returns the token dict"""
+        config_path = os.path.join(self.base_path, "config", "config.json")
+        self.theme_name = theme_name or helpers.get_json_property(config_path, "theme") or "default"
+        theme_file = os.path.join(self.base_path, "resources", "themes", f"{self.theme_name}.json")
+        theme = helpers.get_json_property(theme_file)
+        if not theme:
+            log.warning(msg=f'Theme "{self.theme_name}" not found, using fallback theme')
+            theme = helpers.get_fallback_theme()
+        log.debug(msg=f'Selected theme: {self.theme_name}')
+
+        tokens = derive_tokens(theme)
+        if self.tokens is None:
+            self.tokens = tokens
+        else:
+            # Same dict object: widgets holding the theme see the new colors
+            self.tokens.clear()
+            self.tokens.update(tokens)
+        self.stylesheet = None
+        return self.tokens
+
+    def _read_template(self):
+        with open(os.path.join(self.base_path, TEMPLATE_PATH), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def compile(self):
+        """Returns the application QSS for the loaded theme (disk cached)"""
+        if self.tokens is None:
+            self.load()
+        if self.stylesheet is not None:
+            return self.stylesheet
+
+        try:
+            template = self._read_template()
+        except OSError as e:
+            log.error(msg=f'Stylesheet template not found: {e}')
+            self.stylesheet = ""
+            return self.stylesheet
+
+        key = hashlib.sha1(
+            json.dumps([ENGINE_VERSION, self.tokens, template], sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        cache_path = os.path.join(self.base_path, CACHE_DIR, f"{key}.qss")
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self.stylesheet = f.read()
+            log.debug(msg=f'Stylesheet loaded from cache: {key}')
+            return self.stylesheet
+        except OSError:
+            pass
+
+        tokens = {name: value for name, value in self.tokens.items() if isinstance(value, str)}
+        try:
+            self.stylesheet = Template(template).substitute(tokens)
+        except (KeyError, ValueError) as e:
+            log.error(msg=f'Stylesheet template error, missing theme token: {e}')
+            self.stylesheet = Template(template).safe_substitute(tokens)
+            return self.stylesheet
+
+        self._save(cache_path, self.stylesheet)
+        log.debug(msg=f'Stylesheet compiled for theme "{self.theme_name}": {key}')
+        return self.stylesheet
+
+    def _save(self, path, stylesheet):
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(stylesheet)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(msg=f'Failed to cache stylesheet "{path}": {e}')
+
+    def palette(self):
+        """QPalette for widgets without stylesheet rules (dialogs, viewports, item views)"""
+        from PySide6.QtGui import QPalette, QColor
+        tokens = self.tokens
+        palette = QPalette()
+        roles = {
+            QPalette.Window: "bg_color",
+            QPalette.WindowText: "text_main",
+            QPalette.Base: "bg_card",
+            QPalette.AlternateBase: "accent_gray",
+            QPalette.Text: "text_main",
+            QPalette.PlaceholderText: "text_muted",
+            QPalette.Button: "btn_bg_color",
+            QPalette.ButtonText: "text_main",
+            QPalette.Highlight: "accent_primary",
+            QPalette.ToolTipText: "text_main",
+            QPalette.ToolTipBase: "bg_card",
+        }
+        for role, name in roles.items():
+            if tokens.get(name):
+                palette.setColor(role, QColor(tokens[name]))
+        return palette
+
+    def apply(self, app=None):
+        """Sets the compiled stylesheet and palette on the application (one style recalculation)"""
+        from PySide6.QtWidgets import QApplication
+        app = app or QApplication.instance()
+        app.setPalette(self.palette())
+        app.setStyleSheet(self.compile())
+
+    def add_listener(self, listener):
+        """listener() is called after a theme switch; for widgets that paint by hand"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners = [l for l in self._listeners if l != listener]
+
+    def watch_config(self):
+        """Switches the theme live when "theme" changes in config.json"""
+        from utils.config_bus import bus
+        bus().subscribe(
+            os.path.join(self.base_path, "config", "config.json"),
+            self.on_theme_config_changed,
+            key="theme"
+        )
+
+    def on_theme_config_changed(self, key, value):
+        from utils.config_store import REMOVED
+        self.switch(None if value is REMOVED else value)
+
+    @tracing.traced(category="ui")
+    def switch(self, theme_name=None):
+        """Loads another theme and restyles the running application without rebuilding widgets"""
+        from PySide6.QtWidgets import QApplication
+        start = time.perf_counter()
+        previous = self.stylesheet
+        self.load(theme_name)
+        stylesheet = self.compile()
+
+        app = QApplication.instance()
+        app.setPalette(self.palette())
+        if stylesheet != previous:
+            app.setStyleSheet(stylesheet)
+
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except RuntimeError as e:
+                # Widget already deleted by Qt
+                if "already deleted" not in str(e):
+                    raise
+                self.remove_listener(listener)
+        log.info(msg=f'Theme switched to "{self.theme_name}" in {(time.perf_counter() - start) * 1000:.1f} ms')
+
+
+_engine = None
+
+def get_engine():
+    """Returns the theme engine, created on first use"""
+    global _engine
+    if _engine is None:
+        _engine = ThemeEngine(helpers.get_project_root())
+    return _engine
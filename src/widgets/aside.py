@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFrame, QPushButton
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 import utils.aside_manager as al
+import utils.helpers as helpers
+import utils.localization as localization
 import os
 import services.logger as log
 from widgets.aside_panels.tools import ToolsPanel
@@ -30,24 +32,29 @@ class aside(QWidget):
         
         self.setup_ui()
         self.apply_theme()
+        self.start_panel_disposal()
     
     def create_panels(self):
-        """Create and register all content panels"""
-        # Tools panel
-        self.tools_panel = ToolsPanel(self.base_path, self.theme, lang=self.lang)
-        al.register_panel('tools', self.tools_panel)
-        
-        # Plugins panel 
-        self.plugins_panel = PluginsPanel(self.base_path, self.theme, lang=self.lang)
-        al.register_panel('plugins', self.plugins_panel)
-        
-        # Settings panel
-        self.settings_panel = SettingsPanel(self.base_path, self.theme, lang=self.lang)
-        al.register_panel('settings', self.settings_panel)
-        
-        # Workspaces panel
-        self.workspaces_panel = WorkspacesPanel(self.base_path, self.tabs, self.theme, lang=self.lang)
-        al.register_panel('workspaces', self.workspaces_panel)
+        """Register factories of the content panels; each one is created on its first show"""
+        al.register_panel_factory('tools', lambda: ToolsPanel(self.base_path, self.theme, lang=self.lang))
+        al.register_panel_factory('plugins', lambda: PluginsPanel(self.base_path, self.theme, lang=self.lang))
+        al.register_panel_factory('settings', lambda: SettingsPanel(self.base_path, self.theme, lang=self.lang))
+        al.register_panel_factory(
+            'workspaces',
+            lambda: WorkspacesPanel(self.base_path, self.tabs, self.theme, lang=self.lang)
+        )
+    
+    def start_panel_disposal(self):
+        """Dispose hidden panels unused for "aside_panel_dispose_after" seconds (0 - never)"""
+        dispose_after = helpers.get_json_property(
+            os.path.join(self.base_path, "config", "config.json"),
+            "aside_panel_dispose_after"
+        ) or 0
+        if dispose_after <= 0:
+            return
+        self.dispose_timer = QTimer(self)
+        self.dispose_timer.timeout.connect(lambda: al.dispose_idle_panels(dispose_after))
+        self.dispose_timer.start(int(min(dispose_after, 60) * 1000))
     
     def setup_ui(self):
         """
@@ -81,6 +88,7 @@ States:
 - Default: widget1 visible, widget2 hidden
 - When btn_a is clicked: widget2 appears/disappears
         """
+        self.setObjectName("aside")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -95,32 +103,32 @@ States:
         self.widget1.setFixedWidth(50)
 
         self.btn_toggle = QPushButton(">>")
-        self.btn_toggle.setToolTip(self.lang["Aside panel"])
+        localization.bind(self.btn_toggle.setToolTip, "Aside panel")
         self.btn_toggle.clicked.connect(al.aside_state)
         self.btn_toggle.setProperty("class", "main")
 
         self.btn_workspaces = QPushButton("🗂") # TODO: replace emoji with img
-        self.btn_workspaces.setToolTip(self.lang["Workspaces"])
+        localization.bind(self.btn_workspaces.setToolTip, "Workspaces")
         self.btn_workspaces.clicked.connect(al.btn_workspaces_clicked)
         self.btn_workspaces.setProperty("class", "main")
 
         self.btn_tools = QPushButton("🛠") # TODO: replace emoji with img
-        self.btn_tools.setToolTip(self.lang["Tools"])
+        localization.bind(self.btn_tools.setToolTip, "Tools")
         self.btn_tools.clicked.connect(al.btn_tools_clicked)
         self.btn_tools.setProperty("class", "main")
 
         self.btn_plugins = QPushButton("🧩") # TODO: replace emoji with img
-        self.btn_plugins.setToolTip(self.lang["Plugins"])
+        localization.bind(self.btn_plugins.setToolTip, "Plugins")
         self.btn_plugins.clicked.connect(al.btn_plugins_clicked)
         self.btn_plugins.setProperty("class", "main")
 
         self.btn_settings = QPushButton("⚙") # TODO: replace emoji with img
-        self.btn_settings.setToolTip(self.lang["Settings"])
+        localization.bind(self.btn_settings.setToolTip, "Settings")
         self.btn_settings.clicked.connect(al.btn_settings_clicked)
         self.btn_settings.setProperty("class", "main")
 
         self.btn_ExtraPanels = QPushButton("📋") # TODO: replace emoji with img
-        self.btn_ExtraPanels.setToolTip(self.lang["View extra panels"])
+        localization.bind(self.btn_ExtraPanels.setToolTip, "View extra panels")
         self.btn_ExtraPanels.clicked.connect(al.btn_ExtraPanels_clicked)
         self.btn_ExtraPanels.setProperty("class", "secondary")
         
@@ -141,18 +149,7 @@ States:
         self.widget2_layout.setAlignment(Qt.AlignTop)
         self.widget2_layout.setContentsMargins(0, 0, 0, 0)
         self.widget2_layout.setSpacing(0)
-        
-        self.widget2_layout.addWidget(self.workspaces_panel)
-        self.widget2_layout.addWidget(self.tools_panel)
-        self.widget2_layout.addWidget(self.plugins_panel)
-        self.widget2_layout.addWidget(self.settings_panel)
-        # self.widget2_layout.addWidget(self.ExtraPanels_panel)
-        
-        self.workspaces_panel.hide()
-        self.tools_panel.hide()
-        self.plugins_panel.hide()
-        self.settings_panel.hide()
-        # self.ExtraPanels_panel.hide()
+        # Panels are added to widget2_layout by al.get_panel() on first show
         
         # add_widgets_to_main_layout 
         content_layout.addWidget(self.widget1)
@@ -163,8 +160,8 @@ States:
 
     def apply_theme(self):
         """
-        Applies color theme to UI elements using CSS styling.
-        Updates main widget and button styles with theme colors.
+        Reads the theme colors.
+        Widget styles come from the application stylesheet (utils.theme_engine).
         """
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
@@ -177,56 +174,3 @@ States:
 
         # Refresh UI
         self.update()
-        
-        # Apply main widget styling
-        self.setStyleSheet(f"""
-                background-color: {self.bg_card}; 
-                color: {self.text_main};
-            """)
-    
-    # Apply button styling to content frame
-        self.content_frame.setStyleSheet(f"""
-            QPushButton[class="main"]{{
-                background-color: {self.btn_bg_color};
-                color: {self.text_main};
-                border: 1px solid {self.accent_color};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            
-            QPushButton[class="main"]:hover {{
-                background-color: {self.accent_gray};
-                border: 1px solid {self.accent_primary};
-            }}
-            
-            QPushButton[class="main"]:pressed {{
-                background-color: {self.accent_primary};
-                color: {self.accent_color}
-            }}
-            QPushButton[class="active_main"] {{
-                background-color: {self.accent_primary};
-                color: {self.accent_color}
-            }}
-            QPushButton[class="secondary"]{{
-                background-color: {self.btn_bg_color};
-                color: {self.text_main};
-                border: 1px solid {self.accent_color};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QPushButton[class="secondary"]:hover{{
-                background-color: {self.accent_gray};
-                border: 1px solid {self.accent_primary};
-            }}
-            QPushButton[class="secondary"]:pressed{{
-                background-color: {self.accent_primary};
-                color: {self.accent_color}
-            }}
-            QToolTip {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 3px;
-            }}
-            """)
\ No newline at end of file
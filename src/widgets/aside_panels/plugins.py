@@ -3,6 +3,7 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 import os
 import utils.helpers as helpers
+import utils.localization as localization
 
 class PluginsPanel(QWidget):
     def __init__(self, base_path, theme, lang=None):
@@ -27,7 +28,8 @@ class PluginsPanel(QWidget):
         self.layout.addStretch()
 
     def load_plugins(self):
-        name_property = QLabel(self.lang["Plugins"])
+        name_property = QLabel()
+        localization.bind(name_property.setText, "Plugins")
         self.layout.addWidget(name_property)
         self.plugins_widgets["name_property"] = name_property
 
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
+import utils.localization as localization
 # from PySide6.QtGui import QFont
 # from PySide6.QtCore import Qt
 # import os
@@ -20,7 +21,8 @@ class SettingsPanel(QWidget):
         self.layout.setSpacing(0)
         self.setLayout(self.layout)
         
-        name_property = QLabel(self.lang["Settings"])
+        name_property = QLabel()
+        localization.bind(name_property.setText, "Settings")
         self.layout.addWidget(name_property)
         self.settings_widgets["name_property"] = name_property
 
@@ -3,6 +3,7 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 import os
 import utils.helpers as helpers
+import utils.localization as localization
 import services.logger as log
 
 class ToolsPanel(QWidget):
@@ -16,32 +17,35 @@ class ToolsPanel(QWidget):
         self.apply_theme()
 
     def setup_ui(self):
+        self.setObjectName("ToolsPanel")
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
         self.setLayout(self.layout)
         self.font = QFont("Segoe UI", 10) # TODO: current font
         
-        name_property = QLabel(self.lang["Tools"])
+        name_property = QLabel()
+        localization.bind(name_property.setText, "Tools")
         self.layout.addWidget(name_property)
         self.tools_widgets["name_property"] = name_property
 
-        self.add_btn(self.lang["Search emails"], self.lang["Search emails Tooltip"])
-        self.add_btn(self.lang["Extract URLs"], self.lang["Extract URLs Tooltip"])
-        self.add_btn(self.lang["Find Phone Numbers"], self.lang["Find Phone Numbers Tooltip"])
+        self.add_btn("Search emails", "Search emails Tooltip")
+        self.add_btn("Extract URLs", "Extract URLs Tooltip")
+        self.add_btn("Find Phone Numbers", "Find Phone Numbers Tooltip")
         
         self.layout.addStretch()
 
     def add_btn(self, name, tooltip_text=None, connect=None):
+        """Adds a tool button; name and tooltip_text are language keys"""
         try:
-            btn = QPushButton(name)
+            btn = QPushButton()
+            localization.bind(btn.setText, name)
             btn.setFixedSize(246, 30)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setFont(self.font)
             btn.setProperty("class", "tool")
             if isinstance(tooltip_text, str) and tooltip_text.strip():
-                btn.setToolTip(tooltip_text)
-            btn.setStyleSheet("margin: 2px; padding: 0px;")
+                localization.bind(btn.setToolTip, tooltip_text)
             # btn.clicked.connect(connect)
             self.layout.addWidget(btn)
             self.tools_widgets[name] = btn
@@ -76,8 +80,8 @@ class ToolsPanel(QWidget):
     
     def apply_theme(self):
         """
-        Applies color theme to UI elements using CSS styling.
-        Updates main widget and button styles with theme colors.
+        Reads the theme colors.
+        Widget styles come from the application stylesheet (utils.theme_engine).
         """
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
@@ -92,34 +96,3 @@ class ToolsPanel(QWidget):
 
         # Refresh UI
         self.update()
-
-        self.setStyleSheet(f"""
-            QPushButton[class="tool"]{{
-                background-color: {self.btn_bg_color};
-                color: {self.text_main};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            
-            QPushButton[class="tool"]:hover {{
-                background-color: {self.accent_gray};
-                color: {self.text_main};
-            }}
-            
-            QPushButton[class="tool"]:pressed {{
-                background-color: {self.accent_gray};
-                color: {self.text_main};
-            }}
-            QPushButton[class="active_tool"] {{
-                background-color: {self.bg_card};
-                border: 1px solid {self.accent_light};
-                color: {self.text_main};
-            }}
-            QToolTip {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 3px;
-            }}
-            """)
\ No newline at end of file
@@ -3,6 +3,10 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 import os
 import utils.helpers as helpers
+import utils.localization as localization
+import services.tracing as tracing
+from utils.config_bus import bus
+from utils.config_store import store
 
 class WorkspacesPanel(QWidget):
     def __init__(self, base_path, tabs_manager, theme, lang=None):
@@ -13,11 +17,18 @@ class WorkspacesPanel(QWidget):
         self.lang = lang
         self.workspaces_widgets = {}
         self.workspaces_path = os.path.join(self.base_path, "config", "workspaces")
-        self.workspaces = helpers.get_files_from_directory(self.workspaces_path, 'json')
+        # Database namespaces workspaces/* (the legacy JSON files are not read)
+        self.workspaces = store.documents(self.workspaces_path)
         self.setup_ui()
         self.apply_theme()
+        bus().subscribe(
+            os.path.join(self.base_path, "config", "config.json"),
+            self.on_current_workspace_changed,
+            key="current_workspaces"
+        )
 
     def setup_ui(self):
+        self.setObjectName("WorkspacesPanel")
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
@@ -29,24 +40,25 @@ class WorkspacesPanel(QWidget):
         """Loading workspaces"""
         font = QFont("Segoe UI", 10) # TODO: current font
 
-        name_property = QLabel(self.lang["Workspaces"])
+        name_property = QLabel()
+        localization.bind(name_property.setText, "Workspaces")
         self.layout.addWidget(name_property)
         self.workspaces_widgets["name_property"] = name_property
 
+        current_workspace = helpers.get_json_property(
+            os.path.join(self.base_path, "config", "config.json"), 
+            "current_workspaces"
+        )
+
         for name in self.workspaces:
             btn = QPushButton(name)
             btn.setFixedSize(200, 30)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setFont(font)
             btn.setToolTip(f'{self.workspaces[name]}')
-            btn.setStyleSheet("margin: 2px; padding: 0px;")
             btn.clicked.connect(lambda checked, n=name: self.on_workspaces_clicked(self.workspaces[n], n))
             
             # set button style
-            current_workspace = helpers.get_json_property(
-                os.path.join(self.base_path, "config", "config.json"), 
-                "current_workspaces"
-            )
             if name == current_workspace:
                 btn.setProperty("class", "active_workspaces")
             else:
@@ -57,23 +69,25 @@ class WorkspacesPanel(QWidget):
         
         self.layout.addStretch()
 
+    @tracing.traced(category="ui")
     def on_workspaces_clicked(self, path, name_btn):
         """Workspace click handler"""
         current_workspaces = helpers.get_json_property(
             os.path.join(self.base_path, "config", "config.json"), 
             "current_workspaces"
         )
-        value = (path.split('\\')[-1])[:-5]
+        value = name_btn
         
         if current_workspaces == value: 
             return
             
-        if os.access(path, os.R_OK):
+        if store.exists(path):
             # Save config
-            helpers.replace_json_content(
-                os.path.join(self.base_path, "config", "tabs_config.json"),
-                os.path.join(self.base_path, "config", "workspaces", current_workspaces + '.json')
-            )
+            if isinstance(current_workspaces, str) and current_workspaces:
+                helpers.replace_json_content(
+                    os.path.join(self.base_path, "config", "tabs_config.json"),
+                    os.path.join(self.workspaces_path, current_workspaces + '.json')
+                )
             
             # Reload сurrent workspace
             helpers.add_json_property(
@@ -84,17 +98,22 @@ class WorkspacesPanel(QWidget):
 
             # Load new config
             helpers.replace_json_content(
-                os.path.join(self.base_path, "config", "workspaces", value + '.json'),
+                path,
                 os.path.join(self.base_path, "config", "tabs_config.json")
             )
             
-            # Reload tabs
-            if self.tabs:
-                self.tabs.reload_tabs()
+            # Tabs and the active button are updated through the config bus
 
-            # Reload panel
-            self.reload_workspaces()
+    def on_current_workspace_changed(self, key, current_workspace):
+        """Restyles only the workspace buttons, without rebuilding the panel"""
+        for name, widget in self.workspaces_widgets.items():
+            if name == "name_property":
+                continue
+            widget.setProperty("class", "active_workspaces" if name == current_workspace else "workspaces")
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
+    @tracing.traced(category="ui")
     def reload_workspaces(self):
         """Reload panel workspaces"""
         # Delite all widgets
@@ -109,6 +128,7 @@ class WorkspacesPanel(QWidget):
                 child.widget().deleteLater()
         
         # Reload
+        self.workspaces = store.documents(self.workspaces_path)
         self.load_workspaces()
 
     def show_panel(self):
@@ -117,14 +137,18 @@ class WorkspacesPanel(QWidget):
     def hide_panel(self):
         self.hide()
 
+    def dispose(self):
+        """Releases the config bus subscription before the panel is deleted (see aside_manager.dispose_idle_panels)"""
+        bus().unsubscribe(os.path.join(self.base_path, "config", "config.json"), self.on_current_workspace_changed)
+
     def toggle_panel(self):
         """Toggle panel visibility"""
         self.setVisible(not self.isVisible())
     
     def apply_theme(self):
         """
-        Applies color theme to UI elements using CSS styling.
-        Updates main widget and button styles with theme colors.
+        Reads the theme colors.
+        Widget styles come from the application stylesheet (utils.theme_engine).
         """
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
@@ -140,40 +164,3 @@ class WorkspacesPanel(QWidget):
 
         # Refresh UI
         self.update()
-        
-        # Apply main widget styling
-        self.setStyleSheet(f"""
-                background-color: {self.bg_card}; 
-                color: {self.text_main};
-            """)
-    
-        # Apply button styling to content frame
-        self.setStyleSheet(f"""
-            QPushButton[class="workspaces"]{{
-                background-color: {self.btn_bg_color};
-                color: {self.text_muted};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            
-            QPushButton[class="workspaces"]:hover {{
-                color: {self.text_muted};
-            }}
-            
-            QPushButton[class="workspaces"]:pressed {{
-                background-color: {self.accent_gray};
-                color: {self.text_muted};
-            }}
-            QPushButton[class="active_workspaces"] {{
-                background-color: {self.bg_card};
-                border: 1px solid {self.accent_light};
-                color: {self.text_main};
-            }}
-            QToolTip {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 3px;
-            }}
-            """)
\ No newline at end of file
@@ -5,18 +5,33 @@ Manages:
 - Logs panel (system and application logging)
 - Statistics panel (real-time system metrics)
 - Info panel (document metadata and statistics)
+- Timings panel (aggregated function timings)
+- Memory panel (tracemalloc snapshots and widget counts)
 - Dynamic tab switching based on configuration
+
+Tabs are created on first activation: until then each tab is an empty
+placeholder, so neither app.log nor pyqtgraph is loaded at startup.
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel, QTabWidget
 from PySide6.QtCore import Signal, Qt
+import importlib
 import os
-import json
 import services.logger as log
 import utils.helpers as helpers
-import widgets.extra_panels.extra_tabs.logs as lp
-import widgets.extra_panels.extra_tabs.stat as sp
-import widgets.extra_panels.extra_tabs.info as ip
+import utils.localization as localization
+from utils.config_store import store, REMOVED
+from utils.config_bus import bus
+import services.tracing as tracing
+
+# (config key, language key, module, class) in tab order; modules are imported on first activation
+TABS = [
+    ("logs", "Logs", "widgets.extra_panels.extra_tabs.logs", "LogsPanel"),
+    ("stats", "Stats", "widgets.extra_panels.extra_tabs.stat", "StatPanel"),
+    ("info", "Info", "widgets.extra_panels.extra_tabs.info", "InfoPanel"),
+    ("timings", "Timings", "widgets.extra_panels.extra_tabs.timings", "TimingsPanel"),
+    ("memory", "Memory", "widgets.extra_panels.extra_tabs.memory", "MemoryPanel"),
+]
 
 
 class ExtraPanel(QFrame):
@@ -26,7 +41,8 @@ class ExtraPanel(QFrame):
     Attributes:
         metrics_updated (Signal[dict]): Forwards system metrics to statistics panel
         reload_requested (Signal): Triggers UI refresh from external components
-        stat_panel (StatPanel): Reference to statistics panel for metric forwarding
+        stat_panel (StatPanel): Statistics panel for metric forwarding (None until first shown)
+        panels (dict): Created tab panels by config key
     """
     
     metrics_updated = Signal(dict)
@@ -62,7 +78,10 @@ class ExtraPanel(QFrame):
         
         # Metrics forwarding setup
         self.metrics_updated.connect(self._forward_metrics)
-        self.stat_panel = None  # Will be set in setup_ui
+        self.stat_panel = None  # Created with the Stats tab
+        self._latest_metrics = None
+        self.panels = {}
+        self.placeholders = []
         
         # UI initialization
         self.setup_ui()
@@ -74,9 +93,30 @@ class ExtraPanel(QFrame):
         else:
             self.show()
         
+        bus().subscribe(self.extra_panels_config_path, self.on_config_changed)
+
         log.debug(
             msg=f'Currently active tab in extra panels is "{self.active_tab}"'
         )
+
+    def on_config_changed(self, key, value):
+        """
+        Apply one changed key of extra_panel.json.
+
+        "isOpen" only toggles visibility, a tab key only switches the
+        current tab; the panel is never rebuilt.
+        """
+        if value is REMOVED:
+            self.extra_panels_data.pop(key, None)
+        else:
+            self.extra_panels_data[key] = value
+
+        if key == "isOpen":
+            self.isOpen = bool(value) and value is not REMOVED
+            self.setVisible(self.isOpen)
+        elif value is True:
+            self.active_tab = key
+            self.set_initial_tab()
     
     def _forward_metrics(self, metrics):
         """
@@ -86,20 +126,20 @@ class ExtraPanel(QFrame):
             metrics (dict): System resource usage data from MetricsCollector
         
         Note:
-            If statistics panel is not loaded, metrics are logged at debug level.
+            Until the Stats tab is created only the latest sample is kept;
+            it carries the full history and is replayed on creation.
         """
+        self._latest_metrics = metrics
         if self.stat_panel and hasattr(self.stat_panel, 'update_metrics'):
             self.stat_panel.update_metrics(metrics)
-        else:
-            log.debug(msg="StatPanel not found or missing update_metrics method")
     
+    @tracing.traced(category="ui")
     def reload_widget(self):
         """
         Reload panel configuration and update UI state.
         
         Triggered by:
-            - Configuration file changes
-            - Manual refresh requests
+            - Manual refresh requests (config changes arrive via on_config_changed)
             - Theme/language updates
         """
         self.extra_panels_data = self.get_extra_panels_status()
@@ -123,8 +163,7 @@ class ExtraPanel(QFrame):
         Creates default configuration file if none exists.
         """
         try:
-            with open(self.extra_panels_config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = store.get(self.extra_panels_config_path)
         except FileNotFoundError:
             log.error(
                 f'Extra panels config not found, creating: "{self.extra_panels_config_path}"'
@@ -133,9 +172,8 @@ class ExtraPanel(QFrame):
                 "isOpen": False,
                 "logs": False
             }
-            with open(self.extra_panels_config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                log.warning(msg='File "extra_panels.json" successfully created')
+            store.write(self.extra_panels_config_path, data)
+            log.warning(msg='File "extra_panels.json" successfully created')
         except Exception:
             log.error('Failed to load extra panels configuration')
             return {"isOpen": False}
@@ -158,7 +196,7 @@ class ExtraPanel(QFrame):
         Determine which tab should be active based on configuration.
         
         Returns:
-            str: Tab identifier ('logs', 'stats', 'info', or 'log' as default)
+            str: Tab identifier ('logs', 'stats', 'info', 'timings', 'memory', or 'log' as default)
         """
         for tab_name in self.extra_panels_data:
             if tab_name == "isOpen":
@@ -167,15 +205,22 @@ class ExtraPanel(QFrame):
                 return tab_name
         return 'log'  # Default tab
     
+    @tracing.traced(category="startup")
     def setup_ui(self):
         """
         Construct the tabbed panel interface.
         
-        Creates three panels:
+        Adds a placeholder for each of the five panels (see TABS):
             1. LogsPanel: Application and system log viewer
             2. StatPanel: Real-time system metrics visualization
             3. InfoPanel: Document metadata and statistics
+            4. TimingsPanel: Aggregated function timings
+            5. MemoryPanel: tracemalloc snapshots and widget counts
+
+        A panel is created when its tab is first shown (ensure_tab).
         """
+        self.setObjectName("ExtraPanel")
+        
         # Main container layout
         self.panel_container_layout = QVBoxLayout(self)
         self.panel_container_layout.setContentsMargins(0, 0, 0, 0)
@@ -190,22 +235,54 @@ class ExtraPanel(QFrame):
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.North)
         
-        # Create individual panels
-        self.logs_tab = lp.LogsPanel(self.base_path, self.theme, lang=self.lang)
-        self.stats_tab = sp.StatPanel(self.base_path, self.theme, lang=self.lang)
-        self.info_tab = ip.InfoPanel(self.base_path, self.theme, lang=self.lang)
-        
-        # Store reference for metrics forwarding
-        self.stat_panel = self.stats_tab
-        
-        # Add tabs with localized names
-        self.tab_widget.addTab(self.logs_tab, f"{self.lang['Logs']}")
-        self.tab_widget.addTab(self.stats_tab, f"{self.lang['Stats']}")
-        self.tab_widget.addTab(self.info_tab, f"{self.lang['Info']}")
+        # Placeholders with localized names
+        for index, (key, lang_key, _, _) in enumerate(TABS):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.placeholders.append(placeholder)
+            self.tab_widget.addTab(placeholder, "")
+            localization.bind(lambda text, i=index: self.tab_widget.setTabText(i, text), lang_key)
         
         # Assemble UI
         self.panel_container_layout.addWidget(self.tab_widget)
         self.set_initial_tab()
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
+    
+    def _on_current_tab_changed(self, index):
+        if self.isVisible():
+            self.ensure_tab(index)
+    
+    def showEvent(self, event):
+        """Create the current tab the first time the panel becomes visible."""
+        super().showEvent(event)
+        self.ensure_tab(self.tab_widget.currentIndex())
+    
+    @tracing.traced(category="ui")
+    def ensure_tab(self, index):
+        """
+        Create the panel of tab index inside its placeholder (once).
+        
+        Returns:
+            QWidget: The panel, or None for an invalid index
+        """
+        if not 0 <= index < len(TABS):
+            return None
+        key, _, module_name, class_name = TABS[index]
+        if key in self.panels:
+            return self.panels[key]
+        
+        panel_class = getattr(importlib.import_module(module_name), class_name)
+        panel = panel_class(self.base_path, self.theme, lang=self.lang)
+        self.placeholders[index].layout().addWidget(panel)
+        self.panels[key] = panel
+        log.debug(msg=f'Extra panel tab "{key}" created')
+        
+        if key == "stats":
+            self.stat_panel = panel
+            if self._latest_metrics is not None:
+                panel.update_metrics(self._latest_metrics)
+        return panel
     
     def set_initial_tab(self):
         """
@@ -222,10 +299,17 @@ class ExtraPanel(QFrame):
         elif self.active_tab == "info":
             self.tab_widget.setCurrentIndex(2)
             log.debug(msg='Info panel open in extra panels')
+        elif self.active_tab == "timings":
+            self.tab_widget.setCurrentIndex(3)
+            log.debug(msg='Timings panel open in extra panels')
+        elif self.active_tab == "memory":
+            self.tab_widget.setCurrentIndex(4)
+            log.debug(msg='Memory panel open in extra panels')
     
     def apply_theme(self):
         """
-        Apply color theme using CSS stylesheets.
+        Read the theme colors; styles come from the application
+        stylesheet (utils.theme_engine).
         
         Colors extracted from theme dictionary:
             - bg_card: Panel background
@@ -245,40 +329,6 @@ class ExtraPanel(QFrame):
         
         # Refresh UI
         self.update()
-
-        # Apply CSS styles
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.bg_card};
-                border: 1px solid {self.accent_gray};
-                border-width: 0px 0px 0px 1px;
-            }}
-            
-            /* Tab widget styling - only the tab bar */
-            QTabWidget::pane {{
-                border: none;
-                background: transparent;
-            }}
-            
-            QTabBar::tab {{
-                background-color: {self.btn_bg_color};
-                color: {self.text_muted};
-                padding: 2px 12px;
-                margin-right: 2px;
-                border-radius: 4px;
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: {self.accent_color};
-                color: white;
-                font-weight: bold;
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: {self.accent_light};
-                color: {self.bg_card};
-            }}
-        """)
     
     def close(self):
         """Hide the extra panels (soft close preserving state)."""
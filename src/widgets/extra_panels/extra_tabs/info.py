@@ -31,6 +31,7 @@ class InfoPanel(QWidget):
 
     def setup_ui(self):
         """Setup user interface"""
+        self.setObjectName("InfoPanel")
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
@@ -47,7 +48,7 @@ class InfoPanel(QWidget):
         self.hide()
     
     def apply_theme(self):
-        """Apply color theme to UI elements using CSS styling."""
+        """Read the theme colors; styles come from the application stylesheet (utils.theme_engine)."""
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
         self.bg_color = self.theme.get('bg_color')
@@ -59,12 +60,5 @@ class InfoPanel(QWidget):
         self.accent_gray = self.theme.get('accent_gray')
         self.text_muted = self.theme.get('text_muted')
 
-        # Apply comprehensive styling
-        self.setStyleSheet(f"""
-            QLabel {{
-                color: #fff;
-            }}
-        """)
-        
         # Force UI refresh
         self.update()
\ No newline at end of file
@@ -1,9 +1,10 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QTextEdit, QCheckBox
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QTextCursor  
-import json
 import services.logger as log
 import utils.helpers as helpers
+import utils.localization as localization
+from utils.config_store import store
 import os
 
 class LogsPanel(QWidget):
@@ -29,6 +30,7 @@ class LogsPanel(QWidget):
         self.path_logs = log.get_log_path()  # Path for logger service
         self.setup_ui()
         self.apply_theme()
+        localization.get_localization().add_listener(self.retranslate)
         
         # Timer for auto-refresh functionality
         self.refresh_timer = QTimer()
@@ -40,6 +42,7 @@ class LogsPanel(QWidget):
 
     def setup_ui(self):
         """Setup the user interface with filter controls and log display area."""
+        self.setObjectName("LogsPanel")
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
@@ -53,7 +56,8 @@ class LogsPanel(QWidget):
         self.filter_layout.setContentsMargins(5, 5, 5, 5)
         self.filter_layout.setSpacing(20)
 
-        self.filter_label = QLabel(self.lang["Filter levels"])
+        self.filter_label = QLabel()
+        localization.bind(self.filter_label.setText, "Filter levels")
         self.filter_layout.addWidget(self.filter_label)
 
         # Create severity level checkboxes
@@ -69,13 +73,16 @@ class LogsPanel(QWidget):
             checkbox.stateChanged.connect(self.on_filter_changed)
 
         # Filter control buttons
-        self.btn_select_all = QPushButton(self.lang["All"])
-        self.btn_select_none = QPushButton(self.lang["None"])
+        self.btn_select_all = QPushButton()
+        self.btn_select_none = QPushButton()
+        localization.bind(self.btn_select_all.setText, "All")
+        localization.bind(self.btn_select_none.setText, "None")
 
         # Auto-refresh toggle button
-        self.btn_auto_refresh = QPushButton(self.lang["Auto"])
+        self.btn_auto_refresh = QPushButton()
         self.btn_auto_refresh.setCheckable(True)
         self.btn_auto_refresh.setChecked(True)  # Enabled by default
+        self.retranslate()
         self.btn_auto_refresh.clicked.connect(self.toggle_auto_refresh)
 
         self.btn_select_all.clicked.connect(self.select_all_levels)
@@ -144,16 +151,19 @@ class LogsPanel(QWidget):
         except Exception as e:
             log.debug(msg=f"Error in initial_load: {str(e)}")
 
+    def retranslate(self):
+        """Texts depending on the auto-refresh state (also called after a language switch)"""
+        self.btn_auto_refresh.setText(self.lang["Auto"] if self.btn_auto_refresh.isChecked() else self.lang["Pause"])
+
     def toggle_auto_refresh(self):
         """Toggle auto-refresh functionality on/off."""
         if self.btn_auto_refresh.isChecked():
             log.debug(msg='"auto_refresh" active')
-            self.btn_auto_refresh.setText(self.lang["Auto"])
             self.refresh_timer.start(500)
         else:
             log.debug(msg='"auto_refresh" pause')
-            self.btn_auto_refresh.setText(self.lang["Pause"])
             self.refresh_timer.stop()
+        self.retranslate()
 
     def on_filter_changed(self):
         """Handler for filter checkbox changes - saves settings and reloads logs."""
@@ -175,13 +185,11 @@ class LogsPanel(QWidget):
         }
         
         try:
-            with open(log_config_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings = store.get(log_config_path)
         except FileNotFoundError:
             settings = default_settings
             # Save default settings if file doesn't exist
-            with open(log_config_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            store.write(log_config_path, settings)
         
         checkboxes = [self.debug_checkbox, self.info_checkbox, self.warning_checkbox, 
                     self.error_checkbox, self.critical_checkbox]
@@ -214,8 +222,7 @@ class LogsPanel(QWidget):
         config_path = os.path.join(self.base_path, "config", "log_filters.json")
         
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            store.write(config_path, settings)
         except Exception as e:
             print(f"Error saving filter settings: {e}")
 
@@ -394,7 +401,7 @@ class LogsPanel(QWidget):
         self.refresh_timer.stop()
     
     def apply_theme(self):
-        """Apply color theme to UI elements using CSS styling."""
+        """Read the theme colors; styles come from the application stylesheet (utils.theme_engine)."""
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
         self.bg_color = self.theme.get('bg_color')
@@ -406,105 +413,5 @@ class LogsPanel(QWidget):
         self.accent_gray = self.theme.get('accent_gray')
         self.text_muted = self.theme.get('text_muted')
 
-        # Apply comprehensive styling
-        self.setStyleSheet(f"""
-            QLabel {{
-                color: #fff;
-            }}
-            QTextEdit {{
-                background-color: #000;
-                border: 1px solid {self.accent_gray};
-                border-width: 1px 1px 0px 0px;
-                color: {self.text_main}
-            }}
-            
-            QCheckBox::indicator:checked {{
-                background-color: {self.accent_primary};
-                border: 1px solid {self.accent_gray};
-            }}
-            
-            QCheckBox::indicator:disabled {{
-                background-color: {self.accent_gray};
-                border: 1px solid {self.accent_gray};
-            }}
-            QCheckBox {{
-                color: {self.text_main}
-            }}
-            /* Custom scrollbar styling for dark theme */
-            QScrollBar:vertical {{
-                background-color: #1a1a1a;
-                width: 14px;
-                margin: 0px;
-                border-radius: 7px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {self.accent_gray};
-                min-height: 25px;
-                border-radius: 7px;
-                border: 2px solid #2a2a2a;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.accent_primary};
-            }}
-            
-            QScrollBar::handle:vertical:pressed {{
-                background-color: {self.accent_primary};
-            }}
-            
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {{
-                height: 0px;
-                border: none;
-                background: none;
-            }}
-            
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-            
-            QScrollBar:horizontal {{
-                background-color: #1a1a1a;
-                height: 14px;
-                margin: 0px;
-                border-radius: 7px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: {self.accent_gray};
-                min-width: 25px;
-                border-radius: 7px;
-                border: 2px solid #2a2a2a;
-            }}
-            
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {self.accent_primary};
-            }}
-            
-            QScrollBar::handle:horizontal:pressed {{
-                background-color: {self.accent_primary};
-            }}
-            
-            QScrollBar::add-line:horizontal,
-            QScrollBar::sub-line:horizontal {{
-                width: 0px;
-                border: none;
-                background: none;
-            }}
-            
-            QScrollBar::add-page:horizontal,
-            QScrollBar::sub-page:horizontal {{
-                background: transparent;
-            }}
-            QPushButton {{
-                background-color: {self.accent_gray};
-                border: 1px solid {self.accent_color};
-                color: {self.text_main};
-                padding: 3px 10px;
-            }}
-        """)
-        
         # Force UI refresh
         self.update()
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+On-demand memory inspector panel.
+
+Shows what is growing, not only how much:
+- tracemalloc top allocators and snapshot diffs (by line, file or traceback)
+- live Qt widget counts by class
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QPlainTextEdit, QLabel
+)
+import services.logger as log
+import utils.localization as localization
+import services.memory_inspector as mi
+
+
+class MemoryPanel(QWidget):
+    """
+    Memory inspector panel.
+
+    Features:
+    - Start/stop tracemalloc in a running session
+    - Snapshot with diff against the previous one (computed off the UI thread)
+    - Widget counts by class with growth since the previous count
+    """
+
+    def __init__(self, base_path, theme=None, lang=None):
+        """Initialize the memory panel with base path and theme settings."""
+        super().__init__()
+        self.base_path = base_path
+        self.theme = theme
+        self.lang = lang
+        self.previous_snapshot = None
+        self.previous_widget_counts = {}
+        self.worker = None
+        self.setup_ui()
+        self.apply_theme()
+        localization.get_localization().add_listener(self.retranslate)
+
+    def setup_ui(self):
+        """Setup control buttons and report areas."""
+        self.setObjectName("MemoryPanel")
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(0)
+        self.setLayout(self.layout)
+
+        controls = QWidget()
+        controls_layout = QHBoxLayout(controls)
+        controls_layout.setContentsMargins(5, 5, 5, 5)
+
+        self.btn_tracing = QPushButton()
+        self.btn_tracing.setCheckable(True)
+        self.btn_tracing.setChecked(mi.is_tracing())
+        self.btn_tracing.clicked.connect(self.toggle_tracing)
+
+        self.btn_snapshot = QPushButton()
+        localization.bind(self.btn_snapshot.setText, "Take snapshot")
+        self.btn_snapshot.setEnabled(mi.is_tracing())
+        self.btn_snapshot.clicked.connect(self.on_snapshot_clicked)
+
+        self.group_by = QComboBox()
+        self.group_by.addItems(["lineno", "filename", "traceback"])
+
+        self.btn_widgets = QPushButton()
+        localization.bind(self.btn_widgets.setText, "Count widgets")
+        self.btn_widgets.clicked.connect(self.on_count_widgets_clicked)
+
+        self.status_label = QLabel("")
+
+        controls_layout.addWidget(self.btn_tracing)
+        controls_layout.addWidget(self.btn_snapshot)
+        controls_layout.addWidget(self.group_by)
+        controls_layout.addWidget(self.btn_widgets)
+        controls_layout.addWidget(self.status_label)
+        controls_layout.addStretch()
+        self.layout.addWidget(controls)
+
+        self.retranslate()
+
+        self.report_area = QPlainTextEdit()
+        self.report_area.setReadOnly(True)
+        self.report_area.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.layout.addWidget(self.report_area)
+
+    def retranslate(self):
+        """Texts depending on the tracing state (also called after a language switch)"""
+        self.btn_tracing.setText(self.lang["Stop tracing"] if mi.is_tracing() else self.lang["Start tracing"])
+
+    def toggle_tracing(self):
+        if self.btn_tracing.isChecked():
+            mi.start_tracing()
+        else:
+            mi.stop_tracing()
+            self.previous_snapshot = None
+        self.retranslate()
+        self.btn_snapshot.setEnabled(mi.is_tracing())
+
+    def on_snapshot_clicked(self):
+        """Take snapshot on a worker thread, diff against the previous one."""
+        if self.worker is not None and self.worker.isRunning():
+            return
+        self.btn_snapshot.setEnabled(False)
+        self.status_label.setText("...")
+        self.worker = mi.SnapshotWorker(
+            previous=self.previous_snapshot,
+            key_type=self.group_by.currentText()
+        )
+        self.worker.report_ready.connect(self.on_report_ready)
+        self.worker.start()
+
+    def on_report_ready(self, report, snapshot):
+        if snapshot is not None:
+            self.previous_snapshot = snapshot
+        self.report_area.setPlainText(report)
+        self.status_label.setText("")
+        self.btn_snapshot.setEnabled(mi.is_tracing())
+        log.debug(msg="Memory snapshot report updated")
+
+    def on_count_widgets_clicked(self):
+        """Count live widgets by class and show growth since the previous count."""
+        counts = mi.count_widgets()
+        lines = [f"{'class':<32} {'count':>8} {'diff':>8}"]
+        for class_name, count in counts:
+            diff = count - self.previous_widget_counts.get(class_name, 0)
+            lines.append(f"{class_name:<32} {count:>8} {diff:>+8}")
+        self.previous_widget_counts = dict(counts)
+        self.report_area.setPlainText("\n".join(lines))
+
+    def show_panel(self):
+        self.show()
+
+    def hide_panel(self):
+        self.hide()
+
+    def apply_theme(self):
+        """Read the theme colors; styles come from the application stylesheet (utils.theme_engine)."""
+        # Extract theme colors
+        self.accent_color = self.theme.get('accent_color')
+        self.accent_primary = self.theme.get('accent_primary')
+        self.text_main = self.theme.get('text_main')
+        self.accent_gray = self.theme.get('accent_gray')
+
+        # Force UI refresh
+        self.update()
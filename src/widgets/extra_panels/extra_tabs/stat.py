@@ -6,11 +6,18 @@ Displays:
 - Memory consumption trends
 - Current resource utilization metrics
 - Process-specific statistics (handles, threads)
+- Per-thread CPU breakdown
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-import pyqtgraph as pg
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+from PySide6.QtCore import Qt
 import services.logger as log
+import services.startup as startup
+import utils.theme_engine as theme_engine
+
+with startup.phase("import pyqtgraph"):
+    import numpy as np
+    import pyqtgraph as pg
 
 
 class StatPanel(QWidget):
@@ -22,7 +29,8 @@ class StatPanel(QWidget):
     - Memory consumption visualization (RSS)
     - Real-time metrics display with configurable update interval
     - Theme-aware styling for light/dark modes
-    - Pausable monitoring when panel is hidden
+    - Pausable monitoring when panel is hidden (one catch-up redraw on show)
+    - Clip-to-view and automatic peak downsampling for long histories
     
     Note:
         Metrics are collected exclusively for the current application process
@@ -43,10 +51,14 @@ class StatPanel(QWidget):
         self.theme = theme
         self.lang = lang
         
+        # Latest metrics received while hidden, rendered on next show
+        self._latest_metrics = None
+        
         self._init_theme_properties()
         
         self.setup_ui()
         self.apply_theme()
+        theme_engine.get_engine().add_listener(self.apply_theme)
 
     def _init_theme_properties(self):
         """init theme properties for setup_ui."""
@@ -67,7 +79,9 @@ class StatPanel(QWidget):
             - CPU graph (pyqtgraph PlotWidget)
             - Memory graph (pyqtgraph PlotWidget)  
             - Current metrics labels
+            - Per-thread CPU table
         """
+        self.setObjectName("StatPanel")
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(5, 5, 5, 5)
         self.layout.setSpacing(10)
@@ -95,16 +109,26 @@ class StatPanel(QWidget):
         self.memory_label = QLabel("Memory: -- MB")
         self.threads_label = QLabel("Threads: --")
         self.handles_label = QLabel("Handles: --")
+        self.lag_label = QLabel("Event loop lag: -- ms")
         
         self.metrics_layout.addWidget(self.cpu_label)
         self.metrics_layout.addWidget(self.memory_label)
         self.metrics_layout.addWidget(self.threads_label)
         self.metrics_layout.addWidget(self.handles_label)
+        self.metrics_layout.addWidget(self.lag_label)
+        
+        # Per-thread CPU breakdown (name, native id, CPU %, total CPU time)
+        self.threads_table = QTableWidget(0, 4)
+        self.threads_table.setHorizontalHeaderLabels(["Thread", "ID", "CPU %", "CPU time s"])
+        self.threads_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.threads_table.verticalHeader().setVisible(False)
+        self.threads_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         
         # Assemble all components
         self.layout.addWidget(self.cpu_graph)
         self.layout.addWidget(self.memory_graph)
         self.layout.addLayout(self.metrics_layout)
+        self.layout.addWidget(self.threads_table)
     
     def _create_graph(self, title, y_label, y_range=None, color="#FFFFFF"):
         """
@@ -137,6 +161,10 @@ class StatPanel(QWidget):
         graph.getAxis('left').setTextPen(text_color)
         graph.getAxis('bottom').setTextPen(text_color)
         
+        # Draw only the visible range, reduce points to ~pixel count
+        graph.setClipToView(True)
+        graph.setDownsampling(auto=True, mode='peak')
+        
         # Create plot line
         pen = pg.mkPen(color=color, width=2)
         plot_line = graph.plot(pen=pen)
@@ -161,19 +189,39 @@ class StatPanel(QWidget):
                 - memory_history (list): Memory usage history in bytes
                 - threads (int): Number of active threads
                 - handles (int): Number of open handles/descriptors
+                - threads_cpu (list): Per-thread CPU usage for the last interval
+                - event_loop_lag_ms (float): Max UI event loop lag for the last interval
         
         Note:
             Memory history is converted from bytes to MB for display.
+            While the panel is hidden only the latest metrics are kept;
+            they are rendered once when the panel is shown again.
         """
+        self._latest_metrics = metrics
+        if not self.isVisible():
+            return
+        self._render_metrics(metrics)
+    
+    def showEvent(self, event):
+        """Catch up with a single redraw of the metrics skipped while hidden."""
+        super().showEvent(event)
+        if self._latest_metrics is not None:
+            self._render_metrics(self._latest_metrics)
+    
+    def _render_metrics(self, metrics):
+        """Push metrics to the plots and labels."""
         try:
             # Update CPU graph
+            # Values are always finite, so pyqtgraph's finite check is skipped
             if 'cpu_history' in metrics and metrics['cpu_history']:
-                self.cpu_plot_line.setData(metrics['cpu_history'])
+                cpu_history = np.asarray(metrics['cpu_history'], dtype=np.float64)
+                self.cpu_plot_line.setData(cpu_history, skipFiniteCheck=True)
             
             # Update memory graph (convert bytes to MB)
             if 'memory_history' in metrics and metrics['memory_history']:
-                memory_mb_history = [mb / 1024 / 1024 for mb in metrics['memory_history']]
-                self.memory_plot_line.setData(memory_mb_history)
+                memory_mb_history = np.asarray(metrics['memory_history'], dtype=np.float64)
+                memory_mb_history /= 1024 * 1024
+                self.memory_plot_line.setData(memory_mb_history, skipFiniteCheck=True)
             
             # Update current values
             if 'cpu' in metrics:
@@ -187,12 +235,38 @@ class StatPanel(QWidget):
             
             if 'handles' in metrics:
                 self.handles_label.setText(f"Handles: {metrics['handles']}")
+            
+            if 'event_loop_lag_ms' in metrics:
+                self.lag_label.setText(f"Event loop lag: {metrics['event_loop_lag_ms']:.1f} ms")
+            
+            if 'threads_cpu' in metrics:
+                self._update_threads_table(metrics['threads_cpu'])
                 
         except KeyError as e:
             log.error(f"Missing expected metric key: {e}")
         except Exception as e:
             log.error(f"Failed to update metrics display: {e}")
     
+    def _update_threads_table(self, threads_cpu):
+        """Fill the per-thread table, busiest threads first."""
+        self.threads_table.setUpdatesEnabled(False)
+        self.threads_table.setRowCount(len(threads_cpu))
+        
+        for row, thread in enumerate(threads_cpu):
+            values = [
+                thread['name'],
+                str(thread['id']),
+                f"{thread['cpu']:.1f}",
+                f"{thread['cpu_time']:.2f}"
+            ]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.threads_table.setItem(row, column, item)
+        
+        self.threads_table.setUpdatesEnabled(True)
+    
     def show_panel(self):
         """Make the statistics panel visible."""
         self.show()
@@ -205,10 +279,9 @@ class StatPanel(QWidget):
         """
         Apply theme colors to panel components.
         
-        Extracts colors from theme dictionary and applies them to:
-            - Graph backgrounds and text
-            - Label text colors
-            - Overall panel styling
+        Extracts colors from theme dictionary and applies them to the
+        graph backgrounds and text; labels and tables are styled by the
+        application stylesheet (utils.theme_engine).
         """
         if not self.theme:
             return
@@ -219,29 +292,15 @@ class StatPanel(QWidget):
         self.text_muted = self.theme.get('text_muted', '#AAAAAA')
         self.accent_gray = self.theme.get('accent_gray', '#555555')
         
-        # Apply CSS styling to labels
-        self.setStyleSheet(f"""
-            QLabel {{
-                color: {self.text_main};
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 11px;
-                padding: 2px;
-            }}
-        """)
-        
-        # Update graph colors if they exist
-        if hasattr(self, 'cpu_graph'):
-            self.cpu_graph.setBackground(self.bg_card)
-            self.cpu_graph.getAxis('left').setTextPen(self.text_main)
-            self.cpu_graph.getAxis('bottom').setTextPen(self.text_main)
-            
-            # Update grid color
-            self.cpu_graph.showGrid(x=True, y=True, alpha=0.3)
-        
-        if hasattr(self, 'memory_graph'):
-            self.memory_graph.setBackground(self.bg_card)
-            self.memory_graph.getAxis('left').setTextPen(self.text_main)
-            self.memory_graph.getAxis('bottom').setTextPen(self.text_main)
+        # Update graph colors if they exist (also on a live theme switch)
+        for name in ('cpu_graph', 'memory_graph'):
+            graph = getattr(self, name, None)
+            if graph is None:
+                continue
+            graph.setBackground(self.bg_card)
+            graph.setTitle(graph.getPlotItem().titleLabel.text, color=self.text_main)
+            graph.getAxis('left').setTextPen(self.text_main)
+            graph.getAxis('bottom').setTextPen(self.text_main)
         
         # Force UI update
         self.update()
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Live table of aggregated function timings.
+
+Displays per-function statistics collected by services.timings
+(count, total, min, max, p50, p95, p99) and refreshes them while visible.
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView
+)
+from PySide6.QtCore import Qt, QTimer
+import services.logger as log
+import services.timings as timings
+import utils.localization as localization
+
+
+class TimingsPanel(QWidget):
+    """
+    Panel with the function timings table.
+
+    Features:
+    - Table refresh once per second, only while the panel is visible
+    - On-demand dump of the summary to app.log
+    - Reset of collected statistics
+    """
+
+    # Localization keys of the column headers
+    COLUMNS = ["Function", "Count", "Total ms", "Min ms", "Max ms", "p50 ms", "p95 ms", "p99 ms"]
+
+    def __init__(self, base_path, theme=None, lang=None):
+        """Initialize the timings panel with base path and theme settings."""
+        super().__init__()
+        self.base_path = base_path
+        self.theme = theme
+        self.lang = lang
+        self.setup_ui()
+        self.apply_theme()
+        localization.get_localization().add_listener(self.retranslate)
+
+        # Refresh only while visible (see showEvent/hideEvent)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_table)
+
+    def setup_ui(self):
+        """Setup control buttons and the timings table."""
+        self.setObjectName("TimingsPanel")
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(0)
+        self.setLayout(self.layout)
+
+        controls = QWidget()
+        controls_layout = QHBoxLayout(controls)
+        controls_layout.setContentsMargins(5, 5, 5, 5)
+
+        self.btn_dump = QPushButton()
+        localization.bind(self.btn_dump.setText, "Dump to log")
+        self.btn_dump.clicked.connect(timings.dump_to_log)
+        self.btn_reset = QPushButton()
+        localization.bind(self.btn_reset.setText, "Reset")
+        self.btn_reset.clicked.connect(self.on_reset_clicked)
+
+        controls_layout.addWidget(self.btn_dump)
+        controls_layout.addWidget(self.btn_reset)
+        controls_layout.addStretch()
+        self.layout.addWidget(controls)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.retranslate()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.layout.addWidget(self.table)
+
+    def retranslate(self):
+        """Column headers (also called after a language switch)"""
+        self.table.setHorizontalHeaderLabels([self.lang[key] for key in self.COLUMNS])
+
+    def refresh_table(self):
+        """Fill the table with the current timings summary."""
+        summaries = timings.get_summary()
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(summaries))
+        keys = ["count", "total_ms", "min_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms"]
+
+        for row, summary in enumerate(summaries):
+            self.table.setItem(row, 0, QTableWidgetItem(summary["name"]))
+            for column, key in enumerate(keys, start=1):
+                value = summary[key]
+                text = str(value) if key == "count" else f"{value:.2f}"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        self.table.setUpdatesEnabled(True)
+
+    def on_reset_clicked(self):
+        timings.reset()
+        log.debug(msg="Function timings reset")
+        self.refresh_table()
+
+    def showEvent(self, event):
+        self.refresh_table()
+        self.refresh_timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def show_panel(self):
+        self.show()
+
+    def hide_panel(self):
+        self.hide()
+
+    def apply_theme(self):
+        """Read the theme colors; styles come from the application stylesheet (utils.theme_engine)."""
+        # Extract theme colors
+        self.bg_card = self.theme.get('bg_card')
+        self.accent_color = self.theme.get('accent_color')
+        self.text_main = self.theme.get('text_main')
+        self.accent_gray = self.theme.get('accent_gray')
+
+        # Force UI refresh
+        self.update()
@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QSizePo
 from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QPainter, QColor, QPixmap
 import utils.helpers as helpers
+import utils.theme_engine as theme_engine
 class header(QWidget):
     def __init__(self, theme=None, parent=None):
         super().__init__(parent)
@@ -12,6 +13,7 @@ class header(QWidget):
         self.logo_img_path = os.path.join(helpers.get_project_root(), "resources", "icons", "png", "Yarn-32.png")
         self.setup_ui()
         self.apply_theme()
+        theme_engine.get_engine().add_listener(self.apply_theme)
     
     def eventFilter(self, obj, event):
         if event.type() == QEvent.MouseButtonPress:
@@ -90,6 +92,7 @@ class header(QWidget):
         self.installEventFilter(self)
         
         self.title_label = QLabel("Yarn")
+        self.title_label.setObjectName("header_title")
         self.title_label.setContentsMargins(5, 0, 5, 0)
         self.title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         
@@ -112,6 +115,7 @@ class header(QWidget):
         self.maximize_btn.setCursor(Qt.PointingHandCursor)
 
         self.close_btn = QPushButton("×")
+        self.close_btn.setObjectName("header_close")
         self.close_btn.setFixedSize(50, 25)
         self.close_btn.setCursor(Qt.PointingHandCursor)
         
@@ -121,8 +125,8 @@ class header(QWidget):
     
     def apply_theme(self):
         """
-        Applies color theme to UI elements using CSS styling.
-        Updates main widget and button styles with theme colors.
+        Reads the theme colors used for painting.
+        Widget styles come from the application stylesheet (utils.theme_engine).
         """
         # Extract theme colors
         self.bg_card = self.theme.get('bg_card')
@@ -136,52 +140,6 @@ class header(QWidget):
         # Refresh UI
         self.update()
 
-        self.title_label.setStyleSheet(f"""
-            color: {self.text_main};
-            font-weight: bold;
-            font-size: 12px;
-            background: transparent;
-        """)
-
-        self.minimize_btn.setStyleSheet(f"""
-            QPushButton {{
-                color: {self.text_main};
-                border: none;
-                border-radius: 3px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.btn_bg_color};
-            }}
-        """)
-        
-        self.maximize_btn.setStyleSheet(f"""
-            QPushButton {{
-                color: {self.text_main};
-                border: none;
-                border-radius: 3px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.btn_bg_color};
-            }}
-        """)
-
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{
-                color: {self.text_main};
-                border: none;
-                border-radius: 3px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #993232;
-            }}
-        """)
-
     def paintEvent(self, event):
         if self.bg_card:
             painter = QPainter(self)
@@ -0,0 +1,278 @@
+"""
+Custom-painted tab bar.
+
+One widget for all tabs of a TabModel (utils.tab_model): no widget, layout
+or button per tab. The bar keeps the x offset and width of every tab
+(prefix sums, updated from the changed row on), does hit-testing, hover,
+close buttons, tooltips and horizontal scrolling itself, and paints only
+the tabs inside the visible range (bisect on the offsets).
+
+Labels are elided to MAX_LABEL_WIDTH. A tab costs one text measurement
+until it is first painted; its label is then laid out once (QStaticText)
+and reused by every paint, so restoring hundreds of tabs stays cheap.
+The active tab of the model is outlined.
+"""
+
+from bisect import bisect_right
+from PySide6.QtWidgets import QWidget, QSizePolicy, QToolTip
+from PySide6.QtCore import Qt, Signal, QRect, QRectF, QPointF, QEvent
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics, QStaticText, QPen
+
+TAB_HEIGHT = 20
+TAB_SPACING = 10
+TAB_PADDING = 10
+CLOSE_SIZE = 14
+CLOSE_GAP = 6
+MAX_LABEL_WIDTH = 240
+SCROLLBAR_HEIGHT = 3
+
+
+class TabBar(QWidget):
+    """Painted tabs of a TabModel; emits tab_clicked / close_requested with the tab name"""
+
+    tab_clicked = Signal(str)
+    close_requested = Signal(str)
+
+    def __init__(self, model, theme, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.theme = theme
+        self.setObjectName("tab_bar")
+        self.setMouseTracking(True)
+        self.setFixedHeight(TAB_HEIGHT + SCROLLBAR_HEIGHT)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        self.tab_font = QFont("Monospace", 10)
+        self.tab_font.setWeight(QFont.DemiBold)
+        self.metrics = QFontMetrics(self.tab_font)
+
+        # Per tab, in model order
+        self._names = []
+        self._widths = []
+        self._offsets = []
+        # name -> [elided label, label width, QStaticText once painted]
+        self._labels = {}
+
+        self._scroll = 0
+        self._hover = None          # (index, on_close) under the mouse
+        self._pressed = None
+
+        self.apply_theme()
+        model.tab_inserted.connect(self.on_tab_inserted)
+        model.tab_removed.connect(self.on_tab_removed)
+        model.tab_moved.connect(self.on_tab_moved)
+        model.tab_changed.connect(self.on_tab_changed)
+        model.active_changed.connect(lambda name: self.update())
+        for index, name in enumerate(model.names()):
+            self.on_tab_inserted(index, name)
+
+    # Geometry
+
+    @property
+    def tabs_width(self):
+        """Width of all tabs including spacing"""
+        if not self._names:
+            return 0
+        return self._offsets[-1] + self._widths[-1]
+
+    def _label(self, name):
+        label = self._labels.get(name)
+        if label is None:
+            text = self.metrics.elidedText(name, Qt.ElideMiddle, MAX_LABEL_WIDTH)
+            label = self._labels[name] = [text, self.metrics.horizontalAdvance(text), None]
+        return label
+
+    def _static_text(self, name):
+        label = self._label(name)
+        if label[2] is None:
+            static_text = QStaticText(label[0])
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(font=self.tab_font)
+            label[2] = static_text
+        return label[2]
+
+    def _tab_width(self, name):
+        return TAB_PADDING + self._label(name)[1] + CLOSE_GAP + CLOSE_SIZE + TAB_PADDING // 2
+
+    def _relayout(self, start):
+        """Recomputes offsets from row start on"""
+        del self._offsets[start:]
+        x = self._offsets[-1] + self._widths[start - 1] + TAB_SPACING if start > 0 else 0
+        for width in self._widths[start:]:
+            self._offsets.append(x)
+            x += width + TAB_SPACING
+        self._set_scroll(self._scroll)
+        self.update()
+
+    def _max_scroll(self):
+        return max(0, self.tabs_width - self.width())
+
+    def _set_scroll(self, value):
+        value = max(0, min(int(value), self._max_scroll()))
+        if value != self._scroll:
+            self._scroll = value
+            self._hover = None
+            self.update()
+
+    def tab_rect(self, index):
+        """Tab rectangle in widget coordinates"""
+        return QRect(self._offsets[index] - self._scroll, 0, self._widths[index], TAB_HEIGHT)
+
+    def close_rect(self, index):
+        rect = self.tab_rect(index)
+        return QRect(rect.right() - TAB_PADDING // 2 - CLOSE_SIZE + 1,
+                     (TAB_HEIGHT - CLOSE_SIZE) // 2, CLOSE_SIZE, CLOSE_SIZE)
+
+    def hit_test(self, pos):
+        """(index, on_close) of the tab at pos, or None (spacing, empty area)"""
+        x = pos.x() + self._scroll
+        index = bisect_right(self._offsets, x) - 1
+        if index < 0 or x >= self._offsets[index] + self._widths[index] or pos.y() >= TAB_HEIGHT:
+            return None
+        return index, self.close_rect(index).contains(pos)
+
+    def ensure_visible(self, index):
+        left = self._offsets[index]
+        right = left + self._widths[index]
+        if left < self._scroll:
+            self._set_scroll(left)
+        elif right > self._scroll + self.width():
+            self._set_scroll(right - self.width())
+
+    # Model rows
+
+    def on_tab_inserted(self, index, name):
+        self._names.insert(index, name)
+        self._widths.insert(index, self._tab_width(name))
+        self._relayout(index)
+
+    def on_tab_removed(self, index, name):
+        del self._names[index]
+        del self._widths[index]
+        if name not in self._names:
+            self._labels.pop(name, None)
+        self._relayout(index)
+
+    def on_tab_moved(self, old_index, new_index):
+        self._names.insert(new_index, self._names.pop(old_index))
+        self._widths.insert(new_index, self._widths.pop(old_index))
+        self._relayout(min(old_index, new_index))
+
+    def on_tab_changed(self, index, name):
+        # Only the path (tooltip) changed
+        pass
+
+    # Theme
+
+    def apply_theme(self):
+        self.bg_color = QColor(self.theme.get('bg_color'))
+        self.tab_color = QColor(self.theme.get('btn_bg_color'))
+        self.tab_hover_color = QColor(self.theme.get('btn_hover_bg_color') or self.theme.get('btn_bg_color'))
+        self.text_color = QColor(self.theme.get('text_main'))
+        self.close_hover_color = QColor(self.theme.get('accent_primary'))
+        self.active_color = QColor(self.theme.get('accent_primary'))
+        self.scroll_color = QColor(self.theme.get('accent_color'))
+        self.update()
+
+    # Painting
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.bg_color)
+        if not self._names:
+            return
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.tab_font)
+
+        clip = event.rect()
+        first = max(0, bisect_right(self._offsets, clip.left() + self._scroll) - 1)
+        last = bisect_right(self._offsets, clip.right() + self._scroll)
+        text_y = (TAB_HEIGHT - self.metrics.height()) / 2
+
+        for index in range(first, last):
+            rect = self.tab_rect(index)
+            hovered = self._hover is not None and self._hover[0] == index
+            if hovered:
+                painter.setPen(QPen(QColor("#fff"), 1))
+            elif self._names[index] == self.model.active:
+                painter.setPen(QPen(self.active_color, 1))
+            else:
+                painter.setPen(Qt.NoPen)
+            painter.setBrush(self.tab_hover_color if hovered else self.tab_color)
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+
+            painter.setPen(self.text_color)
+            painter.drawStaticText(QPointF(rect.left() + TAB_PADDING, text_y), self._static_text(self._names[index]))
+
+            close = self.close_rect(index)
+            if hovered and self._hover[1]:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self.close_hover_color)
+                painter.drawRoundedRect(QRectF(close), 3, 3)
+            painter.setPen(QPen(self.text_color, 1.2))
+            cross = close.adjusted(4, 4, -4, -4)
+            painter.drawLine(cross.topLeft(), cross.bottomRight())
+            painter.drawLine(cross.topRight(), cross.bottomLeft())
+
+        # Scroll position indicator (replaces the scroll bar)
+        total = self.tabs_width
+        if total > self.width():
+            length = max(20, self.width() * self.width() // total)
+            x = (self.width() - length) * self._scroll // self._max_scroll()
+            painter.fillRect(QRect(x, self.height() - SCROLLBAR_HEIGHT, length, SCROLLBAR_HEIGHT), self.scroll_color)
+
+    # Input
+
+    def _set_hover(self, hover):
+        if hover == self._hover:
+            return
+        for old in (self._hover, hover):
+            if old is not None and old[0] < len(self._names):
+                self.update(self.tab_rect(old[0]))
+        self._hover = hover
+        self.setCursor(Qt.PointingHandCursor if hover is not None else Qt.ArrowCursor)
+
+    def mouseMoveEvent(self, event):
+        self._set_hover(self.hit_test(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        self._pressed = self.hit_test(event.position().toPoint()) if event.button() in (Qt.LeftButton, Qt.MiddleButton) else None
+        if self._pressed is None:
+            super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        pressed, self._pressed = self._pressed, None
+        hit = self.hit_test(event.position().toPoint())
+        if pressed is None or hit is None or hit[0] != pressed[0]:
+            super().mouseReleaseEvent(event)
+            return
+        name = self._names[hit[0]]
+        if event.button() == Qt.MiddleButton or (hit[1] and pressed[1]):
+            self.close_requested.emit(name)
+        elif event.button() == Qt.LeftButton:
+            self.tab_clicked.emit(name)
+
+    def wheelEvent(self, event):
+        # Vertical wheel scrolls the tabs horizontally
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        self._set_scroll(self._scroll - delta)
+        event.accept()
+
+    def resizeEvent(self, event):
+        self._set_scroll(self._scroll)
+        super().resizeEvent(event)
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            hit = self.hit_test(event.pos())
+            if hit is None:
+                QToolTip.hideText()
+            else:
+                QToolTip.showText(event.globalPos(), f'{self.model.path_of(self._names[hit[0]])}', self, self.tab_rect(hit[0]))
+            return True
+        return super().event(event)
@@ -1,31 +1,318 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel
-from PySide6.QtCore import Qt
-# from PySide6.QtGui import
+import os
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel, QPlainTextEdit, QPlainTextDocumentLayout, QMessageBox
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont, QTextCursor, QTextDocument
+import services.logger as log
+from services.file_loader import FileLoader
+import utils.helpers as helpers
+import utils.localization as localization
+from utils.config_store import REMOVED
+from utils.config_bus import bus
+import utils.document_cache as document_cache
 
 class textEditor(QWidget):
+    """
+    Editor area.
+
+    Files are streamed in by a background FileLoader into their own
+    QTextDocument; loaded documents stay in a DocumentCache (with undo stack,
+    cursor and scroll), so switching back to a recent tab is instant.
+    prefetch() loads a document into the cache without showing it.
+
+    Emits:
+        document_ready(str): path of the document now shown, fully loaded
+        prefetch_finished(str, bool): path, True if it was cached
+    """
+    document_ready = Signal(str)
+    prefetch_finished = Signal(str, bool)
+
     def __init__(self, parent=None, theme=None):
         super().__init__(parent)
         self.theme = theme
+        self.path = None
+        self.loader = None
+        self._loaders = set()
+        self._load_id = 0
+        # Shown document once loaded; _pending is the one being loaded
+        self.current = None
+        self._pending = None
+        # (load id, loader, state) of the document being prefetched
+        self._prefetch = None
+        self._prefetch_id = 0
+
+        config_path = os.path.join(helpers.get_project_root(), "config", "config.json")
+        self.cache = document_cache.DocumentCache(
+            helpers.get_json_property(config_path, document_cache.CONFIG_KEY) or document_cache.DEFAULT_BUDGET_MB,
+            on_evict=lambda buffer: buffer.deleteLater(),
+            is_modified=lambda buffer: buffer.isModified()
+        )
+        bus().subscribe(config_path, self.on_budget_config_changed, key=document_cache.CONFIG_KEY)
+
         self.setMouseTracking(True)
         self.setup_ui()
         self.apply_theme()
-    
+
     def setup_ui(self):
+        self.setObjectName("textEditor")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
-        
+
         self.content_frame = QFrame()
-        label = QLabel("textEditor")
+        self.status_label = QLabel("textEditor")
         content_layout = QVBoxLayout(self.content_frame)
         content_layout.setAlignment(Qt.AlignTop)
         content_layout.setSpacing(10)
         content_layout.setContentsMargins(10, 10, 10, 10)
 
-        content_layout.addWidget(label)
+        self.editor = QPlainTextEdit()
+        self.editor.setFont(QFont("Monospace", 10))
+        # Wrapping would lay out every line of a large file again on each resize
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Shown while no document is (e.g. after a cancelled or failed load); reused
+        self.placeholder = self.new_buffer()
+
+        content_layout.addWidget(self.status_label)
+        content_layout.addWidget(self.editor)
         main_layout.addWidget(self.content_frame)
 
+    def load_file(self, path):
+        """Shows path: from the cache when it is unchanged on disk, else streamed from the file"""
+        self.cancel_prefetch()
+        self.cancel_loading()
+        self.save_state()
+
+        state = self.cache.get(path)
+        if state is not None:
+            if not state.is_stale():
+                self.show_state(state)
+                return
+            if state.buffer.isModified():
+                log.warning(msg=f'"{path}" changed on disk, keeping the unsaved document')
+                self.show_state(state)
+                return
+            log.debug(msg=f'"{path}" changed on disk, reloading')
+        else:
+            # Evicted earlier: reload, then restore its cursor and scroll
+            state = self.cache.descriptor(path)
+        self.start_loading(path, previous=state)
+
+    def start_loading(self, path, previous=None):
+        """Streams path into a new document, cancelling a load still in progress"""
+        self.cancel_loading()
+        self._load_id += 1
+        self.path = path
+        self.current = None
+        self.cache.pin(None)
+
+        buffer = self.new_buffer()
+        buffer.setUndoRedoEnabled(False)
+        self.editor.setDocument(buffer)
+        self.editor.setReadOnly(True)
+        self.status_label.setText(f"{os.path.basename(path)} - {localization.get_localization().get_catalog()['Loading']}")
+
+        self._pending = document_cache.DocumentState(path, buffer, document_cache.file_stamp(path))
+        if previous is not None:
+            self._pending.cursor, self._pending.anchor = previous.cursor, previous.anchor
+            self._pending.scroll = previous.scroll
+
+        self.loader = self._start_loader(path, self._load_id)
+        self.loader.load_started.connect(self.on_load_started)
+        self.loader.chunk_loaded.connect(self.on_chunk_loaded)
+        self.loader.progress.connect(self.on_load_progress)
+        self.loader.load_finished.connect(self.on_load_finished)
+        self.loader.load_failed.connect(self.on_load_failed)
+        self.loader.start()
+
+    def _start_loader(self, path, load_id):
+        loader = FileLoader(path, load_id, self)
+        loader.finished.connect(lambda: self._on_loader_finished(loader))
+        self._loaders.add(loader)
+        return loader
+
+    def prefetch(self, path):
+        """
+        Loads path into the cache in the background without showing it.
+        Returns False if it is skipped: already cached or loading, another
+        prefetch running, unreadable, or larger than the free cache budget.
+        """
+        stamp = document_cache.file_stamp(path)
+        if (stamp is None or path in self.cache or path == self.path or self._prefetch is not None
+                or document_cache.estimate_memory(stamp[1], 0) > self.cache.free_memory()):
+            return False
+
+        self._prefetch_id += 1
+        buffer = self.new_buffer()
+        buffer.setUndoRedoEnabled(False)
+        state = document_cache.DocumentState(path, buffer, stamp)
+        previous = self.cache.descriptor(path)
+        if previous is not None:
+            state.cursor, state.anchor, state.scroll = previous.cursor, previous.anchor, previous.scroll
+
+        loader = self._start_loader(path, self._prefetch_id)
+        loader.load_started.connect(self.on_prefetch_started)
+        loader.chunk_loaded.connect(self.on_prefetch_chunk)
+        loader.load_finished.connect(self.on_prefetch_finished)
+        loader.load_failed.connect(self.on_prefetch_failed)
+        self._prefetch = (self._prefetch_id, loader, state)
+        loader.start()
+        return True
+
+    def cancel_prefetch(self):
+        if self._prefetch is not None:
+            _, loader, state = self._prefetch
+            self._prefetch = None
+            loader.requestInterruption()
+            state.buffer.deleteLater()
+
+    def new_buffer(self):
+        """Empty document usable by QPlainTextEdit"""
+        buffer = QTextDocument(self)
+        buffer.setDocumentLayout(QPlainTextDocumentLayout(buffer))
+        buffer.setDefaultFont(self.editor.font())
+        return buffer
+
+    def cancel_loading(self):
+        """The loader stops before its next chunk; its queued chunks are ignored by load id"""
+        if self.loader is not None:
+            self.loader.requestInterruption()
+            self.loader = None
+        if self._pending is not None:
+            # A partial document is never cached
+            if self.editor.document() is self._pending.buffer:
+                self.show_placeholder()
+            self._pending.buffer.deleteLater()
+            self._pending = None
+
+    def show_placeholder(self):
+        self.placeholder.clear()
+        self.editor.setDocument(self.placeholder)
+        self.editor.setReadOnly(False)
+
+    def save_state(self):
+        """Stores cursor, scroll and memory of the shown document in the cache"""
+        state = self.current
+        if state is None or not state.loaded:
+            return
+        cursor = self.editor.textCursor()
+        state.cursor, state.anchor = cursor.position(), cursor.anchor()
+        state.scroll = (self.editor.horizontalScrollBar().value(), self.editor.verticalScrollBar().value())
+        self.cache.update_memory(state.path, document_cache.estimate_memory(state.buffer.characterCount(), state.buffer.blockCount()))
+
+    def show_state(self, state):
+        """Shows a loaded document with its cursor and scroll position"""
+        self.current = state
+        self.path = state.path
+        self.cache.pin(state.path)
+        self.editor.setDocument(state.buffer)
+        self.editor.setReadOnly(False)
+
+        last = max(0, state.buffer.characterCount() - 1)
+        cursor = QTextCursor(state.buffer)
+        cursor.setPosition(min(state.anchor, last))
+        cursor.setPosition(min(state.cursor, last), QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.editor.horizontalScrollBar().setValue(state.scroll[0])
+        self.editor.verticalScrollBar().setValue(state.scroll[1])
+        self.status_label.setText(f"{state.path} ({state.encoding})")
+        self.document_ready.emit(state.path)
+
+    def on_budget_config_changed(self, key, value):
+        self.cache.set_budget(document_cache.DEFAULT_BUDGET_MB if value is REMOVED or not value else value)
+
+    def stop_loading(self):
+        """Cancels every loader and waits for their threads (application quit)"""
+        self.cancel_prefetch()
+        self.cancel_loading()
+        for loader in list(self._loaders):
+            loader.requestInterruption()
+            loader.wait()
+
+    def _on_loader_finished(self, loader):
+        self._loaders.discard(loader)
+        loader.deleteLater()
+
+    def on_load_started(self, load_id, encoding, size):
+        if load_id == self._load_id:
+            self._pending.encoding = encoding
+
+    def on_chunk_loaded(self, load_id, text):
+        if load_id != self._load_id:
+            return
+        cursor = QTextCursor(self._pending.buffer)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.loader.chunk_consumed()
+
+    def on_load_progress(self, load_id, loaded, size):
+        if load_id == self._load_id and size:
+            lang = localization.get_localization().get_catalog()
+            self.status_label.setText(f"{os.path.basename(self.path)} - {lang['Loading']} {loaded * 100 // size}%")
+
+    def on_load_finished(self, load_id):
+        if load_id != self._load_id:
+            return
+        state, self._pending = self._pending, None
+        self.loader = None
+        state.buffer.setUndoRedoEnabled(True)
+        state.buffer.setModified(False)
+        state.memory = document_cache.estimate_memory(state.buffer.characterCount(), state.buffer.blockCount())
+        self.cache.put(state)
+        self.show_state(state)
+
+    def on_load_failed(self, load_id, error):
+        if load_id != self._load_id:
+            return
+        self.loader = None
+        self.cancel_loading()
+        self.status_label.setText(self.path)
+        QMessageBox.critical(
+            self,
+            "Read Error",
+            f"Cannot read file: {self.path}\nError: {error}"
+        )
+
+    def _prefetch_state(self, load_id):
+        """State of the running prefetch if load_id is its id"""
+        if self._prefetch is not None and self._prefetch[0] == load_id:
+            return self._prefetch[2]
+        return None
+
+    def on_prefetch_started(self, load_id, encoding, size):
+        state = self._prefetch_state(load_id)
+        if state is not None:
+            state.encoding = encoding
+
+    def on_prefetch_chunk(self, load_id, text):
+        state = self._prefetch_state(load_id)
+        if state is None:
+            return
+        cursor = QTextCursor(state.buffer)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self._prefetch[1].chunk_consumed()
+
+    def on_prefetch_finished(self, load_id):
+        state = self._prefetch_state(load_id)
+        if state is None:
+            return
+        self._prefetch = None
+        state.buffer.setUndoRedoEnabled(True)
+        state.buffer.setModified(False)
+        state.memory = document_cache.estimate_memory(state.buffer.characterCount(), state.buffer.blockCount())
+        cached = self.cache.offer(state)
+        log.debug(msg=f'Prefetched "{state.path}"' + ("" if cached else " (over the cache budget, dropped)"))
+        self.prefetch_finished.emit(state.path, cached)
+
+    def on_prefetch_failed(self, load_id, error):
+        state = self._prefetch_state(load_id)
+        if state is None:
+            return
+        self.cancel_prefetch()
+        self.prefetch_finished.emit(state.path, False)
+
     def apply_theme(self):
+        """Reads the theme colors; styles come from the application stylesheet"""
         self.bg_card = self.theme.get('bg_card')
         self.bg_color = self.theme.get('bg_color')
         self.accent_color = self.theme.get('accent_color')
@@ -35,15 +322,3 @@ class textEditor(QWidget):
         self.accent_light = self.theme.get('accent_light')
         self.accent_gray = self.theme.get('accent_gray')
         self.text_muted = self.theme.get('text_muted')
-        
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.bg_card};
-                border: 1px solid {self.accent_gray};
-                border-width: 0 1px 1px 1px;
-                color: {self.text_main}
-            }}
-            QLabel {{
-                border: None
-            }}
-        """)
\ No newline at end of file
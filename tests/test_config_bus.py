@@ -0,0 +1,28 @@
+import os
+import sys
+import pytest
+
+pytest.importorskip("PySide6")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PySide6.QtCore import QCoreApplication
+from utils.config_store import REMOVED
+from utils.config_bus import ConfigBus
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_removed_key_is_delivered_as_sentinel(app, tmp_path):
+    path = str(tmp_path / "config.json")
+    received = []
+    bus = ConfigBus()
+    bus.subscribe(path, lambda key, value: received.append((key, value)))
+
+    bus.publish(path, {"theme": REMOVED, "tabs": {"a": "/a.txt"}})
+    app.processEvents()
+
+    assert dict(received)["theme"] is REMOVED
+    assert dict(received)["tabs"] == {"a": "/a.txt"}